@@ -0,0 +1,232 @@
+"""
+Threaded, paginated blog comments for /api/blog/comments/.
+
+Top-level comments are read a page at a time, oldest first, with a keyset
+cursor on (created_at, id); replies are not sent with them but loaded on demand
+per parent (?parent_id=), with the same cursor scheme. Every comment carries its
+reply_count (one blog_comment_reply_counts RPC per page, see
+migrations/blog_comments_threading.sql) and like_count. author_email is never
+returned.
+
+Each blog has a small state entry in the shared cache, {"latest": newest
+created_at, "total": comment count}. It keys the page cache and the ETag, so a
+client revalidating with If-None-Match gets a 304 without any upstream call,
+and note_created() (called by api_blog_comment_create) retires every cached
+page of that blog at once. A like changes like_count without changing that
+state, so each blog also has a likes version, bumped by toggle_like(), that the
+ETag and page keys include as well.
+
+Likes are toggled by the toggle_blog_comment_like RPC (one atomic call that
+returns the new state and count, see migrations/blog_comment_likes_toggle.sql).
+Which comments a visitor has liked is remembered per fingerprint in the cache,
+so a repeat likes check only asks Supabase about comments it has not seen yet.
+"""
+import base64
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import supabase_rest
+
+COLUMNS = "id,blog_id,parent_id,author_name,body,like_count,created_at,updated_at"
+ORDER = "created_at.asc,id.asc"
+
+
+def page_size():
+    return getattr(settings, "BLOG_COMMENTS_PAGE_SIZE", 20)
+
+
+def _ttl():
+    return getattr(settings, "BLOG_COMMENTS_CACHE_TTL", 30)
+
+
+def _likes_key(fingerprint):
+    return "blog_comments:likes:" + hashlib.md5(fingerprint.encode("utf-8")).hexdigest()
+
+
+def _state_key(blog_id):
+    return f"blog_comments:state:{blog_id}"
+
+
+def _likes_version_key(blog_id):
+    return f"blog_comments:likes_version:{blog_id}"
+
+
+def _likes_version(blog_id):
+    return cache.get(_likes_version_key(blog_id), 0)
+
+
+def encode_cursor(row):
+    raw = json.dumps([row.get("created_at"), row.get("id")], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """(created_at, id) from a cursor token, or None if it is missing or malformed."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        created_at, row_id = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not created_at or not row_id:
+        return None
+    return created_at, row_id
+
+
+def _quote(value):
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _get(table, params, prefer=None):
+    """Raw PostgREST read that raises on failure, so failed reads are never cached."""
+    headers = supabase_rest.read_headers()
+    if prefer:
+        headers = {**headers, "Prefer": prefer}
+    resp = supabase_rest.get(supabase_rest.rest_url(table), headers=headers, params=params)
+    if resp.status_code not in (200, 206):
+        raise RuntimeError(f"{table}: {resp.status_code} {resp.text[:200]}")
+    return resp
+
+
+def state(blog_id):
+    """{"latest": newest created_at or None, "total": comment count} for a blog, cached briefly."""
+    key = _state_key(blog_id)
+    current = cache.get(key)
+    if current is None:
+        resp = _get("blog_comments", {
+            "select": "created_at",
+            "blog_id": f"eq.{blog_id}",
+            "order": "created_at.desc",
+            "limit": 1,
+        }, prefer="count=exact")
+        rows = resp.json()
+        # The total comes with the same request, in Content-Range ("0-0/<total>")
+        try:
+            total = int(resp.headers.get("content-range", "0/0").split("/")[-1])
+        except ValueError:
+            total = len(rows)
+        current = {"latest": rows[0]["created_at"] if rows else None, "total": total}
+        cache.set(key, current, _ttl())
+    return current
+
+
+def etag(blog_id, parent_id="", cursor_token="", size=None):
+    current = state(blog_id)
+    likes = _likes_version(blog_id)
+    raw = f"{blog_id}|{current['latest']}|{current['total']}|{likes}|{parent_id}|{cursor_token}|{size or page_size()}"
+    return 'W/"' + hashlib.md5(raw.encode("utf-8")).hexdigest() + '"'
+
+
+def note_created(comment):
+    """Account for a new comment: the blog gets a new state, which retires its cached pages."""
+    blog_id = comment.get("blog_id")
+    if not blog_id:
+        return
+    key = _state_key(blog_id)
+    current = cache.get(key)
+    if current is None:
+        return
+    cache.set(key, {"latest": comment.get("created_at"), "total": current["total"] + 1}, _ttl())
+
+
+def _reply_counts(ids):
+    if not ids:
+        return {}
+    resp = supabase_rest.rpc("blog_comment_reply_counts", {"p_parent_ids": ids})
+    if resp.status_code == 200:
+        return {str(r["parent_id"]): int(r["reply_count"]) for r in resp.json()}
+    # Function not installed yet: count from the parent ids alone
+    counts = {}
+    for row in _get("blog_comments", {"select": "parent_id", "parent_id": f"in.({','.join(ids)})"}).json():
+        counts[str(row["parent_id"])] = counts.get(str(row["parent_id"]), 0) + 1
+    return counts
+
+
+def _serialize(comment):
+    for key in ("created_at", "updated_at"):
+        if comment.get(key) and isinstance(comment[key], str):
+            comment[key] = comment[key].replace("Z", "+00:00")[:19]
+    return comment
+
+
+def _load_page(blog_id, parent_id, cursor, size):
+    params = {"select": COLUMNS, "blog_id": f"eq.{blog_id}", "order": ORDER, "limit": size + 1}
+    params["parent_id"] = f"eq.{parent_id}" if parent_id else "is.null"
+    if cursor:
+        created_at, row_id = cursor
+        ts = _quote(created_at)
+        params["or"] = f"(created_at.gt.{ts},and(created_at.eq.{ts},id.gt.{_quote(row_id)}))"
+    rows = _get("blog_comments", params).json()
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = encode_cursor(rows[-1]) if has_more and rows else None
+    counts = _reply_counts([str(r["id"]) for r in rows])
+    for row in rows:
+        row["reply_count"] = counts.get(str(row["id"]), 0)
+        _serialize(row)
+    return {"comments": rows, "next_cursor": next_cursor}
+
+
+def fetch_page(blog_id, parent_id="", cursor_token=None, size=None):
+    """
+    One page of comments as {"comments": [...], "next_cursor": str|None, "total": int}.
+    Without parent_id these are top-level comments, otherwise the replies to parent_id.
+    """
+    size = size or page_size()
+    cursor = decode_cursor(cursor_token)
+    current = state(blog_id)
+    digest = hashlib.md5(f"{parent_id}|{cursor_token if cursor else ''}|{size}".encode("utf-8")).hexdigest()
+    likes = _likes_version(blog_id)
+    key = f"blog_comments:page:{blog_id}:{current['latest']}:{current['total']}:{likes}:{digest}"
+    page = cache.get(key)
+    if page is None:
+        page = _load_page(blog_id, parent_id, cursor, size)
+        page["total"] = current["total"]
+        cache.set(key, page, _ttl())
+    return page
+
+
+def toggle_like(comment_id, fingerprint):
+    """Like or unlike a comment for a visitor in one call. Returns (liked, like_count)."""
+    resp = supabase_rest.rpc("toggle_blog_comment_like", {"p_comment_id": comment_id, "p_fingerprint": fingerprint})
+    if resp.status_code != 200:
+        raise RuntimeError(f"toggle_blog_comment_like: {resp.status_code} {resp.text[:200]}")
+    data = resp.json()
+    row = data[0] if isinstance(data, list) else data
+    liked, like_count = bool(row["liked"]), int(row["like_count"] or 0)
+    blog_id = row.get("blog_id")
+    if blog_id is None:
+        # Function from before blog_id was returned
+        comment = supabase_rest.select_one("blog_comments", columns="blog_id", filters={"id": f"eq.{comment_id}"})
+        blog_id = comment and comment.get("blog_id")
+    if blog_id:
+        # like_count is part of the cached pages and their ETag
+        cache.set(_likes_version_key(blog_id), time.time_ns(), None)
+    key = _likes_key(fingerprint)
+    known = cache.get(key) or {}
+    known[str(comment_id)] = liked
+    cache.set(key, known, getattr(settings, "BLOG_COMMENT_LIKES_CACHE_TTL", 600))
+    return liked, like_count
+
+
+def liked_ids(comment_ids, fingerprint):
+    """The subset of comment_ids the visitor has liked; only ids not remembered yet are looked up."""
+    key = _likes_key(fingerprint)
+    known = cache.get(key) or {}
+    unknown = [cid for cid in comment_ids if cid not in known]
+    if unknown:
+        rows = _get("blog_comment_likes", {
+            "select": "comment_id",
+            "visitor_fingerprint": f"eq.{fingerprint}",
+            "comment_id": f"in.({','.join(_quote(cid) for cid in unknown)})",
+        }).json()
+        liked = {str(r["comment_id"]) for r in rows}
+        for cid in unknown:
+            known[cid] = cid in liked
+        cache.set(key, known, getattr(settings, "BLOG_COMMENT_LIKES_CACHE_TTL", 600))
+    return [cid for cid in comment_ids if known.get(cid)]
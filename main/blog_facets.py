@@ -0,0 +1,190 @@
+"""
+Blog facet index for the /blog/ sidebar.
+
+Holds, for every published post, the few fields the sidebar needs (category,
+tags, view_count, title, slug, published_at) together with the derived category
+counts and tag frequencies. The index lives in the shared cache and is kept up
+to date incrementally:
+
+- dashboard_blogs_save / dashboard_blogs_delete call upsert_post() / remove_post()
+- counters.flush() calls apply_view_deltas() with the blog views it just wrote
+
+so a sidebar render never scans the blogs table. Each process keeps the last
+index it read in memory and only re-reads it when the shared version changes.
+A full rebuild() happens when the index is missing or older than
+BLOG_FACETS_REBUILD_INTERVAL, which also corrects any drift.
+"""
+import heapq
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import cache_lock
+from . import records
+from . import supabase_rest
+
+INDEX_KEY = "blog_facets:index"
+VERSION_KEY = "blog_facets:version"
+LOCK_KEY = "blog_facets:lock"
+STALE_KEY = "blog_facets:stale"
+POST_COLUMNS = "id,title,slug,category,tags,view_count,published_at"
+
+_local = {"version": None, "index": None, "trending": None}
+_local_lock = threading.Lock()
+
+
+def _entry(row):
+    tags = row.get("tags") or []
+    if isinstance(tags, str):
+        tags = records.decode("blogs", {"tags": tags})["tags"] or []
+    published_at = row.get("published_at")
+    if published_at is not None and not isinstance(published_at, str):
+        published_at = published_at.isoformat()
+    return {
+        "id": str(row.get("id")),
+        "title": row.get("title") or "",
+        "slug": row.get("slug") or "",
+        "category": row.get("category") or "general",
+        "tags": [t for t in tags if t],
+        "view_count": int(row.get("view_count") or 0),
+        "published_at": published_at,
+    }
+
+
+def _add(index, entry):
+    index["posts"][entry["id"]] = entry
+    index["categories"][entry["category"]] = index["categories"].get(entry["category"], 0) + 1
+    for tag in set(entry["tags"]):
+        index["tags"][tag] = index["tags"].get(tag, 0) + 1
+
+
+def _discard(index, post_id):
+    entry = index["posts"].pop(post_id, None)
+    if entry is None:
+        return
+    for counts, keys in ((index["categories"], [entry["category"]]), (index["tags"], set(entry["tags"]))):
+        for key in keys:
+            counts[key] = counts.get(key, 0) - 1
+            if counts[key] <= 0:
+                counts.pop(key, None)
+
+
+def _save(index):
+    version = time.time_ns()
+    cache.set(INDEX_KEY, index, None)
+    cache.set(VERSION_KEY, version, None)
+    return version
+
+
+def rebuild():
+    """Build the index from Supabase (one query over published posts) and store it."""
+    rows = supabase_rest.select("blogs", columns=POST_COLUMNS, filters={"is_published": "eq.true"})
+    index = {"posts": {}, "categories": {}, "tags": {}, "built_at": time.time()}
+    for row in rows:
+        _add(index, _entry(row))
+    if rows:
+        # An empty result may be a failed request; don't pin it, the next read tries again
+        _save(index)
+    return index
+
+
+def _mutate(apply):
+    """
+    Apply an incremental change to the shared index under a short lock. If the lock
+    can't be had, the change is not applied; instead the index is flagged stale and
+    whoever holds the lock drops it on release, so the next read rebuilds.
+    """
+    if not cache_lock.acquire(LOCK_KEY):
+        print("[Blog Facets] Index busy, marking it for rebuild")
+        cache.set(STALE_KEY, 1, None)
+        return
+    try:
+        index = cache.get(INDEX_KEY)
+        if index is None:
+            # Nothing to patch; the next read rebuilds from scratch
+            return
+        apply(index)
+        _save(index)
+    finally:
+        if cache.get(STALE_KEY):
+            # A writer gave up waiting for us; its change is missing from what we saved
+            cache.delete_many([STALE_KEY, INDEX_KEY, VERSION_KEY])
+        cache_lock.release(LOCK_KEY)
+
+
+def upsert_post(row):
+    """Reflect a saved post (a blogs row as returned by PostgREST). Unpublished posts are removed."""
+    def apply(index):
+        _discard(index, str(row.get("id")))
+        if row.get("is_published"):
+            _add(index, _entry(row))
+    try:
+        _mutate(apply)
+    except Exception as e:
+        print(f"[Blog Facets] Upsert failed: {e}")
+
+
+def remove_post(post_id):
+    try:
+        _mutate(lambda index: _discard(index, str(post_id)))
+    except Exception as e:
+        print(f"[Blog Facets] Remove failed: {e}")
+
+
+def apply_view_deltas(deltas):
+    """Add flushed view counts ({blog id: delta}) so trending follows the counters."""
+    def apply(index):
+        for post_id, delta in deltas.items():
+            entry = index["posts"].get(str(post_id))
+            if entry is not None:
+                entry["view_count"] += delta
+    if deltas:
+        try:
+            _mutate(apply)
+        except Exception as e:
+            print(f"[Blog Facets] View delta update failed: {e}")
+
+
+def _current():
+    version = cache.get(VERSION_KEY)
+    with _local_lock:
+        if version is not None and version == _local["version"]:
+            return _local
+    index = cache.get(INDEX_KEY) if version is not None else None
+    interval = getattr(settings, "BLOG_FACETS_REBUILD_INTERVAL", 3600)
+    if index is None or time.time() - index.get("built_at", 0) > interval:
+        index = rebuild()
+        version = cache.get(VERSION_KEY)
+    with _local_lock:
+        _local.update(version=version, index=index, trending={})
+        return _local
+
+
+def trending(limit=5):
+    """Most viewed published posts, as decoded rows (published_at is a date/datetime)."""
+    state = _current()
+    cached = state["trending"].get(limit)
+    if cached is None:
+        top = heapq.nlargest(limit, state["index"]["posts"].values(), key=lambda e: e["view_count"])
+        cached = state["trending"][limit] = records.decode_rows("blogs", [dict(e) for e in top])
+    return [dict(e) for e in cached]
+
+
+def sidebar(tag_limit=15, trending_limit=5):
+    """
+    Everything the blog sidebar shows, from memory:
+    {"categories": [(category, count), ...] by count, "tags": [tag, ...] (most used, alphabetical),
+     "total": published post count, "trending": [...]}
+    """
+    index = _current()["index"]
+    categories = sorted(index["categories"].items(), key=lambda x: x[1], reverse=True)
+    top_tags = heapq.nlargest(tag_limit, index["tags"].items(), key=lambda x: (x[1], x[0]))
+    return {
+        "categories": categories,
+        "category_counts": dict(index["categories"]),
+        "tags": sorted(tag for tag, _ in top_tags),
+        "total": len(index["posts"]),
+        "trending": trending(trending_limit),
+    }
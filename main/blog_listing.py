@@ -0,0 +1,117 @@
+"""
+Keyset-paginated blog listing.
+
+The public blog page and the /api/blog/list/ "load more" endpoint read the same
+pages: posts ordered by (published_at desc, id desc), fetching only the columns
+a card needs (no content bodies). A page ends with an opaque cursor holding
+the last (published_at, id); the next page continues strictly after it, so the
+cost of a page does not depend on how deep into the archive it is.
+
+Pages are cached with the "blogs" page-cache tag version in the key, so the
+purge done by the dashboard blog views also retires every cached listing page.
+"""
+import base64
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import records
+from . import storage_urls
+from . import supabase_rest
+from .page_cache import tags_version
+
+CARD_COLUMNS = "id,title,slug,excerpt,category,featured_image_url,reading_time,published_at,created_at"
+ORDER = "published_at.desc.nullslast,id.desc"
+
+
+def page_size():
+    return getattr(settings, "BLOG_PAGE_SIZE", 12)
+
+
+def encode_cursor(row):
+    published_at = row.get("published_at")
+    if published_at is not None and not isinstance(published_at, str):
+        published_at = published_at.isoformat()
+    raw = json.dumps([published_at, row.get("id")], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """(published_at, id) from a cursor token, or None if it is missing or malformed."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        published_at, row_id = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if row_id is None:
+        return None
+    return published_at, row_id
+
+
+def _quote(value):
+    # PostgREST logic-tree values containing , . : ( ) must be double quoted
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _filters(category, cursor):
+    filters = {"is_published": "eq.true"}
+    if category:
+        filters["category"] = f"eq.{category}"
+
+    if cursor:
+        published_at, row_id = cursor
+        if published_at is None:
+            # Past the dated posts: walk the undated tail (nulls sort last) by id
+            filters["and"] = f"(published_at.is.null,id.lt.{_quote(row_id)})"
+        else:
+            ts = _quote(published_at)
+            filters["or"] = f"(published_at.lt.{ts},and(published_at.eq.{ts},id.lt.{_quote(row_id)}),published_at.is.null)"
+    return filters
+
+
+def _load_page(category, cursor, size):
+    rows = supabase_rest.select(
+        "blogs",
+        columns=CARD_COLUMNS,
+        filters=_filters(category, cursor),
+        order=ORDER,
+        limit=size + 1,
+    )
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = encode_cursor(rows[-1]) if has_more and rows else None
+    records.decode_rows("blogs", rows)
+    storage_urls.canonicalize_rows(rows, "blogs")
+    return {"posts": rows, "next_cursor": next_cursor}
+
+
+def fetch_page(category="", cursor_token=None, size=None):
+    """
+    One page of published posts (card columns only) as {"posts": [...], "next_cursor": str|None}.
+    cursor_token is the next_cursor of the previous page; None starts from the newest post.
+    """
+    size = size or page_size()
+    cursor = decode_cursor(cursor_token)
+    digest = hashlib.md5(f"{category}|{cursor_token if cursor else ''}|{size}".encode("utf-8")).hexdigest()
+    key = f"blog:list:{tags_version('blogs')}:{digest}"
+    try:
+        page = cache.get(key)
+    except Exception as e:
+        print(f"[Blog Listing] Cache read failed: {e}")
+        page = None
+    if page is not None:
+        return page
+
+    page = _load_page(category, cursor, size)
+    if not page["posts"]:
+        # Could be a failed request; don't pin an empty page in the cache
+        return page
+    try:
+        cache.set(key, page, getattr(settings, "BLOG_LIST_CACHE_TTL", 120))
+    except Exception as e:
+        print(f"[Blog Listing] Cache write failed: {e}")
+    return page
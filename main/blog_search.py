@@ -0,0 +1,312 @@
+"""
+In-process full-text search over published blog posts.
+
+An inverted index (term -> {post id: weighted term frequency}) is built from
+title, tags, excerpt and content the first time a process searches, and kept
+current incrementally: dashboard_blogs_save/delete call reindex_post() /
+remove_post(), which update the local index and append the post id to a short
+change log in the shared cache. Other processes replay the log on their next
+search by refetching only the changed posts; if they have fallen further behind
+than the log reaches, they rebuild.
+
+Ranking is BM25 with per-field weights. The last query word is matched as a
+prefix (type-ahead), so "educ" finds "education". Every query word must match.
+Query cost depends on the posting lists of the query terms, not on the total
+amount of content.
+"""
+import bisect
+import html
+import math
+import re
+import threading
+
+from django.core.cache import cache
+from django.utils.html import strip_tags
+
+from . import cache_lock
+from . import records
+from . import storage_urls
+from . import supabase_rest
+
+POST_COLUMNS = "id,title,slug,excerpt,content,tags,category,featured_image_url,reading_time,published_at,created_at,is_published"
+CARD_FIELDS = ("id", "title", "slug", "excerpt", "category", "featured_image_url", "reading_time", "published_at", "created_at")
+
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.0, "excerpt": 1.5, "content": 1.0}
+K1 = 1.2
+B = 0.75
+PREFIX_WEIGHT = 0.8       # score factor for a prefix expansion vs. an exact term
+MAX_PREFIX_EXPANSIONS = 50
+SNIPPET_CHARS = 180
+
+CHANGES_KEY = "blog_search:changes"   # [(seq, post id), ...] newest last
+SEQ_KEY = "blog_search:seq"
+LOCK_KEY = "blog_search:lock"
+STALE_KEY = "blog_search:stale"       # set by a writer that could not take the lock
+MAX_CHANGES = 200
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the to was were will with".split()
+)
+_word = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    return [t for t in _word.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class _Index:
+    def __init__(self):
+        self.postings = {}   # term -> {doc_id: weighted tf}
+        self.vocab = []      # sorted terms, for prefix lookups
+        self.docs = {}       # doc_id -> {"length", "terms", "card", "text"}
+        self.total_length = 0.0
+        self.seq = 0
+
+    def add(self, row):
+        doc_id = str(row.get("id"))
+        self.remove(doc_id)
+        tags = row.get("tags") or []
+        if isinstance(tags, str):
+            tags = records.decode("blogs", {"tags": tags})["tags"] or []
+        content = strip_tags(row.get("content") or "")
+        fields = {
+            "title": row.get("title") or "",
+            "tags": " ".join(tags),
+            "excerpt": row.get("excerpt") or "",
+            "content": content,
+        }
+        tf = {}
+        length = 0.0
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text):
+                tf[term] = tf.get(term, 0.0) + weight
+                length += weight
+        for term, freq in tf.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                bisect.insort(self.vocab, term)
+            posting[doc_id] = freq
+        card = {field: row.get(field) for field in CARD_FIELDS}
+        card["id"] = doc_id
+        records.decode("blogs", card)
+        storage_urls.canonicalize_rows([card], "blogs")
+        self.docs[doc_id] = {
+            "length": length,
+            "terms": list(tf),
+            "card": card,
+            "text": " ".join(t for t in (fields["excerpt"], content) if t),
+        }
+        self.total_length += length
+
+    def remove(self, doc_id):
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self.total_length -= doc["length"]
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[term]
+                i = bisect.bisect_left(self.vocab, term)
+                if i < len(self.vocab) and self.vocab[i] == term:
+                    del self.vocab[i]
+
+    def expand(self, prefix):
+        i = bisect.bisect_left(self.vocab, prefix)
+        out = []
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix) and len(out) < MAX_PREFIX_EXPANSIONS:
+            out.append(self.vocab[i])
+            i += 1
+        return out
+
+    def score(self, terms, prefix_last=True):
+        """{doc_id: score, ...} for docs matching every query term (the last one as a prefix)."""
+        n = len(self.docs)
+        if not n or not terms:
+            return {}
+        avgdl = self.total_length / n or 1.0
+        scores = None
+        for pos, term in enumerate(terms):
+            candidates = [(term, 1.0)] if term in self.postings else []
+            if prefix_last and pos == len(terms) - 1:
+                candidates += [(t, PREFIX_WEIGHT) for t in self.expand(term) if t != term]
+            term_scores = {}
+            for candidate, factor in candidates:
+                posting = self.postings[candidate]
+                idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+                for doc_id, tf in posting.items():
+                    dl = self.docs[doc_id]["length"]
+                    s = factor * idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * dl / avgdl))
+                    if s > term_scores.get(doc_id, 0.0):
+                        term_scores[doc_id] = s
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {d: scores[d] + s for d, s in term_scores.items() if d in scores}
+            if not scores:
+                return {}
+        return scores
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def _fetch(filters):
+    return supabase_rest.select("blogs", columns=POST_COLUMNS, filters=filters)
+
+
+def _build():
+    index = _Index()
+    index.seq = cache.get(SEQ_KEY, 0)
+    for row in _fetch({"is_published": "eq.true"}):
+        index.add(row)
+    return index
+
+
+def _catch_up(index):
+    """Replay changes other processes logged since this index was built."""
+    seq = cache.get(SEQ_KEY, 0)
+    if seq == index.seq:
+        return index
+    changes = cache.get(CHANGES_KEY) or []
+    pending = [post_id for s, post_id in changes if s > index.seq]
+    if not changes or changes[0][0] > index.seq + 1:
+        # The log no longer reaches back to our position
+        return _build()
+    ids = sorted(set(pending))
+    if ids:
+        rows = {str(r["id"]): r for r in _fetch({"id": f"in.({','.join(ids)})"})}
+        for post_id in ids:
+            row = rows.get(post_id)
+            if row and row.get("is_published"):
+                index.add(row)
+            else:
+                index.remove(post_id)
+    index.seq = seq
+    return index
+
+
+def _current():
+    global _index
+    with _lock:
+        index = _build() if _index is None else _catch_up(_index)
+        # An empty build may be a failed fetch; keep retrying until posts come back
+        _index = index if index.docs else None
+        return index
+
+
+def _log_change(post_id):
+    """
+    Append a change to the shared log under a short lock (seq is read-modify-write).
+    A writer that can't get the lock flags the log stale instead; the lock holder
+    then empties it on release, which makes every process rebuild its index.
+    """
+    try:
+        if not cache_lock.acquire(LOCK_KEY):
+            print("[Blog Search] Change log busy, marking it for rebuild")
+            cache.set(STALE_KEY, 1, None)
+            return None
+        try:
+            seq = cache.get(SEQ_KEY, 0) + 1
+            changes = (cache.get(CHANGES_KEY) or []) + [(seq, str(post_id))]
+            cache.set(CHANGES_KEY, changes[-MAX_CHANGES:], None)
+            cache.set(SEQ_KEY, seq, None)
+        finally:
+            if cache.get(STALE_KEY):
+                # Another change was never logged; an empty log past our seq forces rebuilds
+                cache.delete(STALE_KEY)
+                cache.set(CHANGES_KEY, [], None)
+                cache.set(SEQ_KEY, cache.get(SEQ_KEY, 0) + 1, None)
+            cache_lock.release(LOCK_KEY)
+        return seq
+    except Exception as e:
+        print(f"[Blog Search] Change log update failed: {e}")
+        return None
+
+
+def reindex_post(row):
+    """Index a saved post (blogs row incl. content) here and tell other processes."""
+    seq = _log_change(row.get("id"))
+    with _lock:
+        if _index is None:
+            return
+        if row.get("is_published"):
+            _index.add(row)
+        else:
+            _index.remove(str(row.get("id")))
+        if seq is not None and seq == _index.seq + 1:
+            _index.seq = seq
+
+
+def remove_post(post_id):
+    seq = _log_change(post_id)
+    with _lock:
+        if _index is None:
+            return
+        _index.remove(str(post_id))
+        if seq is not None and seq == _index.seq + 1:
+            _index.seq = seq
+
+
+def highlight(text, terms, prefix_last=True):
+    """HTML-escape text and wrap query term matches in <mark>."""
+    if not terms:
+        return html.escape(text)
+    parts = [re.escape(t) + (r"\w*" if prefix_last and i == len(terms) - 1 else r"\b") for i, t in enumerate(terms)]
+    pattern = re.compile(r"\b(" + "|".join(parts) + ")", re.IGNORECASE | re.UNICODE)
+    out, last = [], 0
+    for m in pattern.finditer(text):
+        out.append(html.escape(text[last:m.start()]))
+        out.append("<mark>" + html.escape(m.group(0)) + "</mark>")
+        last = m.end()
+    out.append(html.escape(text[last:]))
+    return "".join(out)
+
+
+def snippet(text, terms, prefix_last=True, length=SNIPPET_CHARS):
+    """A window of text around the first match, highlighted."""
+    text = re.sub(r"\s+", " ", text).strip()
+    start = 0
+    if terms:
+        parts = [re.escape(t) for t in terms]
+        m = re.search(r"\b(" + "|".join(parts) + ")", text, re.IGNORECASE | re.UNICODE)
+        if m:
+            start = max(0, m.start() - length // 3)
+            # Start at a word boundary
+            if start:
+                space = text.find(" ", start)
+                start = space + 1 if 0 <= space < m.start() else start
+    window = text[start:start + length]
+    prefix = "…" if start else ""
+    suffix = "…" if start + length < len(text) else ""
+    return prefix + highlight(window, terms, prefix_last) + suffix
+
+
+def search(query, category="", limit=20):
+    """
+    Ranked posts for query: [card dict + "score", "title_html", "snippet_html"], best first.
+    category optionally restricts the results.
+    """
+    terms = tokenize(query)
+    index = _current()
+    # reindex_post()/remove_post() change the index in place under _lock, so read it under _lock too
+    with _lock:
+        scores = index.score(terms)
+        if category:
+            scores = {d: s for d, s in scores.items() if index.docs[d]["card"].get("category") == category}
+        ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+        hits = [(dict(index.docs[doc_id]["card"]), index.docs[doc_id]["text"], score) for doc_id, score in ranked]
+
+    results = []
+    for card, text, score in hits:
+        card["score"] = round(score, 4)
+        card["title_html"] = highlight(card.get("title") or "", terms)
+        card["snippet_html"] = snippet(text, terms)
+        results.append(card)
+    return results
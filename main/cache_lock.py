@@ -0,0 +1,84 @@
+"""
+Short cross-process locks for read-modify-write updates of shared cache entries.
+
+cache.add() is atomic on Redis and Memcached, but FileBasedCache (the default
+here) implements it as has_key() followed by set(), so two writers can both
+"win". With the file cache the lock is an O_EXCL lock file next to the cache
+files instead, which the OS creates atomically. A lock older than its ttl is
+treated as abandoned (its holder died) and taken over.
+
+    with cache_lock.held("blog_facets:lock") as acquired:
+        if acquired:
+            ...
+"""
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+def _file_cache():
+    """The default cache if it is file based (caches[...] is the backend, not a proxy), else None."""
+    backend = caches["default"]
+    return backend if isinstance(backend, FileBasedCache) else None
+
+
+def _lock_path(backend, key):
+    digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+    return os.path.join(backend._dir, f"{digest}.lock")
+
+
+def _try_file(path, ttl):
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                os.remove(path)   # abandoned; the next attempt can take it
+        except OSError:
+            pass
+        return False
+    os.close(fd)
+    return True
+
+
+def acquire(key, ttl=5, wait=2):
+    """Take the lock, polling for up to wait seconds. Returns True when this caller holds it."""
+    backend = _file_cache()
+    if backend is not None:
+        os.makedirs(backend._dir, exist_ok=True)
+    deadline = time.time() + wait
+    while True:
+        if backend is not None:
+            if _try_file(_lock_path(backend, key), ttl):
+                return True
+        elif caches["default"].add(key, 1, ttl):
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(0.02)
+
+
+def release(key):
+    backend = _file_cache()
+    if backend is not None:
+        try:
+            os.remove(_lock_path(backend, key))
+        except OSError:
+            pass
+    else:
+        caches["default"].delete(key)
+
+
+@contextmanager
+def held(key, ttl=5, wait=2):
+    """Context manager around acquire()/release(); yields whether the lock was acquired."""
+    acquired = acquire(key, ttl, wait)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            release(key)
@@ -0,0 +1,242 @@
+"""
+Write-behind counter buffer.
+
+Page views and blog views are incremented in memory and flushed every
+COUNTER_FLUSH_INTERVAL seconds as one batch through the increment_counters RPC
+(see migrations/increment_counters.sql), which applies every delta atomically
+in Postgres. Analytics rows passed to record_event() are buffered the same way
+and bulk-inserted on flush. (Message share/download/copy counts are written
+through by the job worker instead, see main/tasks.py.)
+
+If a flush fails the deltas are kept for the next attempt. When COUNTER_SPILL_DB
+is set they are also written to a local SQLite file, so a restart does not lose
+them; the spill is drained and retried on the next flush.
+
+Analytics rows that Postgres rejects (4xx, e.g. a foreign key to a deleted
+message) are isolated by splitting the batch and dropped with a log line, so
+one bad row never blocks the rows behind it. Network errors and 5xx keep the
+batch for at most COUNTER_EVENT_RETRIES further flushes, and each table buffers
+at most COUNTER_MAX_EVENTS rows (the oldest are dropped beyond that).
+"""
+import atexit
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+
+from . import supabase_rest
+
+_lock = threading.Lock()
+_deltas = defaultdict(int)   # (table, row_key, field) -> delta
+_events = defaultdict(list)  # table -> [row, ...]
+_event_failures = defaultdict(int)  # table -> consecutive failed inserts
+_flusher = None
+
+
+def _max_events():
+    return getattr(settings, "COUNTER_MAX_EVENTS", 10000)
+
+
+def increment(table, row_key, field, amount=1):
+    """Add amount to table.field for the row identified by row_key (applied on the next flush)."""
+    with _lock:
+        _deltas[(table, str(row_key), field)] += amount
+    _ensure_flusher()
+
+
+def record_event(table, row):
+    """Queue an analytics row for bulk insert on the next flush."""
+    with _lock:
+        rows = _events[table]
+        rows.append(row)
+        if len(rows) > _max_events():
+            del rows[:len(rows) - _max_events()]
+    _ensure_flusher()
+
+
+def pending(table, row_key, field):
+    """Unflushed delta for a counter, so pages can show an up-to-date value."""
+    with _lock:
+        return _deltas.get((table, str(row_key), field), 0)
+
+
+def _ensure_flusher():
+    global _flusher
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _lock:
+        if _flusher is not None and _flusher.is_alive():
+            return
+        _flusher = threading.Thread(target=_flush_loop, name="counter-flush", daemon=True)
+        _flusher.start()
+
+
+def _flush_loop():
+    interval = getattr(settings, "COUNTER_FLUSH_INTERVAL", 5)
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        except Exception as e:
+            print(f"[Counters] Flush error: {e}")
+
+
+def _take():
+    with _lock:
+        deltas = dict(_deltas)
+        events = {table: list(rows) for table, rows in _events.items() if rows}
+        _deltas.clear()
+        _events.clear()
+    return deltas, events
+
+
+def _restore(deltas, events):
+    with _lock:
+        for key, amount in deltas.items():
+            _deltas[key] += amount
+        for table, rows in events.items():
+            buffered = _events[table]
+            buffered[:0] = rows
+            if len(buffered) > _max_events():
+                del buffered[:len(buffered) - _max_events()]
+
+
+def flush():
+    """Send buffered deltas and events to Supabase. Returns number of counters applied."""
+    deltas, events = _take()
+    for key, amount in _spill_drain().items():
+        deltas[key] = deltas.get(key, 0) + amount
+    deltas = {key: amount for key, amount in deltas.items() if amount}
+
+    if deltas:
+        payload = [
+            {"table": table, "row_key": row_key, "field": field, "delta": amount}
+            for (table, row_key, field), amount in deltas.items()
+        ]
+        try:
+            resp = supabase_rest.rpc("increment_counters", {"p_deltas": payload})
+            ok = resp.status_code in (200, 204)
+            if not ok:
+                print(f"[Counters] increment_counters failed: {resp.status_code} {resp.text[:200]}")
+        except Exception as e:
+            print(f"[Counters] increment_counters error: {e}")
+            ok = False
+        if not ok:
+            if not _spill_write(deltas):
+                _restore(deltas, {})
+            deltas = {}
+        else:
+            _notify_blog_views(deltas)
+
+    for table, rows in events.items():
+        unsent = _insert_events(table, rows)
+        if not unsent:
+            _event_failures.pop(table, None)
+            continue
+        _event_failures[table] += 1
+        if _event_failures[table] > getattr(settings, "COUNTER_EVENT_RETRIES", 5):
+            print(f"[Counters] Dropping {len(unsent)} {table} row(s) after {_event_failures[table]} failed flushes")
+            _event_failures.pop(table, None)
+        else:
+            _restore({}, {table: unsent})
+
+    return len(deltas)
+
+
+def _insert_events(table, rows):
+    """
+    Bulk insert rows and return the ones worth retrying (network error or 5xx).
+    Rows rejected by Postgres (4xx) are found by halving the batch, logged and dropped.
+    """
+    try:
+        resp = supabase_rest.insert(table, rows, returning=False)
+    except Exception as e:
+        print(f"[Counters] Insert into {table} error: {e}")
+        return rows
+    if resp.status_code in (200, 201, 204):
+        return []
+    if resp.status_code >= 500:
+        print(f"[Counters] Insert into {table} failed: {resp.status_code} {resp.text[:200]}")
+        return rows
+    if len(rows) == 1:
+        print(f"[Counters] Dropping rejected {table} row {rows[0]}: {resp.status_code} {resp.text[:200]}")
+        return []
+    middle = len(rows) // 2
+    return _insert_events(table, rows[:middle]) + _insert_events(table, rows[middle:])
+
+
+def _notify_blog_views(deltas):
+    """Feed applied blog view counts to the blog facet index (trending)."""
+    views = {row_key: amount for (table, row_key, field), amount in deltas.items()
+             if table == "blogs" and field == "view_count"}
+    if views:
+        from . import blog_facets
+        blog_facets.apply_view_deltas(views)
+
+
+# =====================================================
+# OPTIONAL SQLITE SPILL
+# =====================================================
+
+def _spill_db():
+    path = getattr(settings, "COUNTER_SPILL_DB", "")
+    if not path:
+        return None
+    conn = sqlite3.connect(str(path), timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS counter_spill ("
+        "tbl TEXT, row_key TEXT, field TEXT, delta INTEGER, "
+        "PRIMARY KEY (tbl, row_key, field))"
+    )
+    return conn
+
+
+def _spill_write(deltas):
+    conn = _spill_db()
+    if conn is None:
+        return False
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO counter_spill (tbl, row_key, field, delta) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (tbl, row_key, field) DO UPDATE SET delta = delta + excluded.delta",
+                [(t, k, f, d) for (t, k, f), d in deltas.items()],
+            )
+        return True
+    except sqlite3.Error as e:
+        print(f"[Counters] Spill write failed: {e}")
+        return False
+    finally:
+        conn.close()
+
+
+def _spill_drain():
+    """Take (read and delete) everything spilled so far, so two processes never apply it twice."""
+    conn = _spill_db()
+    if conn is None:
+        return {}
+    try:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("SELECT tbl, row_key, field, delta FROM counter_spill").fetchall()
+            conn.execute("DELETE FROM counter_spill")
+        return {(t, k, f): d for t, k, f, d in rows}
+    except sqlite3.Error as e:
+        print(f"[Counters] Spill read failed: {e}")
+        return {}
+    finally:
+        conn.close()
+
+
+@atexit.register
+def _flush_on_exit():
+    try:
+        deltas, events = _take()
+        if not deltas and not events:
+            return
+        _restore(deltas, events)
+        flush()
+    except Exception as e:
+        print(f"[Counters] Final flush failed: {e}")
@@ -0,0 +1,129 @@
+"""
+Direct-to-Storage dashboard uploads.
+
+Instead of posting a file through a Django worker, the dashboard asks
+sign() for a short-lived signed upload URL (api: dashboard/uploads/sign/), the
+browser PUTs the file straight to Supabase Storage, and the form is then posted
+with a ticket in "<field>_upload" in place of the file. The save view calls
+finalize() on the ticket: it checks the ticket's signature and age, HEADs the
+object to check it exists and its size and content type are allowed for the
+target, and returns the public URL the view records in its row. The worker only
+spends a couple of small requests on the upload, whatever the file size.
+
+The ticket is a django.core.signing token over the target, bucket and path
+chosen by sign(), so a client can only finalize objects the server signed for
+that kind of upload. Objects that fail the checks are deleted.
+"""
+import os
+import re
+import uuid
+
+from django.conf import settings
+from django.core import signing
+
+from . import storage_upload
+from . import supabase_rest
+
+MB = 1024 * 1024
+
+# target -> bucket, folder, allowed content type prefixes (None: any), max size
+TARGETS = {
+    "media_video": {"bucket": "media-vault", "folder": "videos", "types": ("video/",), "max_size": 2048 * MB},
+    "media_thumbnail": {"bucket": "media-vault", "folder": "thumbnails", "types": ("image/",), "max_size": 20 * MB},
+    "media_audio": {"bucket": "media-vault", "folder": "audio", "types": ("audio/",), "max_size": 500 * MB},
+    "media_cover": {"bucket": "media-vault", "folder": "covers", "types": ("image/",), "max_size": 20 * MB},
+    "media_image": {"bucket": "media-vault", "folder": "images", "types": ("image/",), "max_size": 50 * MB},
+    "media_document": {"bucket": "media-vault", "folder": "documents", "types": None, "max_size": 200 * MB},
+    "resource": {"bucket": "resources", "folder": "files", "types": None, "max_size": 200 * MB},
+    "blog_image": {"bucket": "blogs", "folder": "featured", "types": ("image/",), "max_size": 20 * MB},
+    "hero_video": {"bucket": "settings", "folder": "hero-video", "types": ("video/",), "max_size": 1024 * MB},
+    "leadership_photo": {"bucket": "leadership", "folder": "portraits", "types": ("image/",), "max_size": 20 * MB},
+    "case_file": {"bucket": "media-vault", "folder": "cases", "types": None, "max_size": 200 * MB},
+}
+SALT = "main.direct_upload"
+
+
+class UploadRejected(Exception):
+    pass
+
+
+def _ticket_ttl():
+    return getattr(settings, "DIRECT_UPLOAD_TICKET_TTL", 7200)
+
+
+def _allowed(spec, content_type):
+    return spec["types"] is None or any((content_type or "").startswith(t) for t in spec["types"])
+
+
+def sign(target, filename, content_type, size):
+    """
+    Reserve an object for a browser upload.
+    Returns {"upload_url", "ticket", "public_url"}; raises UploadRejected for a bad target, type or size.
+    """
+    spec = TARGETS.get(target)
+    if not spec:
+        raise UploadRejected("Unknown upload target.")
+    if not _allowed(spec, content_type):
+        raise UploadRejected(f"{content_type or 'This file type'} is not allowed here.")
+    if size is None or size <= 0 or size > spec["max_size"]:
+        raise UploadRejected(f"Files here must be under {spec['max_size'] // MB} MB.")
+
+    ext = os.path.splitext(filename or "")[1].lower()
+    ext = ext if re.fullmatch(r"\.[a-z0-9]{1,8}", ext) else ""
+    path = f"{spec['folder']}/{uuid.uuid4().hex}{ext}"
+    resp = supabase_rest.post(
+        f"{storage_upload.endpoint()}/object/upload/sign/{spec['bucket']}/{path}",
+        headers=supabase_rest.read_headers(),
+        timeout=10,
+    )
+    if resp.status_code != 200 or not resp.json().get("url"):
+        raise UploadRejected(f"Could not sign the upload ({resp.status_code}).")
+    # url is relative to the Storage API: /object/upload/sign/<bucket>/<path>?token=...
+    upload_url = storage_upload.endpoint() + resp.json()["url"]
+
+    ticket = signing.dumps({
+        "target": target,
+        "bucket": spec["bucket"],
+        "path": path,
+        "name": os.path.basename(filename or "") or path.rsplit("/", 1)[-1],
+    }, salt=SALT)
+    return {"upload_url": upload_url, "ticket": ticket, "public_url": storage_upload.public_url(spec["bucket"], path)}
+
+
+def _delete(bucket, path):
+    try:
+        supabase_rest.delete(f"{storage_upload.endpoint()}/object/{bucket}/{path}", headers=supabase_rest.read_headers())
+    except Exception as e:
+        print(f"[Direct Upload] Could not delete rejected {bucket}/{path}: {e}")
+
+
+def finalize(ticket, target):
+    """
+    Check an uploaded object against its ticket.
+    Returns {"url", "name", "size", "content_type", "bucket", "path"}; raises UploadRejected.
+    """
+    try:
+        data = signing.loads(ticket, salt=SALT, max_age=_ticket_ttl())
+    except signing.BadSignature:
+        raise UploadRejected("The upload ticket is invalid or has expired.")
+    if data.get("target") != target:
+        raise UploadRejected("The upload ticket is for a different kind of file.")
+
+    spec = TARGETS[target]
+    bucket, path = data["bucket"], data["path"]
+    resp = supabase_rest.head(f"{storage_upload.endpoint()}/object/{bucket}/{path}", headers=supabase_rest.read_headers())
+    if resp.status_code != 200:
+        raise UploadRejected("The file was not uploaded to storage.")
+    size = int(resp.headers.get("Content-Length") or 0)
+    content_type = (resp.headers.get("Content-Type") or "").split(";")[0].strip()
+    if size <= 0 or size > spec["max_size"] or not _allowed(spec, content_type):
+        _delete(bucket, path)
+        raise UploadRejected("The uploaded file is empty, too large or of a type not allowed here.")
+    return {
+        "url": storage_upload.public_url(bucket, path),
+        "name": data["name"],
+        "size": size,
+        "content_type": content_type,
+        "bucket": bucket,
+        "path": path,
+    }
@@ -0,0 +1,68 @@
+"""
+Concurrent fan-out loader for views that make many independent Supabase calls.
+
+Branches run on one long-lived, bounded thread pool per process. Its threads
+are reused, so each keeps its supabase_rest keep-alive session (and warm
+TCP/TLS connections) across requests. The pool is sized for several concurrent
+renders (FANOUT_MAX_WORKERS, default 64: the landing page alone has about nine
+branches), so one render's branches don't queue behind another's. The caller
+waits for all branches up to one overall deadline; branches that fail or miss
+the deadline fall back to their default value so the page can still render.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.conf import settings
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # Threads start on demand up to the limit and then stay, with their sessions
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "FANOUT_MAX_WORKERS", 64),
+                    thread_name_prefix="fanout",
+                )
+    return _executor
+
+
+def fan_out(tasks, deadline=None, label="Fanout"):
+    """
+    Run independent loaders concurrently and collect their results.
+
+    tasks: dict of name -> (callable, default). Each callable takes no arguments.
+    deadline: overall seconds to wait for every branch (defaults to FANOUT_DEADLINE).
+    Returns dict of name -> result, using the default for any branch that raised
+    or did not finish before the deadline.
+    """
+    if deadline is None:
+        deadline = getattr(settings, "FANOUT_DEADLINE", 4.0)
+
+    if not tasks:
+        return {}
+    executor = _get_executor()
+    futures = {}
+    for name, (func, _default) in tasks.items():
+        futures[executor.submit(func)] = name
+
+    done, pending = wait(futures, timeout=deadline)
+
+    results = {name: default for name, (_func, default) in tasks.items()}
+    for future in done:
+        name = futures[future]
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            print(f"[{label}] {name} failed: {e}")
+
+    for future in pending:
+        # Still waiting on upstream (or not started); don't block the response on it
+        future.cancel()
+        print(f"[{label}] {futures[future]} missed {deadline}s deadline")
+
+    return results
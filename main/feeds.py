@@ -0,0 +1,312 @@
+"""
+sitemap.xml and the blog / cases RSS and Atom feeds.
+
+The feeds are built from a small item list per source (published blogs, public
+cases) kept in the shared cache. The list is loaded once with one projected
+query and then maintained incrementally: the dashboard blog and case views call
+upsert_item() / remove_item() with the rows they just wrote, which bumps the
+source's version. Artifacts are rendered from the item list on the first
+request after a version change and cached as bytes together with their ETag
+and Last-Modified, so crawlers and feed readers revalidate with a 304 and never
+reach the dynamic /blog/, /cases/ or media pages.
+
+A full reload happens when a list is missing or older than FEEDS_REBUILD_INTERVAL.
+"""
+import hashlib
+import time
+from datetime import date, datetime, time as dtime, timezone
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.html import strip_tags
+
+from . import cache_lock
+from . import supabase_rest
+
+SOURCES = {
+    "blogs": {
+        "columns": "id,title,slug,excerpt,category,tags,published_at,created_at,updated_at,is_published",
+        "filters": {"is_published": "eq.true"},
+    },
+    "cases": {
+        "columns": "id,case_number,title,short_description,description,category,status,date_reported,created_at,updated_at",
+        "filters": {"status": "in.(active,solved,completed)"},
+    },
+}
+PUBLIC_CASE_STATUSES = ("active", "solved", "completed")
+
+# name -> (sources it is built from, content type)
+ARTIFACTS = {
+    "sitemap": (("blogs", "cases"), "application/xml; charset=utf-8"),
+    "blog_rss": (("blogs",), "application/rss+xml; charset=utf-8"),
+    "blog_atom": (("blogs",), "application/atom+xml; charset=utf-8"),
+    "cases_rss": (("cases",), "application/rss+xml; charset=utf-8"),
+    "cases_atom": (("cases",), "application/atom+xml; charset=utf-8"),
+}
+
+# Public pages listed in the sitemap: (url name, changefreq, priority)
+STATIC_PAGES = (
+    ("index", "daily", "1.0"),
+    ("blog", "daily", "0.9"),
+    ("cases", "daily", "0.9"),
+    ("about", "monthly", "0.7"),
+    ("about_ratel", "monthly", "0.6"),
+    ("mission_vision", "monthly", "0.6"),
+    ("ideology", "monthly", "0.6"),
+    ("faqs", "monthly", "0.5"),
+    ("leadership", "monthly", "0.6"),
+    ("membership", "monthly", "0.6"),
+    ("messages", "weekly", "0.6"),
+    ("resources", "weekly", "0.6"),
+    ("media_vault", "weekly", "0.6"),
+    ("media_videos", "weekly", "0.5"),
+    ("media_audios", "weekly", "0.5"),
+    ("media_images", "weekly", "0.5"),
+    ("media_documents", "weekly", "0.5"),
+    ("contact", "yearly", "0.4"),
+)
+
+FEED_ITEMS = 50
+ARTIFACT_TTL = 86400
+EMPTY_REBUILD_INTERVAL = 300
+LOCK_KEY = "feeds:lock"
+
+
+def _items_key(source):
+    return f"feeds:items:{source}"
+
+
+def _version_key(source):
+    return f"feeds:version:{source}"
+
+
+def _stale_key(source):
+    return f"feeds:stale:{source}"
+
+
+def _iso(value):
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+def _parse(value):
+    """Aware datetime from an ISO date or timestamp string, or None."""
+    if not value:
+        return None
+    try:
+        if "T" in value:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        else:
+            parsed = datetime.combine(date.fromisoformat(value[:10]), dtime.min)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _item(source, row):
+    """Feed item for a row, or None if the row is not public."""
+    if source == "blogs":
+        if not row.get("is_published") or not row.get("slug"):
+            return None
+        tags = row.get("tags") or []
+        published = _iso(row.get("published_at")) or _iso(row.get("created_at"))
+        return {
+            "id": str(row.get("id")),
+            "title": row.get("title") or "",
+            "path": reverse("blog_detail", args=[row["slug"]]),
+            "summary": strip_tags(row.get("excerpt") or ""),
+            "categories": [c for c in [row.get("category")] + list(tags if isinstance(tags, list) else []) if c],
+            "published": published,
+            "updated": _iso(row.get("updated_at")) or published,
+        }
+    if row.get("status") not in PUBLIC_CASE_STATUSES:
+        return None
+    case_number = row.get("case_number") or ""
+    published = _iso(row.get("date_reported")) or _iso(row.get("created_at"))
+    return {
+        "id": str(row.get("id")),
+        "title": f"{case_number}: {row.get('title') or ''}" if case_number else row.get("title") or "",
+        "path": reverse("cases") + (f"?q={case_number}" if case_number else f"#case-{row.get('id')}"),
+        "summary": strip_tags(row.get("short_description") or row.get("description") or ""),
+        "categories": [c for c in (row.get("category"), row.get("status")) if c],
+        "published": published,
+        "updated": _iso(row.get("updated_at")) or published,
+    }
+
+
+def _save(source, state):
+    state["version"] = time.time_ns()
+    cache.set(_items_key(source), state, None)
+    cache.set(_version_key(source), state["version"], None)
+
+
+def rebuild(source):
+    """Reload a source's item list from Supabase (one query) and store it."""
+    spec = SOURCES[source]
+    state = {"items": {}, "built_at": time.time(), "version": 0}
+    try:
+        rows = supabase_rest.select(source, columns=spec["columns"], filters=spec["filters"], strict=True)
+    except Exception as e:
+        # A failed request is not "no items"; serve an empty list this once without pinning it
+        print(f"[Feeds] Loading {source} failed: {e}")
+        return state
+    for row in rows:
+        item = _item(source, row)
+        if item:
+            state["items"][item["id"]] = item
+    _save(source, state)
+    return state
+
+
+def _state(source):
+    state = cache.get(_items_key(source))
+    interval = getattr(settings, "FEEDS_REBUILD_INTERVAL", 21600)
+    if state is not None and not state["items"]:
+        # A source with nothing public yet is rechecked sooner
+        interval = min(interval, EMPTY_REBUILD_INTERVAL)
+    if state is None or time.time() - state.get("built_at", 0) > interval:
+        state = rebuild(source)
+    return state
+
+
+def _mutate(source, apply):
+    # Without the lock the change is skipped and the list flagged stale; the lock
+    # holder drops it on release so the next request reloads it (see blog_facets._mutate)
+    if not cache_lock.acquire(LOCK_KEY):
+        print(f"[Feeds] {source} busy, marking it for reload")
+        cache.set(_stale_key(source), 1, None)
+        return
+    try:
+        state = cache.get(_items_key(source))
+        if state is None:
+            # Nothing to patch; the next request reloads the list
+            return
+        apply(state["items"])
+        _save(source, state)
+    finally:
+        for stale in [s for s in SOURCES if cache.get(_stale_key(s))]:
+            cache.delete_many([_stale_key(stale), _items_key(stale), _version_key(stale)])
+        cache_lock.release(LOCK_KEY)
+
+
+def upsert_item(source, row):
+    """Reflect a saved row (as returned by PostgREST); rows that are no longer public are dropped."""
+    def apply(items):
+        items.pop(str(row.get("id")), None)
+        item = _item(source, row)
+        if item:
+            items[item["id"]] = item
+    try:
+        _mutate(source, apply)
+    except Exception as e:
+        print(f"[Feeds] Update {source} failed: {e}")
+
+
+def remove_item(source, row_id):
+    try:
+        _mutate(source, lambda items: items.pop(str(row_id), None))
+    except Exception as e:
+        print(f"[Feeds] Remove from {source} failed: {e}")
+
+
+def _newest(items):
+    return sorted(items, key=lambda i: i.get("published") or "", reverse=True)
+
+
+def _render_feed(name, items, base_url):
+    blog = name.startswith("blog")
+    feed_cls = Atom1Feed if name.endswith("atom") else Rss201rev2Feed
+    feed = feed_cls(
+        title="Ratel Movement - News & Insights" if blog else "Ratel Movement - Cases",
+        link=base_url + reverse("blog" if blog else "cases"),
+        description=(
+            "News, insights and updates from the Ratel Movement." if blog
+            else "Cases reported to and followed by the Ratel Movement."
+        ),
+        language="en",
+        feed_url=base_url + reverse(name),
+    )
+    for item in _newest(items)[:FEED_ITEMS]:
+        link = base_url + item["path"]
+        feed.add_item(
+            title=item["title"],
+            link=link,
+            description=item["summary"],
+            unique_id=link,
+            unique_id_is_permalink=True,
+            pubdate=_parse(item["published"]),
+            updateddate=_parse(item["updated"]),
+            categories=item["categories"],
+        )
+    return feed.writeString("utf-8").encode("utf-8")
+
+
+def _render_sitemap(blog_items, case_items, base_url):
+    newest = {
+        "blog": max((i["updated"] or "" for i in blog_items), default=""),
+        "cases": max((i["updated"] or "" for i in case_items), default=""),
+    }
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+
+    def url(loc, lastmod=None, changefreq=None, priority=None):
+        lines.append("  <url>")
+        lines.append(f"    <loc>{escape(loc)}</loc>")
+        if lastmod:
+            lines.append(f"    <lastmod>{escape(lastmod)}</lastmod>")
+        if changefreq:
+            lines.append(f"    <changefreq>{changefreq}</changefreq>")
+        if priority:
+            lines.append(f"    <priority>{priority}</priority>")
+        lines.append("  </url>")
+
+    for name, changefreq, priority in STATIC_PAGES:
+        url(base_url + reverse(name), newest.get(name) or None, changefreq, priority)
+    for item in _newest(blog_items):
+        url(base_url + item["path"], item["updated"], "monthly", "0.7")
+    lines.append("</urlset>")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _last_modified(items):
+    stamps = [_parse(i["updated"]) for i in items if i.get("updated")]
+    stamps = [s for s in stamps if s]
+    return max(stamps).timestamp() if stamps else None
+
+
+def artifact(name, base_url):
+    """
+    {"body": bytes, "content_type", "etag", "last_modified": epoch seconds} for an artifact,
+    rendered from the item lists only when one of its sources changed.
+    """
+    sources, content_type = ARTIFACTS[name]
+    versions = ".".join(str(cache.get(_version_key(s), 0)) for s in sources)
+    key = f"feeds:artifact:{name}:{versions}:{hashlib.md5(base_url.encode('utf-8')).hexdigest()}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    states = {s: _state(s) for s in sources}
+    if name == "sitemap":
+        all_items = list(states["blogs"]["items"].values()) + list(states["cases"]["items"].values())
+        body = _render_sitemap(list(states["blogs"]["items"].values()), list(states["cases"]["items"].values()), base_url)
+    else:
+        all_items = list(states[sources[0]]["items"].values())
+        body = _render_feed(name, all_items, base_url)
+    result = {
+        "body": body,
+        "content_type": content_type,
+        "etag": '"' + hashlib.md5(body).hexdigest() + '"',
+        "last_modified": _last_modified(all_items) or time.time(),
+    }
+    # Keyed by the versions actually rendered (a rebuild above may have moved them)
+    versions = ".".join(str(states[s].get("version", 0)) for s in sources)
+    key = f"feeds:artifact:{name}:{versions}:{hashlib.md5(base_url.encode('utf-8')).hexdigest()}"
+    if all(states[s].get("version") for s in sources):
+        # Saved empty sources are cached too, but only until their next recheck
+        empty = any(not states[s]["items"] for s in sources)
+        cache.set(key, result, EMPTY_REBUILD_INTERVAL if empty else ARTIFACT_TTL)
+    return result
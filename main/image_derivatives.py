@@ -0,0 +1,139 @@
+"""
+Derived images for the media vault (thumbnails, WebP size ladder, placeholders).
+
+For every media_images row, generate() downloads the original from Storage once
+and writes, with Pillow:
+
+- a fixed-width JPEG thumbnail (THUMB_WIDTH) used as thumbnail_url;
+- WebP versions at each LADDER width narrower than the original, listed in the
+  row's variants column as [{"width", "height", "url"}, ...] for srcset;
+- a tiny blurred WebP placeholder (lqip) stored inline as a data: URI.
+
+Orientation is applied from EXIF and all metadata (EXIF, GPS, ICC, comments) is
+dropped from the output. Files go to the media-vault bucket under
+derived/images/<row id>/. The columns are added by
+migrations/media_images_derivatives.sql.
+
+dashboard_media_images_save calls generate_async() after inserting a row, which
+queues a job (main/jobs.py); the row shows the original until its derivatives
+are stored. Existing rows are backfilled with
+`python manage.py generate_image_derivatives`.
+"""
+import base64
+import io
+from datetime import datetime, timezone
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageFilter, ImageOps
+
+from . import storage_upload
+from . import supabase_rest
+
+BUCKET = "media-vault"
+FOLDER = "derived/images"
+LADDER = (320, 640, 1024, 1600)
+THUMB_WIDTH = 480
+LQIP_WIDTH = 24
+WEBP_QUALITY = 78
+JPEG_QUALITY = 80
+
+
+def _open(data):
+    img = Image.open(io.BytesIO(data))
+    if img.format == "JPEG":
+        # Let libjpeg decode at a reduced scale when the original is much larger than we need
+        img.draft("RGB", (LADDER[-1], LADDER[-1]))
+    img = ImageOps.exif_transpose(img)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+    return img
+
+
+def _resized(img, width):
+    if img.width <= width:
+        return img.copy()
+    height = max(1, round(img.height * width / img.width))
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def _encode(img, fmt):
+    img.info = {}   # no EXIF, ICC or comments carried into the output
+    out = io.BytesIO()
+    if fmt == "JPEG":
+        if img.mode == "RGBA":
+            flat = Image.new("RGB", img.size, (255, 255, 255))
+            flat.paste(img, mask=img.getchannel("A"))
+            img = flat
+        img.save(out, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        img.save(out, "WEBP", quality=WEBP_QUALITY, method=4)
+    return out.getvalue()
+
+
+def build(data):
+    """
+    Derivatives of an image's bytes, without uploading anything:
+    {"width", "height", "thumbnail": jpeg bytes, "ladder": [(width, height, webp bytes)], "lqip": data URI}.
+    """
+    img = _open(data)
+    widths = [w for w in LADDER if w < img.width] or [img.width]
+    if img.width < LADDER[-1] and img.width not in widths:
+        widths.append(img.width)   # the full-size WebP when the original is below the largest step
+
+    ladder = []
+    for width in widths:
+        variant = _resized(img, width)
+        ladder.append((variant.width, variant.height, _encode(variant, "WEBP")))
+
+    placeholder = _resized(img, LQIP_WIDTH).filter(ImageFilter.GaussianBlur(1))
+    lqip = "data:image/webp;base64," + base64.b64encode(_encode(placeholder, "WEBP")).decode("ascii")
+
+    return {
+        "width": img.width,
+        "height": img.height,
+        "thumbnail": _encode(_resized(img, THUMB_WIDTH), "JPEG"),
+        "ladder": ladder,
+        "lqip": lqip,
+    }
+
+
+def _store(path, data, content_type):
+    return storage_upload.upload(ContentFile(data), BUCKET, path, content_type, upsert=True)
+
+
+def generate(row_id, source_url):
+    """Build and store the derivatives of one media_images row, and record them on the row."""
+    resp = supabase_rest.get(source_url, timeout=60)
+    if resp.status_code != 200:
+        raise RuntimeError(f"Could not download {source_url}: {resp.status_code}")
+    derived = build(resp.content)
+
+    folder = f"{FOLDER}/{row_id}"
+    variants = [
+        {"width": w, "height": h, "url": _store(f"{folder}/{w}.webp", data, "image/webp")}
+        for w, h, data in derived["ladder"]
+    ]
+    payload = {
+        "thumbnail_url": _store(f"{folder}/thumb.jpg", derived["thumbnail"], "image/jpeg"),
+        "variants": variants,
+        "lqip": derived["lqip"],
+        "width": derived["width"],
+        "height": derived["height"],
+        "derivatives_at": datetime.now(timezone.utc).isoformat(),
+    }
+    resp = supabase_rest.update("media_images", {"id": f"eq.{row_id}"}, payload, returning=False)
+    if resp.status_code not in (200, 204):
+        raise RuntimeError(f"Recording derivatives failed: {resp.status_code} {resp.text[:200]}")
+    return payload
+
+
+def generate_async(row_id, source_url):
+    """Queue generate() for a row (see main/tasks.py); returns the job id."""
+    from . import jobs
+    return jobs.enqueue("media.image_derivatives", {"row_id": str(row_id), "source_url": source_url},
+                        idempotency_key=f"image-derivatives:{row_id}")
+
+
+def srcset(variants):
+    """"url 320w, url 640w, ..." for a row's variants."""
+    return ", ".join(f"{v['url']} {v['width']}w" for v in variants or [] if v.get("url") and v.get("width"))
@@ -0,0 +1,219 @@
+"""
+On-demand resized images: /img/<preset>/<bucket>/<path>.
+
+Avatars, leadership photos, blog images and YouTube/IG thumbnails are stored
+at upload size (member photos up to 5 MB) but shown as small cards. The proxy
+fetches the original from Storage (storage_upload.endpoint(), so a local
+Storage server can stand in), scales it down to a named preset with Pillow and
+re-encodes it as WebP (or JPEG for clients that don't accept WebP), without
+metadata.
+
+Results are kept on local disk under IMAGE_PROXY_CACHE_DIR. Hits refresh the
+file's mtime and, once IMAGE_PROXY_CACHE_MAX_BYTES is exceeded, the least
+recently used files are removed. Stored object paths are never rewritten in
+place (uploads are named after their content hash or get fresh names), so
+responses are sent as immutable.
+
+Templates use the `resized` filter: {{ member.profile_image_url|resized:"avatar" }}.
+URLs that are not public objects in our Storage, and SVG or GIF images, pass
+through unchanged.
+"""
+import hashlib
+import io
+import os
+import threading
+import time
+from urllib.parse import quote, unquote, urlsplit
+
+from django.conf import settings
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+from . import storage_upload
+from . import supabase_rest
+
+# preset -> box (width, height). The image is scaled down until it just covers
+# the box, keeping its aspect ratio; the page's CSS does the cropping.
+PRESETS = {
+    "avatar": (128, 128),     # dashboard lists, member chips
+    "profile": (480, 480),    # membership and leadership cards
+    "card": (640, 400),       # blog cards, YouTube/IG thumbnails
+    "wide": (1280, 720),      # featured blog images
+}
+BUCKETS = ("profiles", "leadership", "blogs", "messages", "media-vault", "settings")
+FORMATS = {"webp": "image/webp", "jpeg": "image/jpeg"}
+# Served as stored: Pillow can't read SVG, and re-encoding a GIF keeps only its first frame
+PASSTHROUGH_EXTENSIONS = (".svg", ".gif")
+VERSION = 1    # bump to re-render everything after changing the encoding
+TOUCH_INTERVAL = 3600
+
+_lock = threading.Lock()
+_written_since_sweep = 0
+
+
+class ProxyError(Exception):
+    def __init__(self, status, message=""):
+        super().__init__(message or str(status))
+        self.status = status
+
+
+def cache_dir():
+    return str(getattr(settings, "IMAGE_PROXY_CACHE_DIR", os.path.join(settings.BASE_DIR, "cache", "img")))
+
+
+def _max_bytes():
+    return getattr(settings, "IMAGE_PROXY_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+
+
+def _max_source_bytes():
+    return getattr(settings, "IMAGE_PROXY_MAX_SOURCE_BYTES", 25 * 1024 * 1024)
+
+
+def _cache_path(preset, bucket, path, fmt):
+    digest = hashlib.sha1(f"{VERSION}|{preset}|{bucket}|{path}|{fmt}".encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir(), digest[:2], f"{digest}.{fmt}")
+
+
+def _fetch(bucket, path):
+    url = f"{storage_upload.endpoint()}/object/public/{bucket}/{quote(path)}"
+    try:
+        resp = supabase_rest.get(url, stream=True, timeout=30)
+    except Exception as e:
+        raise ProxyError(502, f"Fetching {bucket}/{path} failed: {e}")
+    with resp:
+        if resp.status_code in (400, 404):
+            raise ProxyError(404)
+        if resp.status_code != 200:
+            raise ProxyError(502, f"Fetching {bucket}/{path} failed: {resp.status_code}")
+        data = bytearray()
+        for chunk in resp.iter_content(64 * 1024):
+            data += chunk
+            if len(data) > _max_source_bytes():
+                raise ProxyError(413, f"{bucket}/{path} is too large to resize")
+    return bytes(data)
+
+
+def _render(data, preset, fmt):
+    box_w, box_h = PRESETS[preset]
+    try:
+        img = Image.open(io.BytesIO(data))
+        if img.format == "JPEG":
+            img.draft("RGB", (box_w, box_h))
+        img = ImageOps.exif_transpose(img)
+    except Exception as e:
+        raise ProxyError(415, f"Not a readable image: {e}")
+
+    scale = max(box_w / img.width, box_h / img.height)
+    if scale < 1:
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))), Image.LANCZOS)
+
+    has_alpha = "A" in img.getbands() or "transparency" in img.info
+    out = io.BytesIO()
+    if fmt == "webp":
+        img = img.convert("RGBA" if has_alpha else "RGB")
+        img.info = {}
+        img.save(out, "WEBP", quality=80, method=4)
+    else:
+        if has_alpha:
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, (255, 255, 255))
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            img = img.convert("RGB")
+        img.info = {}
+        img.save(out, "JPEG", quality=82, optimize=True, progressive=True)
+    return out.getvalue()
+
+
+def _write(target, body):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(body)
+    os.replace(tmp, target)
+
+
+def sweep():
+    """Remove least recently used files until the cache is back under 90% of its limit."""
+    entries = []
+    total = 0
+    for root, _, files in os.walk(cache_dir()):
+        for name in files:
+            full = os.path.join(root, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, full))
+            total += st.st_size
+    limit = _max_bytes()
+    if total <= limit:
+        return 0
+    removed = 0
+    for _, size, full in sorted(entries):
+        if total <= limit * 0.9:
+            break
+        try:
+            os.remove(full)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def _note_written(size):
+    global _written_since_sweep
+    with _lock:
+        _written_since_sweep += size
+        # A full directory scan only every ~5% of the limit written
+        due = _written_since_sweep >= _max_bytes() / 20
+        if due:
+            _written_since_sweep = 0
+    if due:
+        sweep()
+
+
+def get(preset, bucket, path, fmt):
+    """Path of the cached rendition, rendering it on a miss. Raises ProxyError."""
+    if preset not in PRESETS or bucket not in BUCKETS or fmt not in FORMATS:
+        raise ProxyError(404)
+    if not path or ".." in path.split("/"):
+        raise ProxyError(404)
+
+    target = _cache_path(preset, bucket, path, fmt)
+    try:
+        st = os.stat(target)
+    except OSError:
+        st = None
+    if st is not None:
+        if time.time() - st.st_mtime > TOUCH_INTERVAL:
+            try:
+                os.utime(target)   # recently used
+            except OSError:
+                pass
+        return target
+
+    body = _render(_fetch(bucket, path), preset, fmt)
+    _write(target, body)
+    _note_written(len(body))
+    return target
+
+
+def url(value, preset):
+    """Proxy URL for a public Storage object URL, or the value unchanged for anything else."""
+    if not value or preset not in PRESETS:
+        return value
+    parts = urlsplit(str(value))
+    marker = "/storage/v1/object/public/"
+    if marker not in parts.path:
+        return value
+    own_hosts = {urlsplit(settings.SUPABASE_URL).netloc, urlsplit(storage_upload.endpoint()).netloc}
+    if parts.netloc not in own_hosts:
+        return value
+    bucket, _, path = parts.path.split(marker, 1)[1].partition("/")
+    if bucket not in BUCKETS or not path:
+        return value
+    if path.lower().endswith(PASSTHROUGH_EXTENSIONS):
+        return value
+    return reverse("resized_image", args=[preset, bucket, unquote(path)])
@@ -0,0 +1,304 @@
+"""
+Local background job queue, stored in SQLite.
+
+Views hand slow side effects (Storage uploads, emails, analytics writes, image
+processing) to enqueue() and return at once; `python manage.py run_jobs` runs
+them. Jobs live in the jobs_queue table of JOBS_DB (by default the project's
+own db.sqlite3), so queued work survives restarts and several workers can share
+one queue: a job is claimed inside a write transaction and leased for
+JOBS_LEASE_SECONDS. The worker renews the lease while the task runs, so only a
+job whose worker died is picked up again once the lease runs out.
+
+- A failing job is retried with exponential backoff (JOBS_BACKOFF_BASE doubled
+  per attempt, capped at JOBS_BACKOFF_MAX, with jitter) until max_attempts,
+  then marked failed with its last error.
+- enqueue() takes an optional idempotency key; enqueueing the same key again
+  returns the existing job instead of adding another, even once that job has
+  finished, so a key must identify one action (a member's welcome email, one
+  form submission), not a repeatable one.
+- status() (and the /api/jobs/<id>/ endpoint) reports a job's state, attempts,
+  last error and result.
+
+Paystack verification is deliberately not a job: signup, donation and renewal
+responses report whether the payment was accepted, and no member, donation or
+subscription row may be written for a reference Paystack has not confirmed.
+The emails sent after those payments are queued.
+
+Task functions are registered with @task("name") in main/tasks.py and receive
+the job's payload as keyword arguments; the payload and result must be JSON.
+With JOBS_EAGER = True jobs run inside enqueue() instead (development without
+a worker).
+"""
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+STATUSES = ("queued", "running", "done", "failed")
+
+_tasks = {}
+_ready = set()
+_ready_lock = threading.Lock()
+
+
+def task(name, max_attempts=None):
+    """Register a function as the task run for jobs called name."""
+    def decorator(fn):
+        _tasks[name] = {"fn": fn, "max_attempts": max_attempts}
+        return fn
+    return decorator
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _db_path():
+    return str(_setting("JOBS_DB", "") or settings.DATABASES["default"]["NAME"])
+
+
+def _connect():
+    path = _db_path()
+    # Autocommit; writes that must be atomic open their own BEGIN IMMEDIATE
+    conn = sqlite3.connect(path, timeout=15, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    with _ready_lock:
+        if path not in _ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs_queue ("
+                "id TEXT PRIMARY KEY, name TEXT NOT NULL, payload TEXT NOT NULL, "
+                "idempotency_key TEXT UNIQUE, status TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL, "
+                "run_at REAL NOT NULL, locked_until REAL, last_error TEXT, result TEXT, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_queue_due ON jobs_queue (status, run_at)")
+            _ready.add(path)
+    return conn
+
+
+def _backoff(attempts):
+    base = _setting("JOBS_BACKOFF_BASE", 10)
+    delay = min(base * (2 ** max(attempts - 1, 0)), _setting("JOBS_BACKOFF_MAX", 3600))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def enqueue(name, payload=None, idempotency_key=None, delay=0, max_attempts=None):
+    """
+    Queue a job and return its id. If a job with the same idempotency_key exists in any
+    state (queued, running, done or failed, until prune() removes it after JOBS_KEEP_DAYS),
+    that job's id is returned and nothing is queued: keys must name one logical action.
+    """
+    if name not in _tasks:
+        from . import tasks  # noqa: F401  (registers the tasks)
+    if name not in _tasks:
+        raise ValueError(f"Unknown job {name!r}")
+    max_attempts = max_attempts or _tasks[name]["max_attempts"] or _setting("JOBS_MAX_ATTEMPTS", 5)
+    job_id = uuid.uuid4().hex
+    now = time.time()
+
+    conn = _connect()
+    try:
+        cursor = conn.execute(
+            "INSERT INTO jobs_queue (id, name, payload, idempotency_key, status, max_attempts, run_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?) ON CONFLICT (idempotency_key) DO NOTHING",
+            (job_id, name, json.dumps(payload or {}), idempotency_key, max_attempts, now + delay, now, now),
+        )
+        if cursor.rowcount == 0:
+            row = conn.execute("SELECT id FROM jobs_queue WHERE idempotency_key = ?", (idempotency_key,)).fetchone()
+            return row["id"]
+    finally:
+        conn.close()
+
+    if _setting("JOBS_EAGER", False):
+        run_job(job_id)
+    return job_id
+
+
+def _claim(job_id=None):
+    """Lease the next due job (or job_id) to this worker. Returns its row or None."""
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        where = "(status = 'queued' AND run_at <= ?) OR (status = 'running' AND locked_until < ?)"
+        params = [now, now]
+        if job_id:
+            where = f"id = ? AND ({where})"
+            params.insert(0, job_id)
+        row = conn.execute(
+            f"SELECT * FROM jobs_queue WHERE {where} ORDER BY run_at LIMIT 1", params
+        ).fetchone()
+        if row is not None:
+            conn.execute(
+                "UPDATE jobs_queue SET status = 'running', attempts = attempts + 1, locked_until = ?, updated_at = ? "
+                "WHERE id = ?",
+                (now + _setting("JOBS_LEASE_SECONDS", 600), now, row["id"]),
+            )
+        conn.execute("COMMIT")
+        return row
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def _finish(job_id, status, run_at=None, error=None, result=None):
+    conn = _connect()
+    try:
+        conn.execute(
+            "UPDATE jobs_queue SET status = ?, run_at = COALESCE(?, run_at), locked_until = NULL, "
+            "last_error = ?, result = ?, updated_at = ? WHERE id = ?",
+            (status, run_at, error, json.dumps(result) if result is not None else None, time.time(), job_id),
+        )
+    finally:
+        conn.close()
+
+
+def _keep_leased(job_id, stop):
+    """
+    Renew a running job's lease every third of JOBS_LEASE_SECONDS until stop is set,
+    so a long task (a multi-GB resumable upload) is never handed to a second worker
+    while this one is still alive. Only a worker that died lets its lease run out.
+    """
+    lease = _setting("JOBS_LEASE_SECONDS", 600)
+    while not stop.wait(lease / 3):
+        try:
+            conn = _connect()
+            try:
+                conn.execute(
+                    "UPDATE jobs_queue SET locked_until = ?, updated_at = ? WHERE id = ? AND status = 'running'",
+                    (time.time() + lease, time.time(), job_id),
+                )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[Jobs] Lease renewal for {job_id} failed: {e}")
+
+
+def _execute(row):
+    spec = _tasks.get(row["name"])
+    attempts = row["attempts"] + 1
+    if spec is None:
+        _finish(row["id"], "failed", error=f"Unknown job {row['name']!r}")
+        return False
+    stop = threading.Event()
+    threading.Thread(target=_keep_leased, args=(row["id"], stop), name="jobs-lease", daemon=True).start()
+    try:
+        result = spec["fn"](**json.loads(row["payload"]))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"[:2000]
+        if attempts >= row["max_attempts"]:
+            print(f"[Jobs] {row['name']} {row['id']} failed for good after {attempts} attempt(s): {error}")
+            _finish(row["id"], "failed", error=error)
+        else:
+            retry_at = time.time() + _backoff(attempts)
+            print(f"[Jobs] {row['name']} {row['id']} attempt {attempts} failed, retrying: {error}")
+            _finish(row["id"], "queued", run_at=retry_at, error=error)
+        return False
+    finally:
+        stop.set()
+    _finish(row["id"], "done", result=result)
+    return True
+
+
+def run_job(job_id):
+    """Run one specific job now if it is due (used with JOBS_EAGER)."""
+    from . import tasks  # noqa: F401
+    row = _claim(job_id)
+    return _execute(row) if row is not None else None
+
+
+def run_next():
+    """Run the next due job. Returns False when there was none."""
+    from . import tasks  # noqa: F401
+    row = _claim()
+    if row is None:
+        return False
+    _execute(row)
+    return True
+
+
+def status(job_id):
+    """Public view of a job, or None if it does not exist."""
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT * FROM jobs_queue WHERE id = ?", (job_id,)).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "status": row["status"],
+        "attempts": row["attempts"],
+        "max_attempts": row["max_attempts"],
+        "last_error": row["last_error"],
+        "result": json.loads(row["result"]) if row["result"] else None,
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "next_run_at": row["run_at"] if row["status"] == "queued" else None,
+    }
+
+
+def _spool_dir():
+    return str(_setting("JOBS_SPOOL_DIR", os.path.join(settings.BASE_DIR, "cache", "spool")))
+
+
+def prune(older_than_days=None):
+    """
+    Delete finished jobs older than JOBS_KEEP_DAYS, and spooled files as old
+    (left by failed jobs or by duplicate submissions). Returns the number of jobs removed.
+    """
+    days = older_than_days if older_than_days is not None else _setting("JOBS_KEEP_DAYS", 7)
+    cutoff = time.time() - days * 86400
+    conn = _connect()
+    try:
+        cursor = conn.execute(
+            "DELETE FROM jobs_queue WHERE status IN ('done', 'failed') AND updated_at < ?", (cutoff,)
+        )
+        removed = cursor.rowcount
+    finally:
+        conn.close()
+
+    directory = _spool_dir()
+    for name in os.listdir(directory) if os.path.isdir(directory) else ():
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+    return removed
+
+
+# =====================================================
+# SPOOLED UPLOADS
+# =====================================================
+
+def spool(uploaded_file):
+    """
+    Copy an UploadedFile to the local spool directory (chunk by chunk) so a job can
+    upload it after the request has returned. Returns {"path", "name", "size", "content_type"}.
+    """
+    directory = _spool_dir()
+    os.makedirs(directory, exist_ok=True)
+    _, ext = os.path.splitext(uploaded_file.name or "")
+    path = os.path.join(directory, uuid.uuid4().hex + ext.lower()[:10])
+    with open(path, "wb") as fh:
+        for chunk in uploaded_file.chunks():
+            fh.write(chunk)
+    return {
+        "path": path,
+        "name": uploaded_file.name,
+        "size": uploaded_file.size,
+        "content_type": uploaded_file.content_type or "application/octet-stream",
+    }
@@ -0,0 +1,138 @@
+"""
+Section-level cache for the landing page.
+
+Each landing section (site content incl. hero video, latest media, YouTube/IG
+links, featured case, latest blogs) is cached on its own with its own TTL.
+Once a section goes stale the stale value is still served while a single
+background thread refreshes it. Dashboard views that edit a section call
+invalidate() (or use the @invalidates_landing decorator) so edits show at once.
+
+invalidate() also bumps the section's generation. A load that started before
+it is not stored (or is removed again right after storing), so a refresh that
+was already running can't put pre-edit data back for a whole TTL.
+"""
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Seconds a section is considered fresh. Override per section with LANDING_CACHE_TTLS in settings.
+DEFAULT_TTLS = {
+    "sections": 600,
+    "media_videos": 300,
+    "media_audio": 300,
+    "media_images": 300,
+    "media_documents": 300,
+    "links": 600,
+    "featured_cases": 300,
+    "latest_blogs": 300,
+    "stats": 300,
+}
+
+# Stale values are kept this long after they expire so they can be served during a refresh
+STALE_GRACE = 24 * 60 * 60
+
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def _key(section):
+    return f"landing:section:{section}"
+
+
+def _gen_key(section):
+    return f"landing:gen:{section}"
+
+
+def _generation(section):
+    return cache.get(_gen_key(section), 0)
+
+
+def _ttl(section):
+    overrides = getattr(settings, "LANDING_CACHE_TTLS", {}) or {}
+    return overrides.get(section, DEFAULT_TTLS.get(section, 300))
+
+
+def store(section, value, generation=None):
+    """
+    Cache a section's value. With generation (read before the value was loaded), the
+    value is dropped if the section was invalidated in the meantime.
+    """
+    if generation is not None and _generation(section) != generation:
+        return False
+    cache.set(_key(section), (value, time.time() + _ttl(section)), _ttl(section) + STALE_GRACE)
+    if generation is not None and _generation(section) != generation:
+        # invalidate() ran between the check and the set
+        cache.delete(_key(section))
+        return False
+    return True
+
+
+def _refresh_in_background(section, loader):
+    with _refreshing_lock:
+        if section in _refreshing:
+            return
+        _refreshing.add(section)
+
+    def run():
+        try:
+            generation = _generation(section)
+            store(section, loader(), generation)
+        except Exception as e:
+            print(f"[Landing Cache] Refresh of {section} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(section)
+
+    threading.Thread(target=run, name=f"landing-refresh-{section}", daemon=True).start()
+
+
+def get_section(section, loader, block=True, default=None):
+    """
+    Cached value for a landing section. loader() is called synchronously on a miss,
+    and in the background when the cached value is stale. With block=False a miss
+    returns default and fills the cache in the background instead.
+    """
+    entry = cache.get(_key(section))
+    if entry is None:
+        if not block:
+            _refresh_in_background(section, loader)
+            return default
+        generation = _generation(section)
+        value = loader()
+        store(section, value, generation)
+        return value
+    value, fresh_until = entry
+    if time.time() >= fresh_until:
+        _refresh_in_background(section, loader)
+    return value
+
+
+def invalidate(*sections):
+    """
+    Drop cached sections so the next landing render refetches them. No args drops
+    every section with a TTL in DEFAULT_TTLS or LANDING_CACHE_TTLS; other sections
+    must be named.
+    """
+    if not sections:
+        sections = set(DEFAULT_TTLS) | set(getattr(settings, "LANDING_CACHE_TTLS", {}) or {})
+    generation = time.time_ns()
+    cache.set_many({_gen_key(s): generation for s in sections}, None)
+    cache.delete_many([_key(s) for s in sections])
+
+
+def invalidates_landing(*sections):
+    """View decorator: invalidate the given landing sections after the view handles the request."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = view_func(request, *args, **kwargs)
+            try:
+                invalidate(*sections)
+            except Exception as e:
+                print(f"[Landing Cache] Invalidate {sections} failed: {e}")
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,88 @@
+import gc
+import random
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand
+
+from main import records
+
+
+def _legacy_decode(row, keys):
+    # The per-view loop records.decode_rows() replaced
+    for key in keys:
+        val = row.get(key)
+        if val and isinstance(val, str) and val.strip():
+            try:
+                if "T" in val:
+                    row[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
+                else:
+                    row[key] = datetime.strptime(val, "%Y-%m-%d").date()
+            except (ValueError, TypeError):
+                row[key] = None
+
+
+def _fake_rows(table, n):
+    start = datetime(2023, 1, 1)
+    rows = []
+    for i in range(n):
+        ts = start + timedelta(minutes=random.randint(0, 900_000))
+        if table == "cases":
+            rows.append({
+                "id": i,
+                "date_reported": ts.strftime("%Y-%m-%d"),
+                "created_at": ts.isoformat() + "Z",
+                "updated_at": ts.isoformat() + "+00:00",
+                "tags": ["justice", "lagos"],
+            })
+        else:
+            rows.append({
+                "id": i,
+                "start_date": ts.isoformat() + "+00:00",
+                "end_date": (ts + timedelta(days=365)).isoformat() + "+00:00",
+                "created_at": ts.isoformat() + "Z",
+            })
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark: per-row cost of records.decode_rows() on large payment and case lists."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=20000, help="Rows per table (default 20000).")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is reported.")
+
+    def _best(self, repeat, make_rows, fn):
+        best = None
+        for _ in range(repeat):
+            rows = make_rows()
+            gc.collect()
+            gc.disable()  # as timeit does, so collection pauses don't land in one side
+            try:
+                t0 = time.perf_counter()
+                fn(rows)
+                elapsed = time.perf_counter() - t0
+            finally:
+                gc.enable()
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def handle(self, *args, **options):
+        n, repeat = options["rows"], options["repeat"]
+        self.stdout.write(f"{n} rows, best of {repeat} runs (microseconds per row)")
+        for table in ("member_subscriptions", "cases"):
+            base = _fake_rows(table, n)
+            keys = [c for c, kind in records.SCHEMAS[table].items() if kind != "tags"]
+            fresh = lambda: [dict(r) for r in base]
+
+            legacy = self._best(repeat, fresh, lambda rows: [_legacy_decode(r, keys) for r in rows])
+            decoded = self._best(repeat, fresh, lambda rows: records.decode_rows(table, rows))
+            # Rows that come back decoded from a cache are only type-checked
+            warm = records.decode_rows(table, fresh())
+            cached = self._best(repeat, lambda: warm, lambda rows: records.decode_rows(table, rows))
+
+            self.stdout.write(
+                f"{table:22} legacy loop {legacy / n * 1e6:6.2f}  "
+                f"decode_rows {decoded / n * 1e6:6.2f}  "
+                f"already decoded {cached / n * 1e6:6.2f}"
+            )
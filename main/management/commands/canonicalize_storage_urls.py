@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main import storage_urls, supabase_rest
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite every stored Supabase Storage URL column to its canonical public URL, in batches. "
+        "Set STORAGE_URLS_CANONICAL=true afterwards so pages skip URL processing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200, help="Rows fetched per request (default 200).")
+        parser.add_argument("--table", action="append", choices=sorted(storage_urls.STORED_URL_COLUMNS),
+                            help="Only process this table (repeatable). Defaults to all tables.")
+        parser.add_argument("--dry-run", action="store_true", help="Report changes without writing them.")
+
+    def handle(self, *args, **options):
+        tables = options["table"] or list(storage_urls.STORED_URL_COLUMNS)
+        total = 0
+        for table in tables:
+            try:
+                changed = self._canonicalize_table(table, options["batch_size"], options["dry_run"])
+            except Exception as e:
+                raise CommandError(f"Failed to canonicalize {table}: {e}")
+            total += changed
+            self.stdout.write(f"{table}: {changed} row(s) {'would be ' if options['dry_run'] else ''}updated")
+
+        verb = "would be rewritten" if options["dry_run"] else "rewritten"
+        self.stdout.write(self.style.SUCCESS(f"Done: {total} row(s) {verb}."))
+
+    def _canonicalize_table(self, table, batch_size, dry_run):
+        bucket, columns = storage_urls.STORED_URL_COLUMNS[table]
+        select_columns = ",".join(("id",) + columns)
+        changed = 0
+        last_id = None
+        while True:
+            # Keyset pagination on id, so rows rewritten in this run never shift the pages
+            filters = {"id": f"gt.{last_id}"} if last_id is not None else None
+            rows = supabase_rest.select(table, columns=select_columns, filters=filters, order="id.asc", limit=batch_size)
+            if not rows:
+                break
+            for row in rows:
+                payload = {}
+                for column in columns:
+                    value = row.get(column)
+                    canonical = storage_urls.resolve(value, bucket)
+                    if value and canonical != value:
+                        payload[column] = canonical
+                if not payload:
+                    continue
+                changed += 1
+                if dry_run:
+                    self.stdout.write(f"  {table} {row['id']}: {payload}")
+                    continue
+                resp = supabase_rest.update(table, {"id": f"eq.{row['id']}"}, payload, returning=False)
+                if resp.status_code not in (200, 204):
+                    raise CommandError(f"PATCH {table} {row['id']} failed: {resp.status_code} {resp.text[:200]}")
+            last_id = rows[-1]["id"]
+            if len(rows) < batch_size:
+                break
+        return changed
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main import related_posts
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute related posts (TF-IDF over title/excerpt/content plus tag overlap) for every published blog "
+        "and store the top RELATED_POSTS_TOP_K in blog_related_posts. Saves refresh affected posts afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--post", action="append",
+                            help="Only recompute this blog id and the posts it affects (repeatable).")
+
+    def handle(self, *args, **options):
+        try:
+            if options["post"]:
+                stored = sum(related_posts.recompute_for(post_id) for post_id in options["post"])
+            else:
+                stored = related_posts.compute_all()
+        except Exception as e:
+            raise CommandError(f"Computing related posts failed: {e}")
+        self.stdout.write(self.style.SUCCESS(f"Done: related posts stored for {stored} post(s)."))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main import image_derivatives
+from main import storage_urls
+from main import supabase_rest
+from main.landing_cache import invalidate
+from main.page_cache import purge
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate thumbnails, WebP size ladders and placeholders for media_images rows that have none yet "
+        "(see main/image_derivatives.py). New uploads get them automatically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--id", action="append", help="Only (re)generate this image id (repeatable).")
+        parser.add_argument("--all", action="store_true", help="Regenerate every active image, not just missing ones.")
+
+    def handle(self, *args, **options):
+        filters = {"status": "eq.active"}
+        if options["id"]:
+            filters = {"id": f"in.({','.join(options['id'])})"}
+        elif not options["all"]:
+            filters["derivatives_at"] = "is.null"
+        rows = supabase_rest.select("media_images", columns="id,file_url", filters=filters, order="created_at.asc")
+        storage_urls.canonicalize_rows(rows, "media_images")
+        if not rows:
+            self.stdout.write("No images to process.")
+            return
+
+        failed = 0
+        for row in rows:
+            if not row.get("file_url"):
+                continue
+            try:
+                image_derivatives.generate(row["id"], row["file_url"])
+                self.stdout.write(f"  {row['id']}")
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"  {row['id']} failed: {e}")
+        purge("media")
+        invalidate("media_images")
+        if failed == len(rows):
+            raise CommandError("Generating image derivatives failed for every image.")
+        self.stdout.write(self.style.SUCCESS(f"Done: derivatives for {len(rows) - failed} of {len(rows)} image(s)."))
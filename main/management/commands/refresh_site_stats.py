@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main import site_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the landing page statistics snapshot (run from cron every few minutes)."
+
+    def handle(self, *args, **options):
+        try:
+            snapshot = site_stats.refresh()
+        except Exception as e:
+            raise CommandError(f"Failed to refresh site statistics: {e}")
+        self.stdout.write(self.style.SUCCESS(f"Site statistics refreshed: {snapshot}"))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from main import jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs queued by the site (uploads, emails, message tracking, image processing). "
+        "Keep one or more of these running next to the web workers; see main/jobs.py."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run every job that is due now, then exit.")
+        parser.add_argument("--poll", type=float, default=1.0, help="Seconds to wait when the queue is empty.")
+
+    def handle(self, *args, **options):
+        ran = 0
+        last_prune = 0
+        try:
+            while True:
+                if time.time() - last_prune > 3600:
+                    jobs.prune()
+                    last_prune = time.time()
+                if jobs.run_next():
+                    ran += 1
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["poll"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Done: ran {ran} job(s)."))
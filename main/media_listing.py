@@ -0,0 +1,198 @@
+"""
+Keyset-paginated media vault listings (videos, audios, images, documents).
+
+The public media pages render the first page and then load the rest through
+/api/media/<kind>/ as the visitor scrolls. Both read the same pages: the
+columns a card needs, newest first, with an opaque (created_at, id) cursor so a
+page costs the same however deep into the vault it is. The category filter is
+applied by PostgREST, not in Python.
+
+Videos are shown grouped by month. The month buckets (key, label, item count)
+come from the media_month_buckets RPC (migrations/media_vault_listing.sql), so
+the grouping boundaries are computed by Postgres; every item carries its
+month_key / month_label.
+
+Pages and buckets are cached with the "media" page-cache tag version in the key,
+so the dashboard media views' purge retires them too.
+"""
+import base64
+import calendar
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import storage_urls
+from . import supabase_rest
+from .page_cache import tags_version
+
+KINDS = {
+    "videos": {
+        "table": "media_videos",
+        "columns": "id,title,description,category,thumbnail_url,video_link,file_url,duration,speaker,created_at",
+        "filters": {"status": "eq.active"},
+        "template": "partials/media_video_card.html",
+        "context_name": "video",
+    },
+    "audios": {
+        "table": "media_audio",
+        "columns": "id,title,description,category,file_url,duration,speaker,created_at",
+        "filters": {"is_archived": "eq.false"},
+        "template": "partials/media_audio_card.html",
+        "context_name": "audio",
+    },
+    "images": {
+        "table": "media_images",
+        "columns": "id,title,description,category,file_url,thumbnail_url,variants,lqip,width,height,location,created_at",
+        "filters": {"status": "eq.active"},
+        "template": "partials/media_image_card.html",
+        "context_name": "image",
+    },
+    "documents": {
+        "table": "media_documents",
+        "columns": "id,title,description,category,file_url,author,created_at",
+        # Only non-confidential documents are public
+        "filters": {"is_archived": "eq.false", "is_confidential": "eq.false"},
+        "template": "partials/media_document_card.html",
+        "context_name": "doc",
+    },
+}
+ORDER = "created_at.desc,id.desc"
+
+
+def page_size():
+    return getattr(settings, "MEDIA_PAGE_SIZE", 24)
+
+
+def _ttl():
+    return getattr(settings, "MEDIA_LIST_CACHE_TTL", 120)
+
+
+def encode_cursor(row):
+    raw = json.dumps([row.get("created_at"), row.get("id")], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token):
+    """(created_at, id) from a cursor token, or None if it is missing or malformed."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        created_at, row_id = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    if not created_at or row_id is None:
+        return None
+    return created_at, row_id
+
+
+def _quote(value):
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _category(category):
+    return "" if not category or category == "all" else category
+
+
+def _filters(spec, category, cursor):
+    filters = dict(spec["filters"])
+    if category:
+        filters["category"] = f"eq.{category}"
+    if cursor:
+        created_at, row_id = cursor
+        ts = _quote(created_at)
+        filters["or"] = f"(created_at.lt.{ts},and(created_at.eq.{ts},id.lt.{_quote(row_id)}))"
+    return filters
+
+
+def _month_label(key):
+    try:
+        year, month = key.split("-")
+        return f"{calendar.month_name[int(month)]} {year}"
+    except (ValueError, IndexError):
+        return "Unknown"
+
+
+def months(kind, category=""):
+    """[{"key": "YYYY-MM", "label": "March 2024", "count": n}, ...] newest first, for the whole listing."""
+    spec = KINDS[kind]
+    category = _category(category)
+    key = f"media:months:{tags_version('media')}:{kind}:{hashlib.md5(category.encode('utf-8')).hexdigest()}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    resp = supabase_rest.rpc("media_month_buckets", {"p_table": spec["table"], "p_category": category or None})
+    if resp.status_code != 200:
+        print(f"[Media Listing] media_month_buckets failed: {resp.status_code} {resp.text[:200]}")
+        return []
+    buckets = [
+        {"key": b["month_key"], "label": b["month_label"], "count": int(b["item_count"] or 0)}
+        for b in resp.json()
+    ]
+    if buckets:
+        cache.set(key, buckets, _ttl())
+    return buckets
+
+
+def _load_page(kind, category, cursor, size):
+    spec = KINDS[kind]
+    rows = supabase_rest.select(
+        spec["table"],
+        columns=spec["columns"],
+        filters=_filters(spec, category, cursor),
+        order=ORDER,
+        limit=size + 1,
+    )
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = encode_cursor(rows[-1]) if has_more and rows else None
+    storage_urls.canonicalize_rows(rows, spec["table"])
+
+    labels = {b["key"]: b["label"] for b in months(kind, category)} if kind == "videos" else {}
+    for row in rows:
+        # created_at comes back in UTC, the same zone the RPC buckets by
+        month_key = (row.get("created_at") or "")[:7] or "unknown"
+        row["month_key"] = month_key
+        row["month_label"] = labels.get(month_key) or _month_label(month_key)
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+def fetch_page(kind, category="", cursor_token=None, size=None):
+    """
+    One page of a media listing as {"items": [...], "next_cursor": str|None}.
+    cursor_token is the next_cursor of the previous page; None starts from the newest item.
+    """
+    size = size or page_size()
+    category = _category(category)
+    cursor = decode_cursor(cursor_token)
+    digest = hashlib.md5(f"{category}|{cursor_token if cursor else ''}|{size}".encode("utf-8")).hexdigest()
+    key = f"media:list:{tags_version('media')}:{kind}:{digest}"
+    try:
+        page = cache.get(key)
+    except Exception as e:
+        print(f"[Media Listing] Cache read failed: {e}")
+        page = None
+    if page is not None:
+        return page
+
+    page = _load_page(kind, category, cursor, size)
+    if not page["items"]:
+        # Could be a failed request; don't pin an empty page in the cache
+        return page
+    try:
+        cache.set(key, page, _ttl())
+    except Exception as e:
+        print(f"[Media Listing] Cache write failed: {e}")
+    return page
+
+
+def group_by_month(items):
+    """Consecutive items of a page grouped as [(month_key, [{"video", "month_label", "month_key"}, ...]), ...]."""
+    groups = []
+    for item in items:
+        if not groups or groups[-1][0] != item["month_key"]:
+            groups.append((item["month_key"], []))
+        groups[-1][1].append({"video": item, "month_label": item["month_label"], "month_key": item["month_key"]})
+    return groups
@@ -0,0 +1,106 @@
+"""
+Featured-member sampler for the landing page profile cards.
+
+Keeps the pool of active members (card columns only) in process memory, split
+into members with and without a profile image, and serves a fresh random pick
+per request without touching Supabase. The pool is reloaded every
+FEATURED_MEMBERS_POOL_TTL seconds, or as soon as invalidate() is called after
+a membership change (the version key lives in the shared cache so every
+worker sees it).
+"""
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import storage_urls
+from . import supabase_rest
+
+CARD_COLUMNS = "member_id,full_name,membership_type,state,country,based_in_nigeria,profile_image_url"
+VERSION_KEY = "member_sampler:version"
+
+_pool = None  # {"version", "loaded_at", "with_image", "without_image"}
+_lock = threading.Lock()
+_refreshing = False
+
+
+def _load_pool(version):
+    rows = supabase_rest.select("members", columns=CARD_COLUMNS, filters={"status": "eq.active"})
+    storage_urls.canonicalize_rows(rows, "members")
+    with_image, without_image = [], []
+    for m in rows:
+        (with_image if m.get("profile_image_url") else without_image).append(m)
+    return {
+        "version": version,
+        "loaded_at": time.time(),
+        "with_image": with_image,
+        "without_image": without_image,
+    }
+
+
+def _refresh(version):
+    global _pool, _refreshing
+    try:
+        pool = _load_pool(version)
+        with _lock:
+            _pool = pool
+    except Exception as e:
+        print(f"[Member Sampler] Refresh failed: {e}")
+    finally:
+        _refreshing = False
+
+
+def _current_pool():
+    """Pool for this process; reloads synchronously only when there is none yet."""
+    global _refreshing
+    version = cache.get(VERSION_KEY, 0)
+    pool = _pool
+    if pool is None:
+        _refresh(version)
+        return _pool
+    ttl = getattr(settings, "FEATURED_MEMBERS_POOL_TTL", 600)
+    if (pool["version"] != version or time.time() - pool["loaded_at"] > ttl) and not _refreshing:
+        with _lock:
+            if not _refreshing:
+                _refreshing = True
+                threading.Thread(target=_refresh, args=(version,), name="member-sampler", daemon=True).start()
+    return pool
+
+
+def _pick(items, k):
+    return random.sample(items, min(k, len(items)))
+
+
+def sample(k=4, prefer_images=None):
+    """
+    k random active members for profile cards. With prefer_images (default from
+    FEATURED_MEMBERS_PREFER_IMAGES) members with a photo are picked first.
+    """
+    pool = _current_pool()
+    if not pool:
+        return []
+    if prefer_images is None:
+        prefer_images = getattr(settings, "FEATURED_MEMBERS_PREFER_IMAGES", False)
+
+    with_image, without_image = pool["with_image"], pool["without_image"]
+    if prefer_images:
+        picked = _pick(with_image, k)
+        if len(picked) < k:
+            picked += _pick(without_image, k - len(picked))
+    else:
+        # Uniform over both lists without concatenating them
+        total = len(with_image) + len(without_image)
+        indexes = random.sample(range(total), min(k, total))
+        picked = [with_image[i] if i < len(with_image) else without_image[i - len(with_image)] for i in indexes]
+    # Copies so callers can't mutate the shared pool
+    return [dict(m) for m in picked]
+
+
+def invalidate():
+    """Mark the pool stale in every worker (call after members are added, changed or removed)."""
+    try:
+        cache.set(VERSION_KEY, time.time(), None)
+    except Exception as e:
+        print(f"[Member Sampler] Invalidate failed: {e}")
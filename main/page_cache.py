@@ -0,0 +1,134 @@
+"""
+Full-page cache for public pages viewed by anonymous visitors.
+
+@cache_public_page(ttl, tags=(...), params=(...)) caches the rendered HTML of a
+GET for visitors without an authenticated session. The cache key varies on the
+view arguments and only on the whitelisted query params, so tracking params
+don't fragment the cache.
+
+Invalidation is tag based: every tag has a version number in the shared cache
+and the versions are part of the key, so purge("blogs") makes every page tagged
+"blogs" miss on its next request. Dashboard save/delete views call purge() via
+the @purges_pages decorator.
+
+The donate form on every page carries a CSRF token, so the token is swapped for
+a placeholder before storing and the visitor's own token is put back on serve.
+"""
+import hashlib
+import re
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+
+KEY_PREFIX = "page"
+CSRF_PLACEHOLDER = "__PAGE_CACHE_CSRF_TOKEN__"
+_csrf_input = re.compile(rb'(name="csrfmiddlewaretoken" value=")[^"]*(")')
+
+
+def _is_anonymous(request):
+    if request.session.get("is_authenticated"):
+        return False
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return False
+    # Pending flash messages are per visitor; don't serve or store a shared page
+    if request.COOKIES.get("messages") or request.session.get("_messages"):
+        return False
+    return True
+
+
+def _tag_key(tag):
+    return f"{KEY_PREFIX}:tag:{tag}"
+
+
+def _tag_versions(tags):
+    if not tags:
+        return ""
+    keys = [_tag_key(t) for t in tags]
+    versions = cache.get_many(keys)
+    return ".".join(str(versions.get(k, 0)) for k in keys)
+
+
+def _page_key(view_name, tags, params, request, args, kwargs):
+    parts = [view_name, repr(args), repr(sorted(kwargs.items()))]
+    for name in params:
+        parts.append(f"{name}={request.GET.get(name, '')}")
+    digest = hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}:{view_name}:{_tag_versions(tags)}:{digest}"
+
+
+def cache_public_page(ttl, tags=(), params=(), on_hit=None):
+    """
+    Cache a public view's HTML for anonymous GETs.
+
+    ttl: seconds. tags: purge groups this page belongs to. params: query params that
+    change the page (all others are ignored). on_hit(request, *args, **kwargs) runs
+    when a cached copy is served, for side effects such as view counters.
+    """
+    def decorator(view_func):
+        view_name = view_func.__name__
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD") or not _is_anonymous(request):
+                return view_func(request, *args, **kwargs)
+
+            try:
+                key = _page_key(view_name, tags, params, request, args, kwargs)
+                cached = cache.get(key)
+            except Exception as e:
+                print(f"[Page Cache] Lookup failed for {view_name}: {e}")
+                return view_func(request, *args, **kwargs)
+
+            if cached is not None:
+                content, content_type = cached
+                content = content.replace(CSRF_PLACEHOLDER.encode(), get_token(request).encode())
+                response = HttpResponse(content, content_type=content_type)
+                response["X-Page-Cache"] = "HIT"
+                if on_hit:
+                    try:
+                        on_hit(request, *args, **kwargs)
+                    except Exception as e:
+                        print(f"[Page Cache] on_hit failed for {view_name}: {e}")
+                return response
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not getattr(response, "streaming", False) and not response.cookies:
+                try:
+                    content = _csrf_input.sub(rb"\1" + CSRF_PLACEHOLDER.encode() + rb"\2", response.content)
+                    cache.set(key, (content, response.get("Content-Type", "text/html; charset=utf-8")), ttl)
+                except Exception as e:
+                    print(f"[Page Cache] Store failed for {view_name}: {e}")
+                response["X-Page-Cache"] = "MISS"
+            return response
+        return wrapper
+    return decorator
+
+
+def tags_version(*tags):
+    """Current version string of the given tags; put it in the key of data cached alongside tagged pages."""
+    return _tag_versions(tags)
+
+
+def purge(*tags):
+    """Invalidate every cached page carrying any of the given tags."""
+    for tag in tags:
+        try:
+            cache.set(_tag_key(tag), time.time_ns(), None)
+        except Exception as e:
+            print(f"[Page Cache] Purge {tag} failed: {e}")
+
+
+def purges_pages(*tags):
+    """View decorator: purge the given page tags after the view handles the request."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            response = view_func(request, *args, **kwargs)
+            purge(*tags)
+            return response
+        return wrapper
+    return decorator
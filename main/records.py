@@ -0,0 +1,109 @@
+"""
+Schema-driven row decoder for Supabase rows.
+
+PostgREST returns timestamps, dates and arrays as JSON strings/lists. SCHEMAS
+declares the typed columns of each table once, and decode_rows() converts them
+in place right after a fetch, so views and templates get datetime/date objects
+and tag lists without each view carrying its own parse loop.
+
+Decoded records are plain dicts of picklable values, so they can go straight
+into the landing/page caches; decoding only touches str values, which makes a
+second pass over an already decoded row a no-op.
+
+Column types:
+    "timestamp"  ISO timestamp (or plain date) -> datetime
+    "date"       plain YYYY-MM-DD -> date; a full timestamp -> datetime
+    "tags"       text[] / comma separated string -> list of str
+Values that fail to parse become None, as the per-view loops did.
+"""
+from datetime import date, datetime
+
+from . import supabase_rest
+
+SCHEMAS = {
+    "blogs": {
+        "published_at": "date",
+        "created_at": "date",
+        "updated_at": "date",
+        "tags": "tags",
+    },
+    "cases": {
+        "date_reported": "date",
+        "created_at": "date",
+        "updated_at": "date",
+        "tags": "tags",
+    },
+    "member_subscriptions": {
+        "start_date": "timestamp",
+        "end_date": "timestamp",
+        "created_at": "timestamp",
+    },
+    "donations": {
+        "created_at": "timestamp",
+    },
+    "members": {
+        "created_at": "timestamp",
+    },
+}
+
+
+def _timestamp(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _date(value):
+    if "T" in value:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # date.fromisoformat is several times faster than strptime for YYYY-MM-DD
+    return date.fromisoformat(value)
+
+
+def _tags(value):
+    # Postgres array literal "{a,b}" or a plain comma separated string
+    return [t.strip().strip('"') for t in value.strip("{}").split(",") if t.strip()]
+
+
+_DECODERS = {
+    "timestamp": _timestamp,
+    "date": _date,
+    "tags": _tags,
+}
+
+# table -> [(column, decoder)], built once so decoding a row is a flat loop
+_PLANS = {
+    table: [(column, _DECODERS[kind]) for column, kind in columns.items()]
+    for table, columns in SCHEMAS.items()
+}
+
+
+def decode(table, row):
+    """Decode the typed columns of one row of table in place. Returns the row."""
+    decode_rows(table, [row])
+    return row
+
+
+def decode_rows(table, rows):
+    """Decode every row of a list from table in place. Returns the list."""
+    plan = _PLANS.get(table)
+    if not plan:
+        return rows
+    for row in rows:
+        for column, decoder in plan:
+            value = row.get(column)
+            if value.__class__ is not str or not value.strip():
+                continue
+            try:
+                row[column] = decoder(value)
+            except (ValueError, TypeError):
+                row[column] = None
+    return rows
+
+
+def select(table, **kwargs):
+    """supabase_rest.select() with the rows already decoded."""
+    return decode_rows(table, supabase_rest.select(table, **kwargs))
+
+
+def strftime(value, fmt, default=""):
+    """Format a decoded date/datetime column, or return default when it is empty or unparsable."""
+    return value.strftime(fmt) if value else default
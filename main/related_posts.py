@@ -0,0 +1,204 @@
+"""
+Precomputed related posts for blog_detail.
+
+Relatedness is TF-IDF cosine similarity over title, excerpt and content plus
+tag overlap (Jaccard). compute_all() scores every published post against the
+others through an inverted index and stores the top RELATED_POSTS_TOP_K per
+post in the blog_related_posts table (see migrations/blog_related_posts.sql)
+and in the shared cache. Run it with `python manage.py compute_related_posts`.
+
+When a post is saved or deleted, recompute_async() reruns the computation only
+for that post and the posts it affects (those similar to it, and those whose
+stored list mentions it). blog_detail reads the stored list with get(): a cache
+hit, or one primary-key lookup.
+"""
+import math
+import threading
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import strip_tags
+
+from . import records
+from . import storage_urls
+from . import supabase_rest
+from .blog_search import tokenize
+
+TABLE = "blog_related_posts"
+CORPUS_COLUMNS = "id,title,slug,excerpt,content,tags,category,featured_image_url,reading_time,published_at"
+CARD_KEYS = ("id", "title", "slug", "category", "featured_image_url", "reading_time", "published_at")
+FALLBACK_TTL = 3600   # cached same-category list for posts without computed related posts
+
+TEXT_WEIGHT = 0.75
+TAG_WEIGHT = 0.25
+TITLE_REPEAT = 3      # title terms count this many times
+MAX_TERMS = 150       # strongest terms kept per post; bounds the pairwise cost
+
+
+def top_k():
+    return getattr(settings, "RELATED_POSTS_TOP_K", 5)
+
+
+def _cache_key(post_id):
+    return f"blog:related:{post_id}"
+
+
+def _load_corpus():
+    rows = supabase_rest.select("blogs", columns=CORPUS_COLUMNS, filters={"is_published": "eq.true"})
+    return {str(r["id"]): r for r in rows}
+
+
+def _tags(row):
+    tags = row.get("tags") or []
+    if isinstance(tags, str):
+        tags = records.decode("blogs", {"tags": tags})["tags"] or []
+    return {t.strip().lower() for t in tags if t and t.strip()}
+
+
+def _vectors(corpus):
+    """L2-normalised TF-IDF vectors {post id: {term: weight}}."""
+    term_counts = {}
+    df = {}
+    for post_id, row in corpus.items():
+        text = " ".join(
+            [row.get("title") or ""] * TITLE_REPEAT
+            + [row.get("excerpt") or "", strip_tags(row.get("content") or "")]
+        )
+        counts = {}
+        for term in tokenize(text):
+            if len(term) > 1:
+                counts[term] = counts.get(term, 0) + 1
+        term_counts[post_id] = counts
+        for term in counts:
+            df[term] = df.get(term, 0) + 1
+
+    n = len(corpus)
+    vectors = {}
+    for post_id, counts in term_counts.items():
+        weights = {t: (1 + math.log(c)) * math.log((1 + n) / (1 + df[t])) for t, c in counts.items()}
+        weights = dict(sorted(weights.items(), key=lambda x: x[1], reverse=True)[:MAX_TERMS])
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors[post_id] = {t: w / norm for t, w in weights.items() if w > 0}
+    return vectors
+
+
+def _scores_for(targets, corpus, vectors, tagsets):
+    """{target id: [(score, other id), ...] best first, top K}."""
+    postings = {}
+    for post_id, vec in vectors.items():
+        for term, w in vec.items():
+            postings.setdefault(term, []).append((post_id, w))
+    tag_index = {}
+    for post_id, tags in tagsets.items():
+        for tag in tags:
+            tag_index.setdefault(tag, []).append(post_id)
+
+    k = top_k()
+    result = {}
+    for target in targets:
+        if target not in corpus:
+            continue
+        dots = {}
+        for term, w in vectors.get(target, {}).items():
+            for other, w2 in postings.get(term, ()):
+                if other != target:
+                    dots[other] = dots.get(other, 0.0) + w * w2
+        scores = {other: TEXT_WEIGHT * dot for other, dot in dots.items()}
+        mine = tagsets.get(target, set())
+        shared = {other for tag in mine for other in tag_index.get(tag, ()) if other != target}
+        for other in shared:
+            theirs = tagsets[other]
+            scores[other] = scores.get(other, 0.0) + TAG_WEIGHT * len(mine & theirs) / len(mine | theirs)
+        ranked = sorted(((s, other) for other, s in scores.items() if s > 0), reverse=True)[:k]
+        result[target] = ranked
+    return result
+
+
+def _entry(row, score):
+    entry = {key: row.get(key) for key in CARD_KEYS}
+    entry["id"] = str(entry["id"])
+    entry["score"] = round(score, 4)
+    return entry
+
+
+def _store(lists, corpus):
+    now = datetime.now(timezone.utc).isoformat()
+    payload = []
+    for post_id, ranked in lists.items():
+        related = [_entry(corpus[other], score) for score, other in ranked]
+        payload.append({"blog_id": post_id, "related": related, "computed_at": now})
+        cache.set(_cache_key(post_id), related, None)
+    for start in range(0, len(payload), 200):
+        resp = supabase_rest.upsert(TABLE, payload[start:start + 200], on_conflict="blog_id", returning=False)
+        if resp.status_code not in (200, 201, 204):
+            raise RuntimeError(f"Storing related posts failed: {resp.status_code} {resp.text[:200]}")
+    return len(payload)
+
+
+def compute_all():
+    """Recompute and store related posts for every published post. Returns the number of posts."""
+    corpus = _load_corpus()
+    vectors = _vectors(corpus)
+    tagsets = {post_id: _tags(row) for post_id, row in corpus.items()}
+    return _store(_scores_for(list(corpus), corpus, vectors, tagsets), corpus)
+
+
+def recompute_for(post_id):
+    """Recompute the list of post_id and of every post whose list it can change."""
+    from .page_cache import purge
+
+    post_id = str(post_id)
+    corpus = _load_corpus()
+    vectors = _vectors(corpus)
+    tagsets = {pid: _tags(row) for pid, row in corpus.items()}
+
+    affected = set()
+    # Posts that currently list it (it may have been deleted, unpublished or changed)
+    for row in supabase_rest.select(TABLE, columns="blog_id", filters={"related": f'cs.[{{"id":"{post_id}"}}]'}):
+        affected.add(str(row["blog_id"]))
+    if post_id in corpus:
+        affected.add(post_id)
+        # Posts it is now similar to
+        affected.update(other for _, other in _scores_for([post_id], corpus, vectors, tagsets)[post_id])
+        affected.update(other for other, tags in tagsets.items() if tags & tagsets[post_id])
+    else:
+        supabase_rest.delete_rows(TABLE, {"blog_id": f"eq.{post_id}"})
+        cache.delete(_cache_key(post_id))
+
+    affected &= set(corpus)
+    stored = _store(_scores_for(affected, corpus, vectors, tagsets), corpus) if affected else 0
+    purge("blogs")
+    return stored
+
+
+def recompute_async(post_id):
+    def run():
+        try:
+            recompute_for(post_id)
+        except Exception as e:
+            print(f"[Related Posts] Recompute for {post_id} failed: {e}")
+    threading.Thread(target=run, name="related-posts", daemon=True).start()
+
+
+def get(post_id, fallback=None):
+    """
+    Stored related posts for a post as decoded card rows.
+
+    When nothing was computed for the post (or its list is empty), fallback() is
+    called for raw blogs rows instead, if given. Either result is cached, so a view
+    makes at most one lookup per post; the fallback only for FALLBACK_TTL seconds,
+    or until a recompute stores a real list.
+    """
+    key = _cache_key(post_id)
+    related = cache.get(key)
+    if related is None:
+        row = supabase_rest.select_one(TABLE, columns="related", filters={"blog_id": f"eq.{post_id}"})
+        related = (row.get("related") or []) if row else []
+        if related:
+            cache.set(key, related, None)
+        else:
+            related = [{k: r.get(k) for k in CARD_KEYS} for r in fallback()] if fallback else []
+            cache.set(key, related, FALLBACK_TTL)
+    rows = records.decode_rows("blogs", [dict(r) for r in related])
+    return storage_urls.canonicalize_rows(rows, "blogs")
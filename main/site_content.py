@@ -0,0 +1,83 @@
+"""
+Bulk loader for site_content rows.
+
+Resolves any set of content keys in one `content_key=in.(...)` request and
+memoizes the rows on the request, so the same key is never fetched twice while
+handling one request. load_with_defaults() fills in the rows templates expect
+when a key has never been saved.
+"""
+import copy
+
+from . import supabase_rest
+
+HERO_QUOTE_DEFAULT = "When the people fear the government, there is tyranny. When the government fears the people, there is liberty."
+
+DEFAULTS = {
+    "hero_slide_1": {"content_key": "hero_slide_1", "image_url": None, "id": None},
+    "hero_slide_2": {"content_key": "hero_slide_2", "image_url": None, "id": None},
+    "hero_slide_3": {"content_key": "hero_slide_3", "image_url": None, "id": None},
+    "manifesto": {"content_key": "manifesto", "image_url": None, "id": None, "title": "Our Manifesto", "subtitle": "The Ratel Movement", "content": ""},
+    "hero_quote": {"content_key": "hero_quote", "content": HERO_QUOTE_DEFAULT, "subtitle": "Thomas Jefferson", "id": None},
+    "hero_video": {"content_key": "hero_video", "image_url": None, "id": None},
+}
+
+# Keys the landing page always loads by content_key, even when the row is inactive
+LANDING_KEYS = ("hero_slide_1", "hero_slide_2", "hero_slide_3", "manifesto", "hero_quote", "hero_video")
+
+
+def default_for(key):
+    """Copy of the template default for a content key (bare row for unknown keys)."""
+    return copy.deepcopy(DEFAULTS.get(key, {"content_key": key, "image_url": None, "id": None}))
+
+
+def _memo(request):
+    if request is None:
+        return {}
+    memo = getattr(request, "_site_content_rows", None)
+    if memo is None:
+        memo = {}
+        request._site_content_rows = memo
+    return memo
+
+
+def load(keys, request=None):
+    """
+    site_content rows for the given keys in one request. Returns dict key -> row (None if missing).
+    Rows already loaded for this request are served from the request memo.
+    """
+    memo = _memo(request)
+    missing = [k for k in keys if k not in memo]
+    if missing:
+        rows = supabase_rest.select(
+            "site_content",
+            filters={"content_key": f"in.({','.join(missing)})"},
+        )
+        found = {row.get("content_key"): row for row in rows}
+        for key in missing:
+            memo[key] = found.get(key)
+    return {key: memo.get(key) for key in keys}
+
+
+def load_with_defaults(keys, request=None):
+    """Like load(), but keys without a saved row get their template default."""
+    return {key: (row if row else default_for(key)) for key, row in load(keys, request).items()}
+
+
+def invalidate(request, *keys):
+    """Forget memoized rows after a write so later reads in the same request refetch them."""
+    memo = _memo(request)
+    for key in (keys or list(memo)):
+        memo.pop(key, None)
+
+
+def load_landing_sections():
+    """
+    All active rows plus the LANDING_KEYS rows (active or not) in one request.
+    Returns dict content_key -> row, ordered by display_order.
+    """
+    rows = supabase_rest.select(
+        "site_content",
+        filters={"or": f"(is_active.eq.true,content_key.in.({','.join(LANDING_KEYS)}))"},
+        order="display_order.asc",
+    )
+    return {row.get("content_key"): row for row in rows}
@@ -0,0 +1,70 @@
+"""
+Site statistics snapshot for the landing page counters.
+
+The counters (active members, resolved cases, total views, published posts) are
+computed by the site_statistics_snapshot RPC (see migrations/site_statistics_snapshot.sql)
+in one round trip, falling back to individual count queries if the RPC is not
+installed. The result is kept in the landing cache and refreshed in the
+background, so rendering the landing page never runs aggregate queries.
+Run `python manage.py refresh_site_stats` from cron to keep it warm.
+"""
+from django.conf import settings
+
+from . import supabase_rest
+from .landing_cache import get_section, store
+
+EMPTY_SNAPSHOT = {
+    "members": 0,
+    "cases_resolved": 0,
+    "blog_views": 0,
+    "page_views": 0,
+    "blog_posts": 0,
+}
+
+
+def compute_snapshot():
+    """Aggregate the raw counters from Supabase (one RPC call, or count queries as fallback)."""
+    resp = supabase_rest.rpc("site_statistics_snapshot")
+    if resp.status_code == 200 and isinstance(resp.json(), dict):
+        data = resp.json()
+        return {key: int(data.get(key) or 0) for key in EMPTY_SNAPSHOT}
+
+    print(f"[Site Stats] RPC unavailable ({resp.status_code}), falling back to count queries")
+    page_views_row = supabase_rest.select_one("site_statistics", columns="value", filters={"key": "eq.total_page_views"})
+    blog_views = supabase_rest.select("blogs", columns="view_count", filters={"is_published": "eq.true"})
+    counts = supabase_rest.counts({
+        "members": ("members", {"status": "eq.active"}),
+        "cases_resolved": ("cases", {"status": "in.(solved,completed)"}),
+        "blog_posts": ("blogs", {"is_published": "eq.true"}),
+    })
+    return {
+        "members": counts["members"],
+        "cases_resolved": counts["cases_resolved"],
+        "blog_views": sum(b.get("view_count", 0) or 0 for b in blog_views),
+        "page_views": (page_views_row or {}).get("value", 0) or 0,
+        "blog_posts": counts["blog_posts"],
+    }
+
+
+def refresh():
+    """Recompute the snapshot now and store it. Returns the raw snapshot."""
+    snapshot = compute_snapshot()
+    store("stats", snapshot)
+    return snapshot
+
+
+def get_counters():
+    """
+    Landing counters from the cached snapshot. Never blocks on Supabase: a cold cache
+    returns zeros and fills in the background.
+    """
+    snapshot = get_section("stats", compute_snapshot, block=False, default=None) or EMPTY_SNAPSHOT
+    baseline = getattr(settings, "STATS_CASES_RESOLVED_BASELINE", 40)
+    return {
+        "stat_members": snapshot["members"],
+        # Cases resolved (solved or completed) on top of the configured offline baseline
+        "stat_cases_resolved": baseline + snapshot["cases_resolved"],
+        # Total views: blog views + page visit counter
+        "stat_total_views": snapshot["blog_views"] + snapshot["page_views"],
+        "stat_blog_posts": snapshot["blog_posts"],
+    }
@@ -0,0 +1,275 @@
+"""
+Streaming uploads to Supabase Storage.
+
+upload() sends a Django UploadedFile to Storage without holding it in memory:
+
+- files up to one chunk (STORAGE_UPLOAD_CHUNK_SIZE, 6 MB by default) go in a
+  single streamed object POST;
+- larger files use Storage's resumable (TUS 1.0.0) endpoint: an upload is
+  created with the total length, then UploadedFile.chunks() is re-cut into
+  fixed-size chunks and PATCHed one at a time, so memory stays at about one
+  chunk however big the file is.
+
+A chunk that fails on a network error or 5xx is not restarted from zero: the
+upload's current Upload-Offset is asked for with HEAD and only the missing part
+is sent again (up to STORAGE_UPLOAD_RETRIES times). The upload URL is also
+remembered in the cache for a while, keyed by bucket, path and size, so a
+repeated request for the same object continues where the previous one stopped.
+
+upload_content_addressed() names the object after its content instead: the
+SHA-256 of the file (hashed while streaming file.chunks()) becomes the key
+<folder>/<sha256>.<ext>. If that object already exists (HEAD), nothing is sent
+and its public URL is returned, so re-uploading the same hero image, thumbnail
+or document costs one request and no storage. Equal content always gets the
+same path, which also lets an interrupted large upload resume from another
+request.
+
+STORAGE_ENDPOINT points the uploader at another Storage-compatible server (for
+example a local Supabase Storage or tusd container); it defaults to
+SUPABASE_URL/storage/v1.
+"""
+import base64
+import hashlib
+import os
+import time
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+from . import supabase_rest
+
+TUS_VERSION = "1.0.0"
+DEFAULT_CHUNK_SIZE = 6 * 1024 * 1024   # Supabase requires 6 MB chunks for resumable uploads
+RESUME_TTL = 24 * 3600                 # Storage keeps unfinished uploads for a day
+
+
+class StorageUploadError(Exception):
+    pass
+
+
+def endpoint():
+    return (getattr(settings, "STORAGE_ENDPOINT", "") or f"{settings.SUPABASE_URL.rstrip('/')}/storage/v1").rstrip("/")
+
+
+def public_url(bucket, path):
+    return f"{endpoint()}/object/public/{bucket}/{path}"
+
+
+def _chunk_size():
+    return getattr(settings, "STORAGE_UPLOAD_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+
+
+def _retries():
+    return getattr(settings, "STORAGE_UPLOAD_RETRIES", 5)
+
+
+def _auth_headers():
+    headers = supabase_rest.read_headers()
+    return {"apikey": headers.get("apikey", ""), "Authorization": headers.get("Authorization", "")}
+
+
+def _content_type(file, content_type):
+    return content_type or getattr(file, "content_type", None) or "application/octet-stream"
+
+
+def _pieces(file, size):
+    """Re-cut file.chunks() into pieces of exactly size bytes (the last may be shorter)."""
+    buffer = bytearray()
+    for chunk in file.chunks():
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _upload_simple(file, bucket, path, content_type, upsert):
+    # At most one chunk, so reading it whole keeps memory bounded
+    body = b"".join(file.chunks())
+    headers = {
+        **_auth_headers(),
+        "Content-Type": content_type,
+        "x-upsert": "true" if upsert else "false",
+    }
+    url = f"{endpoint()}/object/{bucket}/{path}"
+    last_error = None
+    for attempt in range(_retries() + 1):
+        try:
+            resp = supabase_rest.post(url, headers=headers, data=body, timeout=60)
+        except requests.RequestException as e:
+            last_error = str(e)
+        else:
+            if resp.status_code in (200, 201):
+                return
+            last_error = f"{resp.status_code} {resp.text[:200]}"
+            if resp.status_code < 500:
+                break
+        time.sleep(min(2 ** attempt, 10))
+    raise StorageUploadError(f"Upload of {bucket}/{path} failed: {last_error}")
+
+
+def _resume_key(bucket, path, length):
+    return "storage_upload:" + hashlib.md5(f"{bucket}|{path}|{length}".encode("utf-8")).hexdigest()
+
+
+def _tus_headers(**extra):
+    return {**_auth_headers(), "Tus-Resumable": TUS_VERSION, **extra}
+
+
+def _create(bucket, path, length, content_type, upsert):
+    def b64(value):
+        return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+    metadata = ",".join([
+        f"bucketName {b64(bucket)}",
+        f"objectName {b64(path)}",
+        f"contentType {b64(content_type)}",
+        f"cacheControl {b64('3600')}",
+    ])
+    resp = supabase_rest.post(
+        f"{endpoint()}/upload/resumable",
+        headers=_tus_headers(**{
+            "Upload-Length": str(length),
+            "Upload-Metadata": metadata,
+            "x-upsert": "true" if upsert else "false",
+        }),
+        timeout=30,
+    )
+    if resp.status_code != 201 or not resp.headers.get("Location"):
+        raise StorageUploadError(f"Creating resumable upload for {bucket}/{path} failed: {resp.status_code} {resp.text[:200]}")
+    location = resp.headers["Location"]
+    if location.startswith("/"):
+        location = endpoint().split("/storage/", 1)[0] + location
+    return location
+
+
+def _offset(location):
+    """Bytes the server already has for an upload, or None if the upload is gone."""
+    resp = supabase_rest.head(location, headers=_tus_headers(), timeout=30)
+    if resp.status_code in (404, 410):
+        return None
+    if resp.status_code not in (200, 204):
+        raise StorageUploadError(f"Upload status failed: {resp.status_code}")
+    return int(resp.headers.get("Upload-Offset", 0))
+
+
+def _send(location, piece, start):
+    """PATCH one piece that begins at byte start, resuming from the server's offset after failures."""
+    end = start + len(piece)
+    offset = start
+    attempt = 0
+    while offset < end:
+        try:
+            resp = supabase_rest.patch(
+                location,
+                headers=_tus_headers(**{
+                    "Upload-Offset": str(offset),
+                    "Content-Type": "application/offset+octet-stream",
+                }),
+                data=piece[offset - start:],
+                timeout=120,
+            )
+            if resp.status_code == 204:
+                offset = int(resp.headers.get("Upload-Offset", end))
+                continue
+            if resp.status_code not in (409,) and resp.status_code < 500:
+                raise StorageUploadError(f"Chunk upload failed: {resp.status_code} {resp.text[:200]}")
+            error = f"{resp.status_code} {resp.text[:200]}"
+        except requests.RequestException as e:
+            error = str(e)
+        attempt += 1
+        if attempt > _retries():
+            raise StorageUploadError(f"Chunk upload failed after {attempt} attempts: {error}")
+        print(f"[Storage Upload] Chunk at {offset} interrupted ({error}), resuming")
+        time.sleep(min(2 ** attempt, 10))
+        server_offset = _offset(location)
+        if server_offset is None:
+            raise StorageUploadError("Resumable upload expired on the server")
+        offset = max(start, min(server_offset, end))
+    return end
+
+
+def _upload_resumable(file, bucket, path, content_type, upsert):
+    length = file.size
+    size = _chunk_size()
+    key = _resume_key(bucket, path, length)
+
+    location = cache.get(key)
+    done = _offset(location) if location else None
+    if done is None:
+        location = _create(bucket, path, length, content_type, upsert)
+        done = 0
+    else:
+        print(f"[Storage Upload] Resuming {bucket}/{path} at byte {done} of {length}")
+    cache.set(key, location, RESUME_TTL)
+
+    position = 0
+    for piece in _pieces(file, size):
+        piece_end = position + len(piece)
+        if piece_end > done:
+            # Part of this piece may already be stored from an earlier attempt
+            skip = max(done - position, 0)
+            _send(location, piece[skip:], position + skip)
+        position = piece_end
+    cache.delete(key)
+
+
+def upload(file, bucket, path, content_type=None, upsert=False):
+    """
+    Stream a Django UploadedFile to bucket/path. Returns the object's public URL.
+    Raises StorageUploadError when the upload fails.
+    """
+    content_type = _content_type(file, content_type)
+    if file.size is not None and file.size <= _chunk_size():
+        _upload_simple(file, bucket, path, content_type, upsert)
+    else:
+        _upload_resumable(file, bucket, path, content_type, upsert)
+    return public_url(bucket, path)
+
+
+def sha256(file):
+    """Hex SHA-256 of a Django File, read chunk by chunk (chunks() rewinds it first and the upload does again)."""
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def exists(bucket, path):
+    """True if bucket/path is already stored."""
+    try:
+        resp = supabase_rest.head(f"{endpoint()}/object/{bucket}/{path}", headers=_auth_headers(), timeout=15)
+    except requests.RequestException:
+        return False   # unknown, so upload; a duplicate is caught by the 409 path below
+    return resp.status_code == 200
+
+
+def content_key(file, folder="", ext=None):
+    """<folder>/<sha256>.<ext> for a file; ext defaults to the file name's (lowercased)."""
+    if ext is None:
+        ext = os.path.splitext(getattr(file, "name", "") or "")[1]
+    ext = ext.lower()
+    if ext and not ext.startswith("."):
+        ext = "." + ext
+    name = f"{sha256(file)}{ext}"
+    return f"{folder.strip('/')}/{name}" if folder.strip("/") else name
+
+
+def upload_content_addressed(file, bucket, folder="", content_type=None, ext=None):
+    """
+    Store a file under its content hash (see content_key()) unless that object already
+    exists. Returns the public URL either way. Raises StorageUploadError.
+    """
+    path = content_key(file, folder, ext)
+    if exists(bucket, path):
+        print(f"[Storage Upload] {bucket}/{path} already stored, skipping upload")
+        return public_url(bucket, path)
+    try:
+        return upload(file, bucket, path, content_type)
+    except StorageUploadError:
+        # Another request may have stored the same content in the meantime (409 Duplicate)
+        if exists(bucket, path):
+            return public_url(bucket, path)
+        raise
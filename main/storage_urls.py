@@ -0,0 +1,94 @@
+"""
+Supabase Storage URL resolver.
+
+Rows store file and image URLs in several historical shapes: bare object paths
+("featured/abc.jpg"), signed URLs with a token, URLs missing the "public"
+segment, and canonical public URLs. resolve(value, bucket) turns any of them
+into {SUPABASE_URL}/storage/v1/object/public/{bucket}/{path}; external URLs are
+returned unchanged. Results are memoized, so repeated values cost a dict lookup.
+
+STORED_URL_COLUMNS lists which bucket every stored URL column points into. The
+canonicalize_storage_urls management command rewrites those columns in place;
+once it has run, set STORAGE_URLS_CANONICAL = True and canonicalize_rows()
+becomes a no-op, so page renders do no URL processing at all.
+"""
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+STORAGE_PREFIX = "/storage/v1/object/"
+
+# table -> (bucket, URL columns). Media pages have always resolved bare paths
+# against the "media" bucket, so that mapping is kept as is.
+STORED_URL_COLUMNS = {
+    "blogs": ("blogs", ("featured_image_url",)),
+    "youtube_ig_links": ("messages", ("thumbnail_url",)),
+    "leadership_council": ("leadership", ("profile_image_url",)),
+    "strategic_committees": ("leadership", ("profile_image_url",)),
+    "advisory_voices": ("leadership", ("profile_image_url",)),
+    "members": ("profiles", ("profile_image_url",)),
+    "media_videos": ("media", ("file_url", "thumbnail_url")),
+    "media_audio": ("media", ("file_url",)),
+    "media_images": ("media", ("file_url", "thumbnail_url")),
+    "media_documents": ("media", ("file_url",)),
+    "resources": ("resources", ("file_url", "thumbnail_url")),
+}
+
+
+def _base_url():
+    return settings.SUPABASE_URL.rstrip("/")
+
+
+@lru_cache(maxsize=4096)
+def _resolve(value, bucket, base_url):
+    public_base = f"{base_url}{STORAGE_PREFIX}public/{bucket}/"
+
+    if not value.startswith(("http://", "https://")):
+        # Bare object path; keep folders like "featured/filename.jpg"
+        return public_base + value.lstrip("/")
+
+    clean_url = value.split("?")[0]
+    if f"{STORAGE_PREFIX}public/{bucket}/" in clean_url:
+        return clean_url
+    # Signed URLs and URLs missing the "public" segment
+    for wrong in (f"{STORAGE_PREFIX}sign/{bucket}/", f"{STORAGE_PREFIX}{bucket}/"):
+        if wrong in clean_url:
+            return clean_url.replace(wrong, f"{STORAGE_PREFIX}public/{bucket}/")
+    # Our own storage host with a broken path structure: rebuild from the object path
+    is_storage = STORAGE_PREFIX in clean_url or urlsplit(clean_url).netloc == urlsplit(base_url).netloc
+    if is_storage and f"/{bucket}/" in clean_url:
+        return public_base + clean_url.split(f"/{bucket}/")[-1]
+    # Valid external URL, use as-is
+    return value
+
+
+def resolve(value, bucket):
+    """Canonical public URL for a stored storage URL or path in bucket. Empty values give None."""
+    if not value:
+        return None
+    value = str(value).strip()
+    if not value:
+        return None
+    return _resolve(value, bucket, _base_url())
+
+
+def canonicalize_row(row, table):
+    """Resolve every stored URL column of one row of table in place. Returns the row."""
+    bucket, columns = STORED_URL_COLUMNS[table]
+    for column in columns:
+        if row.get(column):
+            row[column] = resolve(row[column], bucket)
+    return row
+
+
+def canonicalize_rows(rows, table):
+    """
+    Render-time safety net for rows fetched from table. Skipped entirely once the
+    stored URLs have been backfilled (STORAGE_URLS_CANONICAL = True).
+    """
+    if getattr(settings, "STORAGE_URLS_CANONICAL", False):
+        return rows
+    for row in rows:
+        canonicalize_row(row, table)
+    return rows
@@ -0,0 +1,248 @@
+"""
+Pooled PostgREST client for Supabase.
+
+Every worker thread keeps one keep-alive requests.Session, so repeated calls to
+Supabase (and Paystack) reuse TCP/TLS connections instead of handshaking per
+request. Idempotent GET/HEAD calls are retried with backoff on connection
+errors and 502/503/504.
+
+Low-level: get/post/patch/delete/head mirror requests.* but go through the pooled session.
+Typed helpers: select, count, counts, insert, upsert, update, delete_rows, rpc.
+"""
+import hashlib
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = 10
+
+_local = threading.local()
+
+
+def _build_session():
+    retry = Retry(
+        total=getattr(settings, "SUPABASE_HTTP_RETRIES", 2),
+        connect=getattr(settings, "SUPABASE_HTTP_RETRIES", 2),
+        read=getattr(settings, "SUPABASE_HTTP_RETRIES", 2),
+        backoff_factor=getattr(settings, "SUPABASE_HTTP_BACKOFF", 0.3),
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=getattr(settings, "SUPABASE_HTTP_POOL_SIZE", 10),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """Keep-alive session for the current thread (sessions are not shared across threads)."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _build_session()
+        _local.session = session
+    return session
+
+
+def request(method, url, **kwargs):
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session().request(method, url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def head(url, **kwargs):
+    return request("HEAD", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def patch(url, **kwargs):
+    return request("PATCH", url, **kwargs)
+
+
+def delete(url, **kwargs):
+    return request("DELETE", url, **kwargs)
+
+
+# =====================================================
+# HEADERS
+# =====================================================
+
+_header_sets = {}
+
+
+def _service_key(anon=False):
+    if anon:
+        return settings.SUPABASE_KEY
+    return settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY
+
+
+def read_headers(anon=False):
+    """Headers for reads. Returns a fresh copy so callers can add to it."""
+    key = ("read", anon)
+    if key not in _header_sets:
+        api_key = _service_key(anon)
+        _header_sets[key] = {
+            "apikey": api_key,
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json",
+        }
+    return dict(_header_sets[key])
+
+
+def write_headers(prefer=None, anon=False):
+    """Headers for inserts/updates. prefer sets the PostgREST Prefer header (e.g. "return=representation")."""
+    key = ("write", anon)
+    if key not in _header_sets:
+        _header_sets[key] = {**read_headers(anon), "Content-Type": "application/json"}
+    headers = dict(_header_sets[key])
+    if prefer:
+        headers["Prefer"] = prefer
+    return headers
+
+
+def rest_url(path):
+    """Full PostgREST URL for a table/query path, e.g. rest_url("blogs?select=id")."""
+    return f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/{path.lstrip('/')}"
+
+
+# =====================================================
+# TYPED HELPERS
+# =====================================================
+
+def select(table, columns="*", filters=None, order=None, limit=None, offset=None, anon=False, strict=False) -> list:
+    """
+    Rows from a table. filters is a dict of PostgREST filters, e.g. {"status": "eq.active"}.
+    Returns [] on a non-200 response, or raises RuntimeError with strict=True (for callers
+    that must tell "no rows" from "request failed", e.g. before caching the result).
+    """
+    params = {"select": columns}
+    if filters:
+        params.update(filters)
+    if order:
+        params["order"] = order
+    if limit is not None:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+    resp = get(rest_url(table), headers=read_headers(anon), params=params)
+    if resp.status_code != 200:
+        if strict:
+            raise RuntimeError(f"select {table} failed: {resp.status_code} {resp.text[:200]}")
+        print(f"[Supabase REST] select {table} failed: {resp.status_code} {resp.text[:200]}")
+        return []
+    return resp.json()
+
+
+def select_one(table, columns="*", filters=None, order=None, anon=False) -> dict | None:
+    rows = select(table, columns=columns, filters=filters, order=order, limit=1, anon=anon)
+    return rows[0] if rows else None
+
+
+def _count_key(table, filters, method, anon):
+    raw = f"{table}|{sorted((filters or {}).items())}|{method}|{anon}"
+    return "supabase_count:" + hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _fetch_count(table, filters, method, anon):
+    """Row count from a HEAD request's Content-Range ("*/<n>"), or None on failure."""
+    params = dict(filters or {})
+    headers = {**read_headers(anon), "Prefer": f"count={method}"}
+    resp = head(rest_url(table), headers=headers, params=params)
+    if resp.status_code not in (200, 206):
+        print(f"[Supabase REST] count {table} failed: {resp.status_code}")
+        return None
+    try:
+        return int(resp.headers.get("content-range", "*/0").split("/")[-1])
+    except ValueError:
+        return None
+
+
+def counts(specs, method="exact", ttl=None, anon=False) -> dict:
+    """
+    Several row counts in one pass: specs is {name: (table, filters)}, the result {name: int}.
+    Counts are HEAD requests (no rows are transferred) sent concurrently, and cached for ttl
+    seconds (SUPABASE_COUNT_CACHE_TTL). method "estimated" uses the planner's estimate for
+    large results, which avoids a full scan. Failed counts are 0 and not cached.
+    """
+    from django.core.cache import cache
+    from .fanout import fan_out
+
+    if ttl is None:
+        ttl = getattr(settings, "SUPABASE_COUNT_CACHE_TTL", 30)
+    keys = {name: _count_key(table, filters, method, anon) for name, (table, filters) in specs.items()}
+    try:
+        cached = cache.get_many(list(keys.values())) if ttl else {}
+    except Exception as e:
+        print(f"[Supabase REST] count cache read failed: {e}")
+        cached = {}
+    result = {name: cached[key] for name, key in keys.items() if key in cached}
+
+    missing = {name: spec for name, spec in specs.items() if name not in result}
+    if len(missing) == 1:
+        name, (table, filters) = next(iter(missing.items()))
+        fetched = {name: _fetch_count(table, filters, method, anon)}
+    elif missing:
+        fetched = fan_out({
+            name: (lambda t=table, f=filters: _fetch_count(t, f, method, anon), None)
+            for name, (table, filters) in missing.items()
+        }, label="Supabase Counts")
+    else:
+        fetched = {}
+
+    fresh = {keys[name]: value for name, value in fetched.items() if value is not None}
+    if fresh and ttl:
+        try:
+            cache.set_many(fresh, ttl)
+        except Exception as e:
+            print(f"[Supabase REST] count cache write failed: {e}")
+    for name, value in fetched.items():
+        result[name] = value or 0
+    return result
+
+
+def count(table, filters=None, method="exact", ttl=None, anon=False) -> int:
+    """Row count via HEAD with Prefer: count=exact (or estimated), without downloading the rows."""
+    return counts({"n": (table, filters)}, method=method, ttl=ttl, anon=anon)["n"]
+
+
+def insert(table, payload, returning=True, anon=False):
+    """Insert one row (dict) or many (list). Returns the response."""
+    prefer = "return=representation" if returning else "return=minimal"
+    return post(rest_url(table), headers=write_headers(prefer, anon), json=payload)
+
+
+def upsert(table, payload, on_conflict=None, returning=True, anon=False):
+    """Insert or merge on conflict. Returns the response."""
+    prefer = "resolution=merge-duplicates," + ("return=representation" if returning else "return=minimal")
+    params = {"on_conflict": on_conflict} if on_conflict else None
+    return post(rest_url(table), headers=write_headers(prefer, anon), params=params, json=payload)
+
+
+def update(table, filters, payload, returning=True, anon=False):
+    """PATCH rows matching filters (dict of PostgREST filters). Returns the response."""
+    prefer = "return=representation" if returning else "return=minimal"
+    return patch(rest_url(table), headers=write_headers(prefer, anon), params=filters, json=payload)
+
+
+def delete_rows(table, filters, anon=False):
+    """DELETE rows matching filters. Returns the response."""
+    return delete(rest_url(table), headers=read_headers(anon), params=filters)
+
+
+def rpc(function, params=None, anon=False):
+    """Call a Postgres function exposed by PostgREST. Returns the response."""
+    return post(rest_url(f"rpc/{function}"), headers=write_headers(anon=anon), json=params or {})
@@ -0,0 +1,137 @@
+"""
+Background tasks run by the job queue (main/jobs.py, `python manage.py run_jobs`).
+"""
+import os
+from datetime import datetime
+
+from django.conf import settings
+from django.core.files import File
+from django.core.mail import send_mail
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+
+from . import image_derivatives
+from . import storage_upload
+from . import supabase_rest
+from .jobs import task
+from .landing_cache import invalidate
+from .page_cache import purge
+
+
+@task("email.welcome")
+def send_welcome_email(email, full_name, member_id, member_resources_url, badge_download_url, website_url):
+    """Welcome email with member ID, badge download, resources links and responsibilities."""
+    context = {
+        "full_name": full_name,
+        "member_id": member_id,
+        "member_resources_url": member_resources_url,
+        "badge_download_url": badge_download_url,
+        "website_url": website_url,
+        "current_year": datetime.now().year,
+    }
+    html_message = render_to_string("emails/welcome_member.html", context)
+    # Raise on SMTP errors so the job is retried
+    send_mail(
+        "Welcome to the RATEL Movement",
+        strip_tags(html_message),
+        settings.DEFAULT_FROM_EMAIL,
+        [email],
+        html_message=html_message,
+        fail_silently=False,
+    )
+
+
+@task("email.templated")
+def send_templated_email(subject, template, context, to):
+    """An HTML email rendered from template (plain-text part derived from it), e.g. donation/renewal thanks."""
+    context = {**context, "current_year": datetime.now().year}
+    html_message = render_to_string(template, context)
+    send_mail(subject, strip_tags(html_message), settings.DEFAULT_FROM_EMAIL, [to],
+              html_message=html_message, fail_silently=False)
+
+
+@task("messages.track")
+def track_message_action(message_id, field):
+    """
+    Count a share/download/copy. Written straight through the increment_counters RPC
+    (not the in-memory counters buffer), so the job is only done once the count is stored.
+    """
+    resp = supabase_rest.rpc("increment_counters", {
+        "p_deltas": [{"table": "shareable_messages", "row_key": message_id, "field": field, "delta": 1}],
+    })
+    if resp.status_code not in (200, 204):
+        raise RuntimeError(f"increment_counters failed: {resp.status_code} {resp.text[:200]}")
+
+
+@task("messages.share_event")
+def record_share_event(message_id, action, ip_address=None, user_agent=""):
+    """Insert the message_share_analytics row for a share/download/copy."""
+    resp = supabase_rest.insert("message_share_analytics", {
+        "message_id": message_id,
+        "share_platform": action,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+    }, returning=False)
+    if resp.status_code not in (200, 201, 204):
+        raise RuntimeError(f"Recording share failed: {resp.status_code} {resp.text[:200]}")
+
+
+def _upload_spooled(spooled, folder):
+    """Upload a file spooled by jobs.spool() to media-vault/<folder>/ and return its public URL."""
+    # Content-addressed, so a retried job (or the same video saved twice) reuses the stored object
+    with open(spooled["path"], "rb") as fh:
+        return storage_upload.upload_content_addressed(
+            File(fh, name=spooled["name"]), "media-vault", folder, spooled["content_type"]
+        )
+
+
+@task("media.save_video")
+def save_media_video(payload, video=None, thumbnail=None):
+    """
+    Upload a dashboard video (and thumbnail) spooled by dashboard_media_videos_save,
+    then insert its media_videos row. Returns {"id": new row id}.
+    """
+    payload = dict(payload)
+    if video:
+        payload["file_url"] = _upload_spooled(video, "videos")
+        payload["file_size_bytes"] = video["size"]
+        payload["mime_type"] = video["content_type"]
+    if thumbnail:
+        payload["thumbnail_url"] = _upload_spooled(thumbnail, "thumbnails")
+
+    resp = supabase_rest.insert("media_videos", payload)
+    if resp.status_code not in (200, 201):
+        error_msg = resp.text
+        if "23502" in error_msg and "file_url" in error_msg:
+            raise RuntimeError(
+                "Saving link-only videos requires making file_url nullable. "
+                "Run the SQL in migrations/add_video_link_column.sql in your Supabase SQL editor."
+            )
+        raise RuntimeError(f"Failed to save video: {resp.status_code} {error_msg[:200]}")
+
+    # The row exists now: nothing below may raise, or a retry would insert it again
+    try:
+        rows = resp.json()
+        row_id = rows[0]["id"] if rows else None
+    except (ValueError, LookupError, TypeError):
+        row_id = None
+    for spooled in (video, thumbnail):
+        if spooled:
+            try:
+                os.remove(spooled["path"])
+            except OSError:
+                pass
+    try:
+        invalidate("media_videos")
+        purge("media")
+    except Exception as e:
+        print(f"[Jobs] Cache refresh after saving video {row_id} failed: {e}")
+    return {"id": row_id}
+
+
+@task("media.image_derivatives")
+def generate_image_derivatives(row_id, source_url):
+    """Thumbnail, WebP size ladder and placeholder for a media_images row (main/image_derivatives.py)."""
+    image_derivatives.generate(row_id, source_url)
+    purge("media")
+    invalidate("media_images")
@@ -28,3 +28,23 @@ def strip_newlines(value):
     s = s.replace("\\n", " ").replace("\\r", " ")
     s = re.sub(r"\s+", " ", s)  # collapse multiple spaces
     return s.strip()
+
+
+@register.filter
+def srcset(variants):
+    """
+    srcset value for an image's derived WebP sizes (media_images.variants).
+    Usage: <img src="{{ image.thumbnail_url }}" srcset="{{ image.variants|srcset }}" ...>
+    """
+    from main.image_derivatives import srcset as build_srcset
+    return build_srcset(variants)
+
+
+@register.filter
+def resized(url, preset):
+    """
+    URL of a Storage image scaled down to a named preset (/img/<preset>/...); other URLs are unchanged.
+    Usage: <img src="{{ member.profile_image_url|resized:'avatar' }}">
+    """
+    from main.image_proxy import url as proxy_url
+    return proxy_url(url, preset)
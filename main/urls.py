@@ -18,6 +18,8 @@ urlpatterns = [
     path("media-vault/audios/", views.media_audios, name="media_audios"),
     path("media-vault/images/", views.media_images, name="media_images"),
     path("media-vault/documents/", views.media_documents, name="media_documents"),
+    path("api/media/<str:kind>/", views.api_media_list, name="api_media_list"),
+    path("api/jobs/<str:job_id>/", views.api_job_status, name="api_job_status"),
 
     # Other pages
     path("resources/", views.resources, name="resources"),
@@ -38,10 +40,22 @@ urlpatterns = [
     path("auth/logout/", views.auth_logout, name="auth_logout"),
     path("blog/", views.blog, name="blog"),
     path("blog/<str:slug>/", views.blog_detail, name="blog_detail"),
+    path("api/blog/list/", views.api_blog_list, name="api_blog_list"),
+    path("api/blog/search/", views.api_blog_search, name="api_blog_search"),
     path("api/blog/comments/", views.api_blog_comments_list, name="api_blog_comments_list"),
     path("api/blog/comments/create/", views.api_blog_comment_create, name="api_blog_comment_create"),
     path("api/blog/comments/like/", views.api_blog_comment_like, name="api_blog_comment_like"),
     path("api/blog/comments/likes-check/", views.api_blog_comment_likes_check, name="api_blog_comment_likes_check"),
+    path("api/stats/", views.api_site_stats, name="api_site_stats"),
+    path("api/landing/featured-members/", views.api_featured_members, name="api_featured_members"),
+    # Sitemap and feeds (prebuilt, see main/feeds.py)
+    path("sitemap.xml", views.sitemap_xml, name="sitemap"),
+    # Resized Storage images (avatars, leadership photos, blog and YouTube/IG thumbnails)
+    path("img/<str:preset>/<str:bucket>/<path:path>", views.resized_image, name="resized_image"),
+    path("blog/rss.xml", views.blog_rss, name="blog_rss"),
+    path("blog/atom.xml", views.blog_atom, name="blog_atom"),
+    path("cases/rss.xml", views.cases_rss, name="cases_rss"),
+    path("cases/atom.xml", views.cases_atom, name="cases_atom"),
     path("features/", views.features, name="features"),
     # Dashboard
     path("dashboard/", views.dashboard_home, name="dashboard_home"),
@@ -60,6 +74,8 @@ urlpatterns = [
     path("dashboard/inquiries/status/", views.dashboard_inquiry_status, name="dashboard_inquiry_status"),
     path("dashboard/inquiries/reply/", views.dashboard_inquiry_reply, name="dashboard_inquiry_reply"),
     path("dashboard/deals/", views.dashboard_deals, name="dashboard_deals"),  # Keep for backwards compat
+    # Direct-to-Storage uploads (signed upload URLs for dashboard file fields)
+    path("dashboard/uploads/sign/", views.dashboard_upload_sign, name="dashboard_upload_sign"),
     # Media Vault Dashboard Routes
     path("dashboard/media-vault/", views.dashboard_media_vault, name="dashboard_media_vault"),
     path("dashboard/media-vault/videos/", views.dashboard_media_videos, name="dashboard_media_videos"),
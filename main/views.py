@@ -13,283 +13,164 @@ from django.contrib import messages
 
 import json
 import os
-import random
 import requests
 from datetime import datetime, timedelta
 from django.utils.crypto import get_random_string
 
 from .supabase_client import get_supabase
+from . import supabase_rest
+from .landing_cache import get_section, invalidates_landing
+from . import site_content
+from . import site_stats
+from . import counters
+from . import direct_upload
+from . import image_derivatives
+from . import image_proxy
+from . import jobs
+from . import member_sampler
+from . import storage_upload
+from . import storage_urls
+from . import records
+from .page_cache import cache_public_page, purges_pages, purge as purge_pages
+
+
+def _landing_latest_media(table):
+    """Latest 2 active items from one media table."""
+    return supabase_rest.select(table, filters={"status": "eq.active"}, order="created_at.desc", limit=2)
+
+
+def _landing_links(base_url, headers):
+    """Active YouTube/IG links with public thumbnail URLs."""
+    resp_all = supabase_rest.get(
+        f"{base_url}/rest/v1/youtube_ig_links?select=*&is_active=eq.true&order=display_order.asc,created_at.asc",
+        headers=headers, timeout=10
+    )
+    all_links = resp_all.json() if resp_all.status_code == 200 else []
+    return storage_urls.canonicalize_rows(all_links, "youtube_ig_links")
 
 
-def index(request):
-    """Landing page with all content sections from Supabase."""
-    sections = {}
-    media_videos = []
-    media_audio = []
-    media_images = []
-    media_documents = []
-    featured_members = []
-    hero_video_url = None
-
-    try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-
-        # Fetch all site content sections
-        url = f"{base_url}/rest/v1/site_content?is_active=eq.true&select=*&order=display_order.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            for item in data:
-                sections[item.get("content_key")] = item
-        # Always load hero slides, manifesto, and quote by content_key so saved settings show on landing (ignore is_active)
-        for key in ("hero_slide_1", "hero_slide_2", "hero_slide_3", "manifesto", "hero_quote"):
-            try:
-                r = requests.get(
-                    f"{base_url}/rest/v1/site_content?content_key=eq.{key}&select=*&limit=1",
-                    headers=headers,
-                    timeout=10,
-                )
-                if r.status_code == 200 and r.json():
-                    sections[key] = r.json()[0]
-            except Exception:
-                pass
-        # Ensure hero carousel keys exist for template (slide 1, 2, 3)
-        for key in ("hero_slide_1", "hero_slide_2", "hero_slide_3"):
-            if key not in sections:
-                sections[key] = {"content_key": key, "image_url": None}
-        # Ensure manifesto exists for template (image beside section)
-        if "manifesto" not in sections:
-            sections["manifesto"] = {"content_key": "manifesto", "image_url": None, "title": "Our Manifesto", "subtitle": "The Ratel Movement", "content": ""}
-        # Ensure hero_quote exists for template
-        if "hero_quote" not in sections:
-            sections["hero_quote"] = {"content_key": "hero_quote", "content": "When the people fear the government, there is tyranny. When the government fears the people, there is liberty.", "subtitle": "Thomas Jefferson"}
-
-        # Hero video (if set, landing shows video instead of 3-image carousel)
-        hero_video_url = None
-        try:
-            r = requests.get(
-                f"{base_url}/rest/v1/site_content?content_key=eq.hero_video&select=image_url&limit=1",
-                headers=headers,
-                timeout=10,
-            )
-            if r.status_code == 200:
-                data = r.json()
-                if data and isinstance(data, list) and data[0].get("image_url"):
-                    hero_video_url = (data[0].get("image_url") or "").strip()
-        except Exception:
-            pass
-
-        # Fetch latest 2 videos
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_videos?select=*&status=eq.active&order=created_at.desc&limit=2",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            media_videos = resp.json()
-
-        # Fetch latest 2 audio
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_audio?select=*&status=eq.active&order=created_at.desc&limit=2",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            media_audio = resp.json()
-
-        # Fetch latest 2 images
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_images?select=*&status=eq.active&order=created_at.desc&limit=2",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            media_images = resp.json()
-
-        # Fetch latest 2 documents
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_documents?select=*&status=eq.active&order=created_at.desc&limit=2",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            media_documents = resp.json()
-
-        # Get all active links and filter by type
-        resp_all = requests.get(
-            f"{base_url}/rest/v1/youtube_ig_links?select=*&is_active=eq.true&order=display_order.asc,created_at.asc",
-            headers=headers, timeout=10
-        )
-        all_links = resp_all.json() if resp_all.status_code == 200 else []
-
-        # Normalize thumbnail URLs using robust normalizer
-        for link in all_links:
-            if link.get("thumbnail_url"):
-                original_url = link["thumbnail_url"]
-                link["thumbnail_url"] = _normalize_messages_url(original_url)
-                if link["thumbnail_url"] != original_url:
-                    print(f"[Index YouTube/IG] Normalized thumbnail: {original_url} -> {link['thumbnail_url']}")
-
-        # Filter YouTube links (those with youtube_url and no ig_url, or youtube_url present)
-        youtube_links = [link for link in all_links if link.get("youtube_url") and not link.get("ig_url")][:4]
-
-        # Filter Instagram links (those with ig_url and no youtube_url, or ig_url present)
-        instagram_links = [link for link in all_links if link.get("ig_url") and not link.get("youtube_url")][:4]
+def _landing_featured_cases(base_url, headers):
+    """One active case for landing page (prioritize featured, then most recent active)."""
+    cases_resp = supabase_rest.get(
+        f"{base_url}/rest/v1/cases?select=*&status=eq.active&is_featured=eq.true&order=created_at.desc&limit=1",
+        headers=headers,
+        timeout=10
+    )
+    featured_cases = cases_resp.json() if cases_resp.status_code == 200 else []
 
-        # Get one active case for landing page (prioritize featured, then most recent active)
-        cases_resp = requests.get(
-            f"{base_url}/rest/v1/cases?select=*&status=eq.active&is_featured=eq.true&order=created_at.desc&limit=1",
+    # If no featured active case, get the most recent active case
+    if not featured_cases:
+        cases_resp = supabase_rest.get(
+            f"{base_url}/rest/v1/cases?select=*&status=eq.active&order=created_at.desc&limit=1",
             headers=headers,
             timeout=10
         )
         featured_cases = cases_resp.json() if cases_resp.status_code == 200 else []
-        
-        # If no featured active case, get the most recent active case
-        if not featured_cases:
-            cases_resp = requests.get(
-                f"{base_url}/rest/v1/cases?select=*&status=eq.active&order=created_at.desc&limit=1",
-                headers=headers,
-                timeout=10
-            )
-            featured_cases = cases_resp.json() if cases_resp.status_code == 200 else []
-        
-        # Normalize date strings for featured cases
-        for case in featured_cases:
-            for key in ("date_reported", "created_at", "updated_at"):
-                val = case.get(key)
-                if val and isinstance(val, str) and val.strip():
-                    try:
-                        if "T" in val:
-                            case[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                        else:
-                            case[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                    except (ValueError, TypeError):
-                        case[key] = None
 
-        # Fetch latest 3 published blogs for landing page
-        blogs_resp = requests.get(
-            f"{base_url}/rest/v1/blogs?is_published=eq.true&select=*&order=published_at.desc,created_at.desc&limit=3",
-            headers=headers,
-            timeout=10
-        )
-        latest_blogs = blogs_resp.json() if blogs_resp.status_code == 200 else []
-        
-        # Parse dates and normalize image URLs for blogs
-        for blog in latest_blogs:
-            for key in ("published_at", "created_at", "updated_at"):
-                val = blog.get(key)
-                if val and isinstance(val, str) and val.strip():
-                    try:
-                        if "T" in val:
-                            blog[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                        else:
-                            blog[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                    except (ValueError, TypeError):
-                        blog[key] = None
-            
-            # Normalize featured_image_url - ensure it's a full public URL
-            if blog.get("featured_image_url"):
-                original_url = blog["featured_image_url"]
-                blog["featured_image_url"] = _normalize_blog_image_url(blog["featured_image_url"], base_url)
-                if blog["featured_image_url"] != original_url:
-                    print(f"[Index Blog Image] Normalized: {original_url} -> {blog['featured_image_url']}")
-
-        # Fetch active members and pick 4 at random for landing profile cards (changes on refresh)
-        featured_members = []
-        try:
-            members_url = f"{base_url}/rest/v1/members?select=member_id,full_name,membership_type,state,country,based_in_nigeria,profile_image_url&status=eq.active"
-            members_resp = requests.get(members_url, headers=headers, timeout=10)
-            if members_resp.status_code == 200:
-                all_members = members_resp.json()
-                if all_members:
-                    shuffled = list(all_members)
-                    random.shuffle(shuffled)
-                    featured_members = shuffled[:4]
-                    bucket_base = base_url + "/storage/v1/object/public/profiles/"
-                    for m in featured_members:
-                        path = m.get("profile_image_url")
-                        if path and not str(path).startswith("http"):
-                            m["profile_image_url"] = bucket_base + str(path).lstrip("/")
-        except Exception:
-            pass
+    return records.decode_rows("cases", featured_cases)
 
-        # Website statistics for landing page counters
-        try:
-            # Total active members
-            r = requests.get(f"{base_url}/rest/v1/members?select=id&status=eq.active", headers={**headers, "Prefer": "count=exact"}, timeout=10)
-            stat_members = int(r.headers.get("content-range", "0/0").split("/")[-1]) if r.status_code == 200 else 0
 
-            # Cases resolved (solved or completed) — base of 40 + actual DB count
-            r = requests.get(f"{base_url}/rest/v1/cases?select=id&status=in.(solved,completed)", headers={**headers, "Prefer": "count=exact"}, timeout=10)
-            stat_cases_resolved = 40 + (int(r.headers.get("content-range", "0/0").split("/")[-1]) if r.status_code == 200 else 0)
+def _landing_latest_blogs(base_url, headers):
+    """Latest 3 published blogs with parsed dates and public image URLs."""
+    blogs_resp = supabase_rest.get(
+        f"{base_url}/rest/v1/blogs?is_published=eq.true&select=*&order=published_at.desc,created_at.desc&limit=3",
+        headers=headers,
+        timeout=10
+    )
+    latest_blogs = blogs_resp.json() if blogs_resp.status_code == 200 else []
 
-            # Total views: blog views + page visit counter
-            r = requests.get(f"{base_url}/rest/v1/blogs?is_published=eq.true&select=view_count", headers=headers, timeout=10)
-            blog_views = sum(b.get("view_count", 0) or 0 for b in r.json()) if r.status_code == 200 else 0
+    records.decode_rows("blogs", latest_blogs)
+    return storage_urls.canonicalize_rows(latest_blogs, "blogs")
 
-            # Increment persistent page view counter (site_statistics table)
-            page_views = 0
-            try:
-                pv_headers = {**headers, "Content-Type": "application/json", "Prefer": "return=representation"}
-                r = requests.get(f"{base_url}/rest/v1/site_statistics?key=eq.total_page_views&select=*", headers=headers, timeout=10)
-                if r.status_code == 200 and r.json():
-                    row = r.json()[0]
-                    page_views = (row.get("value", 0) or 0) + 1
-                    requests.patch(f"{base_url}/rest/v1/site_statistics?key=eq.total_page_views", headers=pv_headers, json={"value": page_views}, timeout=10)
-                else:
-                    page_views = 1
-                    requests.post(f"{base_url}/rest/v1/site_statistics", headers=pv_headers, json={"key": "total_page_views", "value": 1}, timeout=10)
-            except Exception:
-                pass
 
-            stat_total_views = blog_views + page_views
+def _count_page_view(request, *args, **kwargs):
+    """Count a landing visit (buffered, flushed in batches by main/counters.py)."""
+    counters.increment("site_statistics", "total_page_views", "value")
 
-            # Total published blog posts
-            r = requests.get(f"{base_url}/rest/v1/blogs?is_published=eq.true&select=id", headers={**headers, "Prefer": "count=exact"}, timeout=10)
-            stat_blog_posts = int(r.headers.get("content-range", "0/0").split("/")[-1]) if r.status_code == 200 else 0
-        except Exception:
-            stat_members = 0
-            stat_cases_resolved = 40
-            stat_total_views = 0
-            stat_blog_posts = 0
 
-    except Exception as e:
-        print(f"[Index] Error fetching site content: {e}")
-        youtube_links = []
-        instagram_links = []
-        featured_cases = []
-        latest_blogs = []
-        featured_members = []
-        stat_members = 0
-        stat_cases_resolved = 0
-        stat_total_views = 0
-        stat_blog_posts = 0
+@cache_public_page(60, tags=("landing", "blogs", "cases", "media", "members"), on_hit=_count_page_view)
+def index(request):
+    """Landing page with all content sections from Supabase."""
+    from .fanout import fan_out
+
+    base_url = settings.SUPABASE_URL.rstrip("/")
+    headers = supabase_rest.read_headers()
+
+    # Every section is independent, so fetch them concurrently under one deadline.
+    # A branch that fails or runs late falls back to its default instead of blocking the page.
+    # Admin-edited sections come from the landing cache (stale-while-revalidate).
+    results = fan_out({
+        "sections": (lambda: get_section("sections", site_content.load_landing_sections), {}),
+        "media_videos": (lambda: get_section("media_videos", lambda: _landing_latest_media("media_videos")), []),
+        "media_audio": (lambda: get_section("media_audio", lambda: _landing_latest_media("media_audio")), []),
+        "media_images": (lambda: get_section("media_images", lambda: _landing_latest_media("media_images")), []),
+        "media_documents": (lambda: get_section("media_documents", lambda: _landing_latest_media("media_documents")), []),
+        "all_links": (lambda: get_section("links", lambda: _landing_links(base_url, headers)), []),
+        "featured_cases": (lambda: get_section("featured_cases", lambda: _landing_featured_cases(base_url, headers)), []),
+        "latest_blogs": (lambda: get_section("latest_blogs", lambda: _landing_latest_blogs(base_url, headers)), []),
+    }, label="Index")
+
+    _count_page_view(request)
+
+    sections = results["sections"]
+    # Ensure hero slides, manifesto and hero_quote exist for template
+    for key in site_content.LANDING_KEYS:
+        if key not in sections:
+            sections[key] = site_content.default_for(key)
+    # Hero video (if set, landing shows video instead of 3-image carousel)
+    hero_video_url = (sections["hero_video"].get("image_url") or "").strip() or None
+
+    all_links = results["all_links"]
+    # Filter YouTube links (those with youtube_url and no ig_url, or youtube_url present)
+    youtube_links = [link for link in all_links if link.get("youtube_url") and not link.get("ig_url")][:4]
+    # Filter Instagram links (those with ig_url and no youtube_url, or ig_url present)
+    instagram_links = [link for link in all_links if link.get("ig_url") and not link.get("youtube_url")][:4]
 
     return render(request, "index.html", {
         "sections": sections,
         "manifesto": sections.get("manifesto"),
         "hero_video_url": hero_video_url,
-        "media_videos": media_videos,
-        "media_audio": media_audio,
-        "media_images": media_images,
-        "media_documents": media_documents,
+        "media_videos": results["media_videos"],
+        "media_audio": results["media_audio"],
+        "media_images": results["media_images"],
+        "media_documents": results["media_documents"],
         "youtube_links": youtube_links,
         "instagram_links": instagram_links,
-        "featured_cases": featured_cases,
-        "latest_blogs": latest_blogs,
-        "featured_members": featured_members,
-        "stat_members": stat_members,
-        "stat_cases_resolved": stat_cases_resolved,
-        "stat_total_views": stat_total_views,
-        "stat_blog_posts": stat_blog_posts,
+        "featured_cases": results["featured_cases"],
+        "latest_blogs": results["latest_blogs"],
+        # Website statistics for landing page counters (cached snapshot, no aggregate queries)
+        **site_stats.get_counters(),
     })
 
 
+def api_featured_members(request):
+    """GET — the landing "Full Members" strip: 4 random active members, fresh on every request."""
+    try:
+        html = render_to_string("partials/featured_members.html", {
+            "featured_members": member_sampler.sample(4),
+        }, request=request)
+    except Exception as e:
+        print(f"[Featured Members API] Error: {e}")
+        return JsonResponse({"success": False, "error": str(e)}, status=500)
+    response = JsonResponse({"success": True, "html": html.strip()})
+    response["Cache-Control"] = "no-store"
+    return response
+
+
+def api_site_stats(request):
+    """GET — landing page counters as JSON (lets the counters load asynchronously)."""
+    try:
+        return JsonResponse({"success": True, "stats": site_stats.get_counters()})
+    except Exception as e:
+        print(f"[Site Stats API] Error: {e}")
+        return JsonResponse({"success": False, "error": str(e)}, status=500)
+
+
 def about(request):
     return render(request, "about.html")
 
 
+@cache_public_page(300, tags=("about", "members"))
 def about_ratel(request):
     """About Ratel page with dynamic content from Supabase."""
     context = {
@@ -300,15 +181,11 @@ def about_ratel(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch all about_ratel sections
         url = f"{base_url}/rest/v1/about_pages?page_key=eq.about_ratel&is_active=eq.true&select=*&order=section_order.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             data = resp.json()
             for item in data:
@@ -319,12 +196,9 @@ def about_ratel(request):
 
         # Get member count
         try:
-            count_url = f"{base_url}/rest/v1/members?select=id&status=eq.active"
-            count_resp = requests.get(count_url, headers=headers, timeout=5)
-            if count_resp.status_code == 200:
-                count = len(count_resp.json())
-                if count > 0:
-                    context["member_count"] = f"{count}+"
+            count = supabase_rest.count("members", {"status": "eq.active"})
+            if count > 0:
+                context["member_count"] = f"{count}+"
         except Exception:
             pass
 
@@ -334,6 +208,7 @@ def about_ratel(request):
     return render(request, "about_ratel.html", context)
 
 
+@cache_public_page(600, tags=("about",))
 def mission_vision(request):
     """Mission & Vision page with dynamic content from Supabase."""
     context = {
@@ -346,15 +221,11 @@ def mission_vision(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch all mission_vision sections
         url = f"{base_url}/rest/v1/about_pages?page_key=eq.mission_vision&is_active=eq.true&select=*&order=section_order.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             data = resp.json()
             for item in data:
@@ -376,6 +247,7 @@ def mission_vision(request):
     return render(request, "mission_vision.html", context)
 
 
+@cache_public_page(600, tags=("ideology",))
 def ideology(request):
     """
     Public ideology page - displays all ideology sections from Supabase.
@@ -386,7 +258,7 @@ def ideology(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/ideology_sections?select=*&is_active=eq.true&order=display_order.asc",
             headers=headers,
             timeout=10
@@ -408,243 +280,101 @@ def media_vault(request):
     return render(request, "media_vault.html")
 
 
-def media_videos(request):
-    """Public videos page - fetch videos from Supabase."""
-    videos = []
-    sorted_months = []
-    categories = []
-    current_category = request.GET.get('category', 'all')
+def _media_page(kind, request):
+    """First page of a media listing for a public media page; the rest loads via api_media_list."""
+    from . import media_listing
 
+    current_category = request.GET.get('category', 'all')
+    page = {"items": [], "next_cursor": None}
     try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-
-        # Build URL with proper filters
-        url = f"{base_url}/rest/v1/media_videos?select=*&status=eq.active&order=created_at.desc"
-
-        if current_category and current_category != 'all':
-            url += f"&category=eq.{current_category}"
-
-        print(f"[Media Videos] Fetching from: {url}")
-        resp = requests.get(
-            url,
-            headers=headers,
-            timeout=10
-        )
-        print(f"[Media Videos] Response status: {resp.status_code}")
-
-        if resp.status_code == 200:
-            videos = resp.json()
-            print(f"[Media Videos] Found {len(videos)} videos")
-            # Normalize file URLs
-            storage_base = f"{base_url}/storage/v1/object/public/media/"
-            for video in videos:
-                if video.get("file_url") and not str(video["file_url"]).startswith("http"):
-                    video["file_url"] = storage_base + str(video["file_url"]).lstrip("/")
-                if video.get("thumbnail_url") and not str(video["thumbnail_url"]).startswith("http"):
-                    video["thumbnail_url"] = storage_base + str(video["thumbnail_url"]).lstrip("/")
-            
-            # Group videos by month
-            from collections import defaultdict
-            from datetime import datetime
-            videos_by_month = defaultdict(list)
-            for video in videos:
-                try:
-                    created_date = datetime.fromisoformat(video.get("created_at", "").replace("Z", "+00:00"))
-                    month_key = created_date.strftime("%Y-%m")
-                    month_label = created_date.strftime("%B %Y")
-                    videos_by_month[month_key].append({
-                        "video": video,
-                        "month_label": month_label,
-                        "month_key": month_key
-                    })
-                except:
-                    # If date parsing fails, put in "Unknown" month
-                    videos_by_month["unknown"].append({
-                        "video": video,
-                        "month_label": "Unknown",
-                        "month_key": "unknown"
-                    })
-            
-            # Sort months descending (newest first)
-            sorted_months = sorted(videos_by_month.items(), key=lambda x: x[0] if x[0] != "unknown" else "0000-00", reverse=True)
+        page = media_listing.fetch_page(kind, current_category)
+    except Exception as e:
+        print(f"[Media {kind.title()}] Error fetching data: {e}")
+    return page, current_category
 
-        # Get distinct categories
-        categories = sorted({v.get("category") for v in videos if v.get("category")})
 
-    except Exception as e:
-        print(f"[Media Videos] Error fetching data: {e}")
-        sorted_months = []
-        videos = []
+@cache_public_page(300, tags=("media",), params=("category",))
+def media_videos(request):
+    """Public videos page - first page of videos grouped by month, then infinite scroll."""
+    from . import media_listing
 
+    page, current_category = _media_page("videos", request)
     return render(request, "media_videos.html", {
-        "videos": videos,
-        "videos_by_month": sorted_months,
-        "categories": categories,
+        "videos": page["items"],
+        "videos_by_month": media_listing.group_by_month(page["items"]),
+        "next_cursor": page["next_cursor"],
         "current_category": current_category,
     })
 
 
+@cache_public_page(300, tags=("media",), params=("category",))
 def media_audios(request):
-    """Public audios page - fetch audio from Supabase."""
-    audios = []
-    categories = []
-    current_category = request.GET.get('category', 'all')
-
-    try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-
-        params = {
-            "select": "*",
-            "is_archived": "eq.false",
-            "order": "created_at.desc",
-        }
-
-        if current_category and current_category != 'all':
-            params["category"] = f"eq.{current_category}"
-
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_audio",
-            headers=headers,
-            params=params,
-            timeout=10
-        )
-
-        if resp.status_code == 200:
-            audios = resp.json()
-            # Normalize file URLs
-            storage_base = f"{base_url}/storage/v1/object/public/media/"
-            for audio in audios:
-                if audio.get("file_url") and not str(audio["file_url"]).startswith("http"):
-                    audio["file_url"] = storage_base + str(audio["file_url"]).lstrip("/")
-
-        # Get distinct categories
-        categories = sorted({a.get("category") for a in audios if a.get("category")})
-
-    except Exception as e:
-        print(f"[Media Audios] Error fetching data: {e}")
-
+    """Public audios page - first page of audio, then infinite scroll."""
+    page, current_category = _media_page("audios", request)
     return render(request, "media_audios.html", {
-        "audios": audios,
-        "categories": categories,
+        "audios": page["items"],
+        "next_cursor": page["next_cursor"],
         "current_category": current_category,
     })
 
 
+@cache_public_page(300, tags=("media",), params=("category",))
 def media_images(request):
-    """Public images page - fetch images from Supabase."""
-    images = []
-    categories = []
-    current_category = request.GET.get('category', 'all')
-
-    try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-
-        # Build query URL - use status=active like dashboard
-        url = f"{base_url}/rest/v1/media_images?select=*&status=eq.active&order=created_at.desc"
-
-        if current_category and current_category != 'all':
-            url += f"&category=eq.{current_category}"
-
-        resp = requests.get(url, headers=headers, timeout=10)
-
-        print(f"[Media Images] URL: {url}")
-        print(f"[Media Images] Response status: {resp.status_code}")
-        if resp.status_code != 200:
-            print(f"[Media Images] Response: {resp.text}")
-
-        if resp.status_code == 200:
-            images = resp.json()
-            print(f"[Media Images] Found {len(images)} images")
-            # Normalize file URLs
-            storage_base = f"{base_url}/storage/v1/object/public/media/"
-            for image in images:
-                if image.get("file_url") and not str(image["file_url"]).startswith("http"):
-                    image["file_url"] = storage_base + str(image["file_url"]).lstrip("/")
-                if image.get("thumbnail_url") and not str(image["thumbnail_url"]).startswith("http"):
-                    image["thumbnail_url"] = storage_base + str(image["thumbnail_url"]).lstrip("/")
-
-        # Get distinct categories
-        categories = sorted({i.get("category") for i in images if i.get("category")})
-
-    except Exception as e:
-        import traceback
-        print(f"[Media Images] Error fetching data: {e}")
-        traceback.print_exc()
-
+    """Public images page - first page of images, then infinite scroll."""
+    page, current_category = _media_page("images", request)
     return render(request, "media_images.html", {
-        "images": images,
-        "categories": categories,
+        "images": page["items"],
+        "next_cursor": page["next_cursor"],
         "current_category": current_category,
     })
 
 
+@cache_public_page(300, tags=("media",), params=("category",))
 def media_documents(request):
-    """Public documents page - fetch documents from Supabase."""
-    documents = []
-    categories = []
-    current_category = request.GET.get('category', 'all')
-
-    try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-
-        params = {
-            "select": "*",
-            "is_archived": "eq.false",
-            "is_confidential": "eq.false",  # Only show non-confidential docs publicly
-            "order": "created_at.desc",
-        }
-
-        if current_category and current_category != 'all':
-            params["category"] = f"eq.{current_category}"
-
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_documents",
-            headers=headers,
-            params=params,
-            timeout=10
-        )
+    """Public documents page - first page of non-confidential documents, then infinite scroll."""
+    page, current_category = _media_page("documents", request)
+    return render(request, "media_documents.html", {
+        "documents": page["items"],
+        "next_cursor": page["next_cursor"],
+        "current_category": current_category,
+    })
 
-        if resp.status_code == 200:
-            documents = resp.json()
-            # Normalize file URLs
-            storage_base = f"{base_url}/storage/v1/object/public/media/"
-            for doc in documents:
-                if doc.get("file_url") and not str(doc["file_url"]).startswith("http"):
-                    doc["file_url"] = storage_base + str(doc["file_url"]).lstrip("/")
 
-        # Get distinct categories
-        categories = sorted({d.get("category") for d in documents if d.get("category")})
+def api_media_list(request, kind):
+    """
+    GET /api/media/<kind>/?cursor=&category=&limit= — next page of a media listing
+    (kind: videos, audios, images, documents). Each item has its card html, month_key and month_label;
+    the first page (no cursor) also carries the month buckets with their item counts.
+    """
+    from . import media_listing
 
+    if kind not in media_listing.KINDS:
+        return JsonResponse({"success": False, "error": "Unknown media type."}, status=404)
+    category = request.GET.get("category", "").strip()
+    cursor = request.GET.get("cursor", "").strip()
+    try:
+        size = min(max(int(request.GET.get("limit", media_listing.page_size())), 1), 100)
+    except ValueError:
+        size = media_listing.page_size()
+    try:
+        page = media_listing.fetch_page(kind, category, cursor or None, size)
+        months = media_listing.months(kind, category) if not cursor else None
     except Exception as e:
-        print(f"[Media Documents] Error fetching data: {e}")
+        print(f"[Media List API] Error: {e}")
+        return JsonResponse({"success": False, "error": "Could not load media."}, status=500)
 
-    return render(request, "media_documents.html", {
-        "documents": documents,
-        "categories": categories,
-        "current_category": current_category,
-    })
+    spec = media_listing.KINDS[kind]
+    items = []
+    for row in page["items"]:
+        html = render_to_string(spec["template"], {spec["context_name"]: row}, request=request)
+        items.append({**row, "html": html})
+    data = {"success": True, "items": items, "count": len(items), "next_cursor": page["next_cursor"]}
+    if months is not None:
+        data["months"] = months
+    return JsonResponse(data)
 
 
+@cache_public_page(300, tags=("resources",), params=("category",))
 def resources(request):
     """
     Public resources page with categorized downloadable materials.
@@ -661,26 +391,17 @@ def resources(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch all active resources
         url = f"{base_url}/rest/v1/resources?status=eq.active&select=*&order=display_order.asc,created_at.desc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
 
         if resp.status_code == 200:
             all_resources = resp.json()
-            # Normalize file URLs and group by category
-            storage_base = f"{base_url}/storage/v1/object/public/resources/"
+            # Group by category
+            storage_urls.canonicalize_rows(all_resources, "resources")
             for resource in all_resources:
-                if resource.get("file_url") and not str(resource["file_url"]).startswith("http"):
-                    resource["file_url"] = storage_base + str(resource["file_url"]).lstrip("/")
-                if resource.get("thumbnail_url") and not str(resource["thumbnail_url"]).startswith("http"):
-                    resource["thumbnail_url"] = storage_base + str(resource["thumbnail_url"]).lstrip("/")
-
                 category = resource.get("category", "download_centre")
                 if category in resources_data:
                     resources_data[category].append(resource)
@@ -701,6 +422,7 @@ def resources(request):
     })
 
 
+@cache_public_page(120, tags=("members",))
 def membership(request):
     """
     Public membership page: show members who currently have explicit roles,
@@ -710,18 +432,14 @@ def membership(request):
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         table_url = f"{base_url}/rest/v1/members"
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
         # Fetch all members; we will do the simple logic in Python:
         # "if membership_type is set, show on /membership/"
         params = {
             "select": "member_id,full_name,email,phone_number,membership_type,status,based_in_nigeria,state,lga,country,city,engagement_preferences,created_at,profile_image_url",
             "order": "created_at.desc",
         }
-        resp = requests.get(table_url, headers=headers, params=params, timeout=10)
+        resp = supabase_rest.get(table_url, headers=headers, params=params, timeout=10)
         resp.raise_for_status()
         all_members = resp.json()
 
@@ -730,12 +448,7 @@ def membership(request):
             m for m in all_members if (m.get("membership_type") or "").strip()
         ]
 
-        # Normalize profile_image_url to a full public URL if only a path is stored
-        bucket_base = settings.SUPABASE_URL.rstrip("/") + "/storage/v1/object/public/profiles/"
-        for m in members_with_roles:
-            path = m.get("profile_image_url")
-            if path and not str(path).startswith("http"):
-                m["profile_image_url"] = bucket_base + str(path).lstrip("/")
+        storage_urls.canonicalize_rows(members_with_roles, "members")
 
     except Exception as e:
         print(f"[Membership public] Failed to fetch members from Supabase: {e}")
@@ -763,24 +476,16 @@ def suspended_members_page(request):
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         table_url = f"{base_url}/rest/v1/members"
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
         params = {
             "select": "member_id,full_name,membership_type,status,based_in_nigeria,state,country,created_at,profile_image_url",
             "order": "created_at.desc",
             "status": "eq.suspended",
         }
-        resp = requests.get(table_url, headers=headers, params=params, timeout=10)
+        resp = supabase_rest.get(table_url, headers=headers, params=params, timeout=10)
         if resp.status_code == 200:
             members = resp.json()
-        bucket_base = settings.SUPABASE_URL.rstrip("/") + "/storage/v1/object/public/profiles/"
-        for m in members:
-            path = m.get("profile_image_url")
-            if path and not str(path).startswith("http"):
-                m["profile_image_url"] = bucket_base + str(path).lstrip("/")
+        storage_urls.canonicalize_rows(members, "members")
     except Exception as e:
         print(f"[Suspended members] Failed to fetch from Supabase: {e}")
 
@@ -805,24 +510,16 @@ def banned_accounts_page(request):
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         table_url = f"{base_url}/rest/v1/members"
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
         params = {
             "select": "member_id,full_name,membership_type,status,based_in_nigeria,state,country,created_at,profile_image_url",
             "order": "created_at.desc",
             "status": "eq.banned",
         }
-        resp = requests.get(table_url, headers=headers, params=params, timeout=10)
+        resp = supabase_rest.get(table_url, headers=headers, params=params, timeout=10)
         if resp.status_code == 200:
             members = resp.json()
-        bucket_base = settings.SUPABASE_URL.rstrip("/") + "/storage/v1/object/public/profiles/"
-        for m in members:
-            path = m.get("profile_image_url")
-            if path and not str(path).startswith("http"):
-                m["profile_image_url"] = bucket_base + str(path).lstrip("/")
+        storage_urls.canonicalize_rows(members, "members")
     except Exception as e:
         print(f"[Banned accounts] Failed to fetch from Supabase: {e}")
 
@@ -839,6 +536,7 @@ def banned_accounts_page(request):
     )
 
 
+@cache_public_page(600, tags=("leadership",))
 def leadership(request):
     """Public leadership page with all leadership data from Supabase."""
     founding_vision = []
@@ -849,14 +547,10 @@ def leadership(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch founding vision
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/founding_vision",
             headers=headers,
             params={"select": "*", "is_active": "eq.true", "order": "display_order.asc"},
@@ -866,7 +560,7 @@ def leadership(request):
             founding_vision = resp.json()
 
         # Fetch leadership council
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/leadership_council",
             headers=headers,
             params={"select": "*", "is_active": "eq.true", "order": "display_order.asc"},
@@ -874,12 +568,10 @@ def leadership(request):
         )
         if resp.status_code == 200:
             leadership_council = resp.json()
-            # Normalize image URLs
-            for leader in leadership_council:
-                leader["profile_image_url"] = _normalize_leadership_image_url(leader.get("profile_image_url"))
+            storage_urls.canonicalize_rows(leadership_council, "leadership_council")
 
         # Fetch strategic committees
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/strategic_committees",
             headers=headers,
             params={"select": "*", "is_active": "eq.true", "order": "display_order.asc"},
@@ -887,12 +579,10 @@ def leadership(request):
         )
         if resp.status_code == 200:
             strategic_committees = resp.json()
-            # Normalize image URLs
-            for committee in strategic_committees:
-                committee["profile_image_url"] = _normalize_leadership_image_url(committee.get("profile_image_url"))
+            storage_urls.canonicalize_rows(strategic_committees, "strategic_committees")
 
         # Fetch advisory voices
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/advisory_voices",
             headers=headers,
             params={"select": "*", "is_active": "eq.true", "order": "display_order.asc"},
@@ -900,12 +590,10 @@ def leadership(request):
         )
         if resp.status_code == 200:
             advisory_voices = resp.json()
-            # Normalize image URLs
-            for advisor in advisory_voices:
-                advisor["profile_image_url"] = _normalize_leadership_image_url(advisor.get("profile_image_url"))
+            storage_urls.canonicalize_rows(advisory_voices, "advisory_voices")
 
         # Fetch code of conduct
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/code_of_conduct",
             headers=headers,
             params={"select": "*", "is_active": "eq.true", "order": "display_order.asc"},
@@ -926,10 +614,19 @@ def leadership(request):
     })
 
 
+@cache_public_page(120, tags=("blogs",), params=("category", "q", "cursor"))
 def blog(request):
-    """Public blog listing page - shows all published blogs with featured latest post and filtering."""
+    """
+    Public blog listing page - featured latest post, one keyset page of cards and
+    filtering. Further pages load through ?cursor= / api_blog_list.
+    """
+    from . import blog_listing, blog_facets, blog_search
+
     blogs = []
     featured_blog = None
+    next_cursor = None
+    listing_total = None
+    total_published = None
     all_categories = []
     all_tags = []
     trending_blogs = []
@@ -937,89 +634,31 @@ def blog(request):
     # Get filter parameters
     category_filter = request.GET.get("category", "").strip()
     search_query = request.GET.get("q", "").strip()
+    cursor = request.GET.get("cursor", "").strip()
 
     try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-
-        # Build query URL with filters
-        url = f"{base_url}/rest/v1/blogs?is_published=eq.true&select=*&order=published_at.desc,created_at.desc"
-
-        if category_filter:
-            url += f"&category=eq.{category_filter}"
-
         if search_query:
-            # Search in title and content (use ilike for case-insensitive)
-            url += f"&or=(title.ilike.*{search_query}*,excerpt.ilike.*{search_query}*)"
-
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            blogs = resp.json()
-            # Parse dates and normalize image URLs
-            for b in blogs:
-                for key in ("published_at", "created_at", "updated_at"):
-                    val = b.get(key)
-                    if val and isinstance(val, str) and val.strip():
-                        try:
-                            if "T" in val:
-                                b[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                            else:
-                                b[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                        except (ValueError, TypeError):
-                            b[key] = None
-
-                # Normalize featured_image_url - ensure it's a full public URL
-                if b.get("featured_image_url"):
-                    b["featured_image_url"] = _normalize_blog_image_url(b["featured_image_url"], base_url)
-
-            # Get featured blog (most recent) - only if no filters applied
-            if blogs and not category_filter and not search_query:
-                featured_blog = blogs[0]
-                blogs = blogs[1:]  # Rest of blogs
-
-        # Fetch all categories for filter sidebar (from all blogs, not filtered)
-        cat_url = f"{base_url}/rest/v1/blogs?is_published=eq.true&select=category"
-        cat_resp = requests.get(cat_url, headers=headers, timeout=10)
-        if cat_resp.status_code == 200:
-            categories_data = cat_resp.json()
-            # Count categories
-            cat_counts = {}
-            for item in categories_data:
-                cat = item.get("category", "general") or "general"
-                cat_counts[cat] = cat_counts.get(cat, 0) + 1
-            all_categories = sorted(cat_counts.items(), key=lambda x: x[1], reverse=True)
-
-        # Fetch trending blogs (most viewed)
-        trending_url = f"{base_url}/rest/v1/blogs?is_published=eq.true&select=id,title,slug,category,view_count,published_at&order=view_count.desc&limit=5"
-        trending_resp = requests.get(trending_url, headers=headers, timeout=10)
-        if trending_resp.status_code == 200:
-            trending_blogs = trending_resp.json()
-            for b in trending_blogs:
-                val = b.get("published_at")
-                if val and isinstance(val, str) and val.strip():
-                    try:
-                        if "T" in val:
-                            b["published_at"] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                        else:
-                            b["published_at"] = datetime.strptime(val, "%Y-%m-%d").date()
-                    except (ValueError, TypeError):
-                        b["published_at"] = None
-
-        # Collect all unique tags
-        tags_url = f"{base_url}/rest/v1/blogs?is_published=eq.true&select=tags"
-        tags_resp = requests.get(tags_url, headers=headers, timeout=10)
-        if tags_resp.status_code == 200:
-            tags_data = tags_resp.json()
-            tag_set = set()
-            for item in tags_data:
-                tags = item.get("tags") or []
-                if isinstance(tags, list):
-                    tag_set.update(tags)
-            all_tags = sorted(list(tag_set))[:15]  # Limit to 15 tags
+            # Ranked results from the in-process search index (one page, best first)
+            blogs = blog_search.search(search_query, category_filter, limit=getattr(settings, "BLOG_SEARCH_RESULTS", 30))
+        else:
+            # One page of card columns, continuing after ?cursor= when given
+            page = blog_listing.fetch_page(category_filter, cursor or None)
+            blogs = page["posts"]
+            next_cursor = page["next_cursor"]
+
+        # Get featured blog (most recent) - only on the first unfiltered page
+        if blogs and not category_filter and not search_query and not cursor:
+            featured_blog = blogs[0]
+            blogs = blogs[1:]  # Rest of blogs
+
+        # Sidebar (categories, tag cloud, trending) from the in-memory facet index
+        facets = blog_facets.sidebar()
+        all_categories = facets["categories"]
+        all_tags = facets["tags"]
+        trending_blogs = facets["trending"]
+        total_published = facets["total"]
+        if not search_query:
+            listing_total = facets["category_counts"].get(category_filter, 0) if category_filter else total_published
 
     except Exception as e:
         print(f"[Blog] Error fetching blogs: {e}")
@@ -1032,79 +671,122 @@ def blog(request):
         "trending_blogs": trending_blogs,
         "category_filter": category_filter,
         "search_query": search_query,
+        "next_cursor": next_cursor,
+        "listing_total": listing_total,
+        "total_published": total_published,
+    })
+
+
+def api_blog_list(request):
+    """GET ?cursor=&category= — next page of blog cards for "load more" (same cursor as /blog/?cursor=)."""
+    from . import blog_listing
+
+    category_filter = request.GET.get("category", "").strip()
+    cursor = request.GET.get("cursor", "").strip()
+    try:
+        page = blog_listing.fetch_page(category_filter, cursor or None)
+    except Exception as e:
+        print(f"[Blog List API] Error: {e}")
+        return JsonResponse({"success": False, "error": "Could not load posts."}, status=500)
+
+    html = "".join(render_to_string("partials/blog_card.html", {"blog": b}, request=request) for b in page["posts"])
+    return JsonResponse({
+        "success": True,
+        "html": html,
+        "count": len(page["posts"]),
+        "next_cursor": page["next_cursor"],
     })
 
 
+def api_blog_search(request):
+    """GET ?q=&category=&limit= — ranked blog search with highlighted title and snippet (type-ahead friendly)."""
+    from . import blog_search
+
+    query = request.GET.get("q", "").strip()
+    category_filter = request.GET.get("category", "").strip()
+    try:
+        limit = min(max(int(request.GET.get("limit", 10)), 1), 50)
+    except ValueError:
+        limit = 10
+    if not query:
+        return JsonResponse({"success": True, "results": []})
+
+    try:
+        results = blog_search.search(query, category_filter, limit=limit)
+    except Exception as e:
+        print(f"[Blog Search API] Error: {e}")
+        return JsonResponse({"success": False, "error": "Search is unavailable right now."}, status=500)
+
+    return JsonResponse({
+        "success": True,
+        "results": [
+            {
+                "id": r["id"],
+                "title": r.get("title"),
+                "slug": r.get("slug"),
+                "url": f"/blog/{r.get('slug')}/",
+                "category": r.get("category"),
+                "featured_image_url": r.get("featured_image_url"),
+                "published_at": r["published_at"].isoformat() if r.get("published_at") else None,
+                "score": r["score"],
+                "title_html": r["title_html"],
+                "snippet_html": r["snippet_html"],
+            }
+            for r in results
+        ],
+    })
+
+
+def _count_blog_view(request, slug):
+    """Count a view of a cached blog page (slug -> id is remembered when the page is rendered)."""
+    from django.core.cache import cache
+    blog_id = cache.get(f"blog:slug_id:{slug}")
+    if blog_id:
+        counters.increment("blogs", blog_id, "view_count")
+
+
+@cache_public_page(300, tags=("blogs",), on_hit=_count_blog_view)
 def blog_detail(request, slug):
     """Public blog detail page with related blogs."""
+    from django.core.cache import cache
     blog_post = None
     related_blogs = []
     
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
         
         # Fetch blog by slug
         url = f"{base_url}/rest/v1/blogs?slug=eq.{slug}&is_published=eq.true&select=*&limit=1"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200 and resp.json():
-            blog_post = resp.json()[0]
+            blog_post = records.decode("blogs", resp.json()[0])
+            storage_urls.canonicalize_rows([blog_post], "blogs")
             
-            # Parse dates
-            for key in ("published_at", "created_at", "updated_at"):
-                val = blog_post.get(key)
-                if val and isinstance(val, str) and val.strip():
-                    try:
-                        if "T" in val:
-                            blog_post[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                        else:
-                            blog_post[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                    except (ValueError, TypeError):
-                        blog_post[key] = None
-            
-            # Normalize featured_image_url - ensure it's a full public URL
-            if blog_post.get("featured_image_url"):
-                blog_post["featured_image_url"] = _normalize_blog_image_url(blog_post["featured_image_url"], base_url)
+            # Increment view count (buffered, flushed in batches by main/counters.py)
+            counters.increment("blogs", blog_post.get("id"), "view_count")
+            cache.set(f"blog:slug_id:{slug}", blog_post.get("id"), None)
             
-            # Increment view count
-            try:
-                view_count = blog_post.get("view_count", 0) or 0
-                requests.patch(
-                    f"{base_url}/rest/v1/blogs?id=eq.{blog_post.get('id')}",
-                    headers=_get_supabase_headers(),
-                    json={"view_count": view_count + 1},
-                    timeout=5
-                )
-            except:
-                pass
-            
-            # Fetch related blogs (same category, exclude current) - get 5 for sidebar
+            # Related blogs precomputed by main/related_posts.py (one cached lookup)
+            from . import related_posts
             category = blog_post.get("category", "")
-            if category:
-                related_url = f"{base_url}/rest/v1/blogs?category=eq.{category}&is_published=eq.true&slug=neq.{slug}&select=*&order=published_at.desc&limit=5"
-                related_resp = requests.get(related_url, headers=headers, timeout=10)
-                if related_resp.status_code == 200:
-                    related_blogs = related_resp.json()
-                    # Parse dates and normalize image URLs
-                    for b in related_blogs:
-                        for key in ("published_at", "created_at", "updated_at"):
-                            val = b.get(key)
-                            if val and isinstance(val, str) and val.strip():
-                                try:
-                                    if "T" in val:
-                                        b[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                                    else:
-                                        b[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                                except (ValueError, TypeError):
-                                    b[key] = None
-                        
-                        # Normalize featured_image_url for related blogs
-                        if b.get("featured_image_url"):
-                            b["featured_image_url"] = _normalize_blog_image_url(b["featured_image_url"], base_url)
+
+            def same_category():
+                # Not computed yet: same category, exclude current - get 5 for sidebar
+                if not category:
+                    return []
+                return supabase_rest.select(
+                    "blogs",
+                    columns=",".join(related_posts.CARD_KEYS),
+                    filters={"category": f"eq.{category}", "is_published": "eq.true", "slug": f"neq.{slug}"},
+                    order="published_at.desc",
+                    limit=5,
+                )
+
+            try:
+                related_blogs = related_posts.get(blog_post.get("id"), fallback=same_category)
+            except Exception as e:
+                print(f"[Blog Detail] Related posts lookup failed: {e}")
     except Exception as e:
         print(f"[Blog Detail] Error: {e}")
     
@@ -1120,39 +802,41 @@ def blog_detail(request, slug):
 
 def _get_supabase_headers_for_api():
     """Headers for Supabase REST API (comments/likes)."""
-    return {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    return supabase_rest.write_headers("return=representation")
 
 
 def api_blog_comments_list(request):
-    """GET ?blog_id=<uuid> — list all comments for a blog (flat, with parent_id for threading)."""
+    """
+    GET ?blog_id=<uuid>&cursor=&parent_id=&limit= — one page of threaded comments.
+    Top-level comments by default (oldest first, with reply_count); ?parent_id= pages the replies
+    of one comment. Honours If-None-Match with the ETag of the blog's latest comment.
+    """
+    from django.http import HttpResponseNotModified
+    from . import blog_comments
+
     blog_id = request.GET.get("blog_id", "").strip()
     if not blog_id:
         return JsonResponse({"success": False, "error": "blog_id required"}, status=400)
+    parent_id = request.GET.get("parent_id", "").strip()
+    cursor = request.GET.get("cursor", "").strip()
     try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers_for_api()
-        url = f"{base_url}/rest/v1/blog_comments?blog_id=eq.{blog_id}&select=*&order=created_at.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code != 200:
-            return JsonResponse({"success": False, "error": "Failed to fetch comments"}, status=502)
-        comments = resp.json()
-        # Serialize dates
-        for c in comments:
-            for key in ("created_at", "updated_at"):
-                if c.get(key) and isinstance(c[key], str):
-                    try:
-                        c[key] = c[key].replace("Z", "+00:00")[:19]
-                    except Exception:
-                        pass
-        return JsonResponse({"success": True, "comments": comments})
+        size = min(max(int(request.GET.get("limit", blog_comments.page_size())), 1), 100)
+    except ValueError:
+        size = blog_comments.page_size()
+    try:
+        etag = blog_comments.etag(blog_id, parent_id, cursor, size)
+        if_none_match = request.headers.get("If-None-Match", "")
+        if etag in [t.strip() for t in if_none_match.split(",")]:
+            response = HttpResponseNotModified()
+        else:
+            page = blog_comments.fetch_page(blog_id, parent_id, cursor or None, size)
+            response = JsonResponse({"success": True, **page})
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
     except Exception as e:
-        return JsonResponse({"success": False, "error": str(e)}, status=500)
+        print(f"[Blog Comments] Error: {e}")
+        return JsonResponse({"success": False, "error": "Failed to fetch comments"}, status=502)
 
 
 @require_POST
@@ -1183,11 +867,13 @@ def api_blog_comment_create(request):
         if parent_id:
             payload["parent_id"] = parent_id
         url = f"{base_url}/rest/v1/blog_comments"
-        resp = requests.post(url, headers=headers, json=payload, timeout=10)
+        resp = supabase_rest.post(url, headers=headers, json=payload, timeout=10)
         if resp.status_code not in (200, 201):
             return JsonResponse({"success": False, "error": resp.text or "Failed to create comment"}, status=400)
         data = resp.json()
         created = data[0] if isinstance(data, list) else data
+        from . import blog_comments
+        blog_comments.note_created(created)
         for key in ("created_at", "updated_at"):
             if created.get(key) and isinstance(created[key], str):
                 created[key] = created[key].replace("Z", "+00:00")[:19]
@@ -1198,7 +884,7 @@ def api_blog_comment_create(request):
 
 @require_POST
 def api_blog_comment_like(request):
-    """POST JSON: comment_id, visitor_fingerprint. Toggle like (insert or delete). Returns { liked, like_count }."""
+    """POST JSON: comment_id, visitor_fingerprint. Toggle like in one atomic RPC call. Returns { liked, like_count }."""
     try:
         import json
         body = json.loads(request.body) if request.body else {}
@@ -1208,31 +894,10 @@ def api_blog_comment_like(request):
     visitor_fingerprint = (body.get("visitor_fingerprint") or "").strip()
     if not comment_id or not visitor_fingerprint:
         return JsonResponse({"success": False, "error": "comment_id and visitor_fingerprint required"}, status=400)
+    from . import blog_comments
     try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers_for_api()
-        # Check if already liked
-        check_url = f"{base_url}/rest/v1/blog_comment_likes?comment_id=eq.{comment_id}&visitor_fingerprint=eq.{visitor_fingerprint}&select=id"
-        check = requests.get(check_url, headers=headers, timeout=10)
-        existing = check.json() if check.status_code == 200 else []
-        if existing:
-            # Unlike: delete row
-            like_id = existing[0]["id"]
-            requests.delete(f"{base_url}/rest/v1/blog_comment_likes?id=eq.{like_id}", headers=headers, timeout=10)
-            # Get new like_count
-            count_resp = requests.get(f"{base_url}/rest/v1/blog_comments?id=eq.{comment_id}&select=like_count", headers=headers, timeout=10)
-            like_count = 0
-            if count_resp.status_code == 200 and count_resp.json():
-                like_count = count_resp.json()[0].get("like_count", 0)
-            return JsonResponse({"success": True, "liked": False, "like_count": like_count})
-        else:
-            # Like: insert
-            requests.post(f"{base_url}/rest/v1/blog_comment_likes", headers=headers, json={"comment_id": comment_id, "visitor_fingerprint": visitor_fingerprint}, timeout=10)
-            count_resp = requests.get(f"{base_url}/rest/v1/blog_comments?id=eq.{comment_id}&select=like_count", headers=headers, timeout=10)
-            like_count = 0
-            if count_resp.status_code == 200 and count_resp.json():
-                like_count = count_resp.json()[0].get("like_count", 0)
-            return JsonResponse({"success": True, "liked": True, "like_count": like_count})
+        liked, like_count = blog_comments.toggle_like(comment_id, visitor_fingerprint)
+        return JsonResponse({"success": True, "liked": liked, "like_count": like_count})
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)}, status=500)
 
@@ -1243,25 +908,93 @@ def api_blog_comment_likes_check(request):
     fingerprint = (request.GET.get("visitor_fingerprint") or request.GET.get("fingerprint") or "").strip()
     if not comment_ids or not fingerprint:
         return JsonResponse({"success": True, "liked_ids": []})
-    ids_list = [x.strip() for x in comment_ids.split(",") if x.strip()]
+    ids_list = [x.strip() for x in comment_ids.split(",") if x.strip()][:200]
     if not ids_list:
         return JsonResponse({"success": True, "liked_ids": []})
+    from . import blog_comments
     try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers_for_api()
-        # Filter: comment_id in (id1, id2, ...) and visitor_fingerprint = fingerprint
-        filter_ids = "&".join([f"comment_id=eq.{cid}" for cid in ids_list])
-        url = f"{base_url}/rest/v1/blog_comment_likes?visitor_fingerprint=eq.{fingerprint}&select=comment_id"
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code != 200:
-            return JsonResponse({"success": True, "liked_ids": []})
-        rows = resp.json()
-        liked_ids = [r["comment_id"] for r in rows if r.get("comment_id") in ids_list]
-        return JsonResponse({"success": True, "liked_ids": liked_ids})
+        return JsonResponse({"success": True, "liked_ids": blog_comments.liked_ids(ids_list, fingerprint)})
     except Exception:
         return JsonResponse({"success": True, "liked_ids": []})
 
 
+def _feed_response(request, name):
+    """Serve a prebuilt sitemap/feed with ETag and Last-Modified; revalidation gets a 304."""
+    from django.utils.cache import get_conditional_response
+    from django.utils.http import http_date
+    from . import feeds
+
+    base_url = (getattr(settings, "SITE_URL", "") or request.build_absolute_uri("/")).rstrip("/")
+    try:
+        built = feeds.artifact(name, base_url)
+    except Exception as e:
+        print(f"[Feeds] Building {name} failed: {e}")
+        return HttpResponse("Feed temporarily unavailable.", status=503, content_type="text/plain")
+    last_modified = int(built["last_modified"])
+    conditional = get_conditional_response(request, etag=built["etag"], last_modified=last_modified)
+    response = conditional or HttpResponse(built["body"], content_type=built["content_type"])
+    response["ETag"] = built["etag"]
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = f"public, max-age={getattr(settings, 'FEEDS_MAX_AGE', 300)}"
+    return response
+
+
+def sitemap_xml(request):
+    return _feed_response(request, "sitemap")
+
+
+def blog_rss(request):
+    return _feed_response(request, "blog_rss")
+
+
+def blog_atom(request):
+    return _feed_response(request, "blog_atom")
+
+
+def cases_rss(request):
+    return _feed_response(request, "cases_rss")
+
+
+def cases_atom(request):
+    return _feed_response(request, "cases_atom")
+
+
+def api_job_status(request, job_id):
+    """Poll a background job (main/jobs.py): status, attempts, last error and result."""
+    try:
+        job = jobs.status(job_id)
+    except Exception as e:
+        print(f"[Jobs] Status lookup failed: {e}")
+        return JsonResponse({"success": False, "error": "Status unavailable"}, status=503)
+    if job is None:
+        return JsonResponse({"success": False, "error": "Job not found"}, status=404)
+    response = JsonResponse({"success": True, "job": job})
+    response["Cache-Control"] = "no-store"
+    return response
+
+
+def resized_image(request, preset, bucket, path):
+    """
+    A Storage image scaled down to a named preset (see main/image_proxy.py),
+    served from the local disk cache with immutable caching headers.
+    """
+    from django.http import FileResponse
+
+    fmt = "webp" if "image/webp" in request.META.get("HTTP_ACCEPT", "") else "jpeg"
+    try:
+        cached = image_proxy.get(preset, bucket, path, fmt)
+    except image_proxy.ProxyError as e:
+        if e.status >= 500:
+            print(f"[Image Proxy] {e}")
+        return HttpResponse(status=e.status)
+
+    response = FileResponse(open(cached, "rb"), content_type=image_proxy.FORMATS[fmt])
+    response["Cache-Control"] = "public, max-age=31536000, immutable"
+    response["Vary"] = "Accept"
+    response["ETag"] = '"' + os.path.basename(cached) + '"'
+    return response
+
+
 def features(request):
     return render(request, "features.html")
 
@@ -1280,14 +1013,10 @@ def messages_page(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch active messages
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/shareable_messages?is_active=eq.true&select=*&order=is_featured.desc,display_order.asc,created_at.desc",
             headers=headers,
             timeout=10
@@ -1430,14 +1159,10 @@ def _generate_member_id(region_key: str) -> str:
     """
     base_url = settings.SUPABASE_URL.rstrip("/")
     rpc_url = f"{base_url}/rest/v1/rpc/get_next_member_number"
-    headers = {
-        "apikey": settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_KEY}",
-        "Content-Type": "application/json",
-    }
+    headers = supabase_rest.write_headers(anon=True)
 
     try:
-        resp = requests.post(rpc_url, headers=headers, json={"p_region_key": region_key}, timeout=10)
+        resp = supabase_rest.post(rpc_url, headers=headers, json={"p_region_key": region_key}, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         # Supabase RPC may return a bare integer or a dict
@@ -1472,12 +1197,7 @@ def _create_member_in_supabase(
 ):
     base_url = settings.SUPABASE_URL.rstrip("/")
     table_url = f"{base_url}/rest/v1/members"
-    headers = {
-        "apikey": settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_KEY}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    headers = supabase_rest.write_headers("return=representation", anon=True)
 
     payload = {
         "member_id": member_id,
@@ -1495,8 +1215,10 @@ def _create_member_in_supabase(
         "status": "active",
     }
 
-    resp = requests.post(table_url, headers=headers, json=payload, timeout=10)
+    resp = supabase_rest.post(table_url, headers=headers, json=payload, timeout=10)
     resp.raise_for_status()
+    member_sampler.invalidate()
+    purge_pages("members")
     return resp.json()
 
 
@@ -1508,65 +1230,40 @@ def _upload_profile_image_to_supabase(member_id: str, file_obj) -> str | None:
     if not file_obj:
         return None
 
-    try:
-        supabase = get_supabase()
-    except Exception as e:
-        # If Supabase client cannot be created, don't block signup
-        print(f"[Supabase] Failed to init client for profile upload: {e}")
-        return None
-
-    # Build a stable path: member_id/randomSuffix.ext
+    # Content-addressed path: member_id/<sha256>.ext, so re-uploading the same photo is free
     original_name = getattr(file_obj, "name", "profile.jpg")
     _, ext = os.path.splitext(original_name)
     if not ext:
         ext = ".jpg"
-    random_suffix = get_random_string(8)
-    path = f"{member_id}/{random_suffix}{ext}"
 
     try:
-        content = file_obj.read()
-        storage = supabase.storage.from_("profiles")
-        storage.upload(path, content)
-        public_url = storage.get_public_url(path)
-        return public_url
+        # Streamed from the upload's chunks, never read whole into memory
+        return storage_upload.upload_content_addressed(file_obj, "profiles", member_id, ext=ext)
     except Exception as e:
         # Log but do not fail the whole registration
         print(f"[Supabase] Failed to upload profile image: {e}")
         return None
 
 
-def _upload_leadership_image_to_supabase(table_name: str, item_id: str, file_obj) -> str | None:
+def _upload_leadership_image_to_supabase(table_name: str, file_obj) -> str | None:
     """
     Upload the given profile image file to the Supabase "leadership" bucket.
     Returns the public URL if successful, or None on failure.
     
     Args:
         table_name: The table name (e.g., 'leadership_council', 'strategic_committees', 'advisory_voices')
-        item_id: The ID of the item (or a generated identifier if creating new)
         file_obj: The file object to upload
     """
     if not file_obj:
         return None
 
-    try:
-        supabase = get_supabase()
-    except Exception as e:
-        print(f"[Supabase] Failed to init client for leadership image upload: {e}")
-        return None
-
-    # Build a stable path: table_name/item_id/randomSuffix.ext
+    # Content-addressed path: table_name/<sha256>.ext, shared by every item using the same photo
     original_name = getattr(file_obj, "name", "profile.jpg")
     _, ext = os.path.splitext(original_name)
     if not ext:
         ext = ".jpg"
-    random_suffix = get_random_string(8)
-    # Use item_id if available, otherwise generate a temporary identifier
-    identifier = item_id if item_id else get_random_string(12)
-    path = f"{table_name}/{identifier}/{random_suffix}{ext}"
 
     try:
-        content = file_obj.read()
-        storage = supabase.storage.from_("leadership")
         # Determine content type based on extension
         ext_lower = ext.lstrip('.').lower()
         content_type_map = {
@@ -1577,114 +1274,70 @@ def _upload_leadership_image_to_supabase(table_name: str, item_id: str, file_obj
             'webp': 'image/webp',
         }
         content_type = content_type_map.get(ext_lower, 'image/jpeg')
-        storage.upload(path, content, file_options={"content-type": content_type})
-        public_url = storage.get_public_url(path)
-        return public_url
+        return storage_upload.upload_content_addressed(file_obj, "leadership", table_name, content_type, ext=ext)
     except Exception as e:
         print(f"[Supabase] Failed to upload leadership image: {e}")
         return None
 
 
-def _normalize_leadership_image_url(image_url: str | None) -> str | None:
-    """
-    Normalize leadership image URL to a full public URL if only a path is stored.
-    """
-    if not image_url:
-        return None
-    
-    if str(image_url).startswith("http"):
-        return image_url
-    
-    base_url = settings.SUPABASE_URL.rstrip("/")
-    bucket_base = f"{base_url}/storage/v1/object/public/leadership/"
-    return bucket_base + str(image_url).lstrip("/")
 
 
 def _send_welcome_email(request, email: str, full_name: str, member_id: str):
     """
-    Send a rich welcome email including member ID, badge download, resources links, and responsibilities.
+    Queue a rich welcome email including member ID, badge download, resources links, and responsibilities.
+    The email is rendered and sent by the job worker (main/tasks.py), so SMTP never delays signup.
     """
     from django.urls import reverse
-    from datetime import datetime
-    
+
     # Build absolute URLs using request to get the current host
     base_url = request.build_absolute_uri('/').rstrip('/')
-    
-    member_resources_url = request.build_absolute_uri(reverse('member_resources'))
-    badge_download_url = request.build_absolute_uri(reverse('member_dashboard'))  # Badge download is on dashboard
-    website_url = base_url
-    
-    subject = "Welcome to the RATEL Movement"
-    context = {
-        "full_name": full_name,
-        "member_id": member_id,
-        "member_resources_url": member_resources_url,
-        "badge_download_url": badge_download_url,
-        "website_url": website_url,
-        "current_year": datetime.now().year,
-    }
-    html_message = render_to_string("emails/welcome_member.html", context)
-    plain_message = strip_tags(html_message)
-    from_email = settings.DEFAULT_FROM_EMAIL
-
-    send_mail(
-        subject,
-        plain_message,
-        from_email,
-        [email],
-        html_message=html_message,
-        fail_silently=True,
-    )
 
+    try:
+        jobs.enqueue("email.welcome", {
+            "email": email,
+            "full_name": full_name,
+            "member_id": member_id,
+            "member_resources_url": request.build_absolute_uri(reverse('member_resources')),
+            "badge_download_url": request.build_absolute_uri(reverse('member_dashboard')),  # Badge download is on dashboard
+            "website_url": base_url,
+        }, idempotency_key=f"welcome-email:{member_id}")
+    except Exception as e:
+        print(f"[Welcome Email] Could not queue email for {member_id}: {e}")
 
-def _send_donation_thank_you(request, donor_email: str, donor_name: str, amount: float):
-    """Send thank-you email to donor after successful donation."""
-    subject = "Thank you for your donation - RATEL Movement"
-    context = {
-        "donor_name": donor_name or "Valued Supporter",
-        "amount": f"{amount:,.2f}".rstrip("0").rstrip("."),
-        "current_year": datetime.now().year,
-    }
-    html_message = render_to_string("emails/donation_thank_you.html", context)
-    plain_message = strip_tags(html_message)
+
+def _send_donation_thank_you(request, donor_email: str, donor_name: str, amount: float, reference: str):
+    """Queue the thank-you email to a donor after a successful donation (sent by the job worker)."""
     try:
-        send_mail(
-            subject,
-            plain_message,
-            settings.DEFAULT_FROM_EMAIL,
-            [donor_email],
-            html_message=html_message,
-            fail_silently=True,
-        )
+        jobs.enqueue("email.templated", {
+            "subject": "Thank you for your donation - RATEL Movement",
+            "template": "emails/donation_thank_you.html",
+            "context": {
+                "donor_name": donor_name or "Valued Supporter",
+                "amount": f"{amount:,.2f}".rstrip("0").rstrip("."),
+            },
+            "to": donor_email,
+        }, idempotency_key=f"donation-thanks:{reference}")
     except Exception as e:
-        print(f"[Donation Thank You Email] Error: {e}")
+        print(f"[Donation Thank You Email] Could not queue email: {e}")
 
 
-def _send_renewal_thank_you(request, member_email: str, member_name: str, member_id: str, end_date: str):
-    """Send thank-you email to member after successful membership renewal."""
+def _send_renewal_thank_you(request, member_email: str, member_name: str, member_id: str, end_date: str, reference: str):
+    """Queue the thank-you email to a member after a successful renewal (sent by the job worker)."""
     from django.urls import reverse
-    subject = "Thank you for renewing - RATEL Movement"
-    member_dashboard_url = request.build_absolute_uri(reverse("member_dashboard"))
-    context = {
-        "member_name": member_name or "Member",
-        "member_id": member_id or "—",
-        "end_date": end_date,
-        "member_dashboard_url": member_dashboard_url,
-        "current_year": datetime.now().year,
-    }
-    html_message = render_to_string("emails/renewal_thank_you.html", context)
-    plain_message = strip_tags(html_message)
     try:
-        send_mail(
-            subject,
-            plain_message,
-            settings.DEFAULT_FROM_EMAIL,
-            [member_email],
-            html_message=html_message,
-            fail_silently=True,
-        )
+        jobs.enqueue("email.templated", {
+            "subject": "Thank you for renewing - RATEL Movement",
+            "template": "emails/renewal_thank_you.html",
+            "context": {
+                "member_name": member_name or "Member",
+                "member_id": member_id or "—",
+                "end_date": end_date,
+                "member_dashboard_url": request.build_absolute_uri(reverse("member_dashboard")),
+            },
+            "to": member_email,
+        }, idempotency_key=f"renewal-thanks:{reference}")
     except Exception as e:
-        print(f"[Renewal Thank You Email] Error: {e}")
+        print(f"[Renewal Thank You Email] Could not queue email: {e}")
 
 
 @require_POST
@@ -1749,7 +1402,7 @@ def auth_signup(request):
     _, paystack_secret_key = _get_paystack_keys()
 
     try:
-        verify_resp = requests.get(
+        verify_resp = supabase_rest.get(
             f"https://api.paystack.co/transaction/verify/{payment_reference}",
             headers={
                 "Authorization": f"Bearer {paystack_secret_key}",
@@ -1818,12 +1471,7 @@ def auth_signup(request):
         # Create initial subscription record in member_subscriptions
         try:
             base_url = settings.SUPABASE_URL.rstrip("/")
-            headers = {
-                "apikey": settings.SUPABASE_KEY,
-                "Authorization": f"Bearer {settings.SUPABASE_KEY}",
-                "Content-Type": "application/json",
-                "Prefer": "return=representation",
-            }
+            headers = supabase_rest.write_headers("return=representation", anon=True)
             now = datetime.utcnow()
             subscription_payload = {
                 "member_id": member_id,
@@ -1837,7 +1485,7 @@ def auth_signup(request):
                 "payment_method": "paystack",
                 "created_at": now.isoformat(),
             }
-            sub_resp = requests.post(
+            sub_resp = supabase_rest.post(
                 f"{base_url}/rest/v1/member_subscriptions",
                 headers=headers,
                 json=subscription_payload,
@@ -2251,7 +1899,7 @@ def dashboard_home(request):
         headers = _get_supabase_headers()
 
         # Fetch all members for stats
-        members_resp = requests.get(
+        members_resp = supabase_rest.get(
             f"{base_url}/rest/v1/members?select=member_id,full_name,email,based_in_nigeria,state,country,created_at,status,profile_image_url&order=created_at.desc",
             headers=headers,
             timeout=10
@@ -2264,24 +1912,18 @@ def dashboard_home(request):
             pending_members = sum(1 for m in members if m.get("status") == "pending")
             recent_members = members[:5]  # Get 5 most recent
 
-            # Normalize profile image URLs
-            bucket_base = f"{base_url}/storage/v1/object/public/profiles/"
-            for m in recent_members:
-                path = m.get("profile_image_url")
-                if path and not str(path).startswith("http"):
-                    m["profile_image_url"] = bucket_base + str(path).lstrip("/")
+            storage_urls.canonicalize_rows(recent_members, "members")
 
-        # Fetch announcements count
-        ann_resp = requests.get(
-            f"{base_url}/rest/v1/internal_announcements?select=id&is_active=eq.true",
-            headers=headers,
-            timeout=10
-        )
-        if ann_resp.status_code == 200:
-            announcements_count = len(ann_resp.json())
+        # Announcement and communication counts (one batched pass, no rows downloaded)
+        dashboard_counts = supabase_rest.counts({
+            "announcements": ("internal_announcements", {"is_active": "eq.true"}),
+            "communications": ("secure_communications", {"is_active": "eq.true"}),
+        })
+        announcements_count = dashboard_counts["announcements"]
+        communications_count = dashboard_counts["communications"]
 
         # Fetch recent announcements
-        ann_recent_resp = requests.get(
+        ann_recent_resp = supabase_rest.get(
             f"{base_url}/rest/v1/internal_announcements?select=id,title,recipient_type,priority,created_at&is_active=eq.true&order=created_at.desc&limit=3",
             headers=headers,
             timeout=10
@@ -2289,15 +1931,6 @@ def dashboard_home(request):
         if ann_recent_resp.status_code == 200:
             recent_announcements = ann_recent_resp.json()
 
-        # Fetch communications count
-        comm_resp = requests.get(
-            f"{base_url}/rest/v1/secure_communications?select=id&is_active=eq.true",
-            headers=headers,
-            timeout=10
-        )
-        if comm_resp.status_code == 200:
-            communications_count = len(comm_resp.json())
-
     except Exception as e:
         print(f"[Dashboard] Error fetching stats: {e}")
 
@@ -2331,11 +1964,7 @@ def dashboard_contacts(request):
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         table_url = f"{base_url}/rest/v1/members"
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
         # First try with extended fields (membership_type, status)
         params_full = {
             "select": "member_id,full_name,email,phone_number,based_in_nigeria,state,lga,country,city,engagement_preferences,created_at,membership_type,status,profile_image_url",
@@ -2345,7 +1974,7 @@ def dashboard_contacts(request):
             params_full["status"] = "eq.suspended"
         elif status_filter == "banned":
             params_full["status"] = "eq.banned"
-        resp = requests.get(table_url, headers=headers, params=params_full, timeout=10)
+        resp = supabase_rest.get(table_url, headers=headers, params=params_full, timeout=10)
         if resp.status_code == 200:
             members = resp.json()
         else:
@@ -2354,18 +1983,13 @@ def dashboard_contacts(request):
                 "select": "member_id,full_name,email,phone_number,based_in_nigeria,state,lga,country,city,engagement_preferences,created_at,profile_image_url",
                 "order": "created_at.desc",
             }
-            resp2 = requests.get(table_url, headers=headers, params=params_min, timeout=10)
+            resp2 = supabase_rest.get(table_url, headers=headers, params=params_min, timeout=10)
             resp2.raise_for_status()
             members = resp2.json()
             if status_filter in ("suspended", "banned"):
                 members = [m for m in members if (m.get("status") or "").lower() == status_filter]
 
-        # Normalise profile_image_url to a full public URL if only a path is stored
-        bucket_base = settings.SUPABASE_URL.rstrip("/") + "/storage/v1/object/public/profiles/"
-        for m in members:
-            path = m.get("profile_image_url")
-            if path and not str(path).startswith("http"):
-                m["profile_image_url"] = bucket_base + str(path).lstrip("/")
+        storage_urls.canonicalize_rows(members, "members")
     except Exception as e:
         # In case of error, just show empty table and avoid crashing dashboard
         print(f"[Membership] Failed to fetch members from Supabase: {e}")
@@ -2382,6 +2006,7 @@ def dashboard_contacts(request):
 
 
 @require_POST
+@purges_pages("members")
 def membership_manage(request):
     """
     Handle membership actions: assign role, suspend/unsuspend, delete.
@@ -2397,12 +2022,7 @@ def membership_manage(request):
 
     base_url = settings.SUPABASE_URL.rstrip("/")
     table_url = f"{base_url}/rest/v1/members"
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    headers = supabase_rest.write_headers("return=representation")
 
     payload = {}
     subject = ""
@@ -2509,8 +2129,9 @@ def membership_manage(request):
         # Delete from Supabase and mark status deleted
         try:
             delete_url = f"{table_url}?member_id=eq.{member_id}"
-            resp = requests.delete(delete_url, headers=headers, timeout=10)
+            resp = supabase_rest.delete(delete_url, headers=headers, timeout=10)
             resp.raise_for_status()
+            member_sampler.invalidate()
         except Exception as e:
             messages.error(request, f"Failed to delete member: {e}")
             return redirect("dashboard_membership")
@@ -2552,8 +2173,9 @@ def membership_manage(request):
     # For role / suspend we PATCH
     try:
         patch_url = f"{table_url}?member_id=eq.{member_id}"
-        resp = requests.patch(patch_url, headers=headers, json=payload, timeout=10)
+        resp = supabase_rest.patch(patch_url, headers=headers, json=payload, timeout=10)
         resp.raise_for_status()
+        member_sampler.invalidate()
     except Exception as e:
         messages.error(request, f"Failed to update member: {e}")
         return redirect("dashboard_membership")
@@ -2624,7 +2246,7 @@ def dashboard_about(request):
     try:
         # Fetch all site content sections (for landing page)
         url = f"{base_url}/rest/v1/site_content?select=*&order=display_order.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             data = resp.json()
             for item in data:
@@ -2632,14 +2254,14 @@ def dashboard_about(request):
 
         # Fetch about_pages content for About Ratel
         url = f"{base_url}/rest/v1/about_pages?page_key=eq.about_ratel&select=*&order=section_order.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             for item in resp.json():
                 about_ratel_sections[item.get("section_key")] = item
 
         # Fetch about_pages content for Mission & Vision
         url = f"{base_url}/rest/v1/about_pages?page_key=eq.mission_vision&select=*&order=section_order.asc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             for item in resp.json():
                 mission_vision_sections[item.get("section_key")] = item
@@ -2662,6 +2284,8 @@ def dashboard_about_save(request):
 
 
 @require_POST
+@invalidates_landing("sections")
+@purges_pages("landing")
 def dashboard_landing_save(request):
     """Save landing page content section to Supabase."""
     content_key = request.POST.get("section_key", "").strip()
@@ -2716,7 +2340,7 @@ def dashboard_landing_save(request):
         if content_id:
             # Update existing
             url = f"{base_url}/rest/v1/site_content?id=eq.{content_id}"
-            resp = requests.patch(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.patch(url, headers=headers, json=payload, timeout=10)
             if resp.status_code in [200, 201, 204]:
                 messages.success(request, f"Section updated successfully!")
             else:
@@ -2725,7 +2349,7 @@ def dashboard_landing_save(request):
             # Upsert (insert or update by content_key)
             headers["Prefer"] = "return=representation,resolution=merge-duplicates"
             url = f"{base_url}/rest/v1/site_content?on_conflict=content_key"
-            resp = requests.post(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.post(url, headers=headers, json=payload, timeout=10)
             if resp.status_code in [200, 201]:
                 messages.success(request, f"Section saved successfully!")
             else:
@@ -2738,6 +2362,7 @@ def dashboard_landing_save(request):
 
 
 @require_POST
+@purges_pages("about")
 def dashboard_about_pages_save(request):
     """Save About Ratel or Mission & Vision page content to Supabase."""
     page_key = request.POST.get("page_key", "").strip()  # 'about_ratel' or 'mission_vision'
@@ -2785,7 +2410,7 @@ def dashboard_about_pages_save(request):
         if content_id:
             # Update existing
             url = f"{base_url}/rest/v1/about_pages?id=eq.{content_id}"
-            resp = requests.patch(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.patch(url, headers=headers, json=payload, timeout=10)
             if resp.status_code in [200, 201, 204]:
                 return JsonResponse({"success": True, "message": "Section updated successfully!", "image_url": image_url})
             else:
@@ -2794,7 +2419,7 @@ def dashboard_about_pages_save(request):
             # Upsert (insert or update by page_key + section_key)
             headers["Prefer"] = "return=representation,resolution=merge-duplicates"
             url = f"{base_url}/rest/v1/about_pages"
-            resp = requests.post(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.post(url, headers=headers, json=payload, timeout=10)
             if resp.status_code in [200, 201]:
                 return JsonResponse({"success": True, "message": "Section saved successfully!", "image_url": image_url})
             else:
@@ -2817,7 +2442,7 @@ def dashboard_about_pages_get(request):
         else:
             url = f"{base_url}/rest/v1/about_pages?select=*&order=page_key.asc,section_order.asc"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             return JsonResponse({"success": True, "data": resp.json()})
         else:
@@ -2827,6 +2452,7 @@ def dashboard_about_pages_get(request):
 
 
 @require_POST
+@purges_pages("about")
 def dashboard_about_pages_delete(request):
     """Delete an about page section."""
     import json
@@ -2843,7 +2469,7 @@ def dashboard_about_pages_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
         url = f"{base_url}/rest/v1/about_pages?id=eq.{content_id}"
-        resp = requests.delete(url, headers=headers, timeout=10)
+        resp = supabase_rest.delete(url, headers=headers, timeout=10)
         if resp.status_code in [200, 204]:
             return JsonResponse({"success": True, "message": "Section deleted successfully!"})
         else:
@@ -2856,49 +2482,22 @@ def dashboard_site_settings(request):
     """Settings page: Hero carousel slides (1, 2, 3), Manifesto image, and Hero Quote for the landing page."""
     hero_slides = {}
     slide_keys = ["hero_slide_1", "hero_slide_2", "hero_slide_3"]
-    manifesto_section = {"content_key": "manifesto", "image_url": None, "id": None, "title": "Our Manifesto"}
-    hero_quote = {"content_key": "hero_quote", "content": "When the people fear the government, there is tyranny. When the government fears the people, there is liberty.", "subtitle": "Thomas Jefferson", "id": None}
+    manifesto_section = site_content.default_for("manifesto")
+    hero_quote = site_content.default_for("hero_quote")
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
+        # Hero slides, manifesto, hero quote and hero video in one request
+        rows = site_content.load_with_defaults(slide_keys + ["manifesto", "hero_quote", "hero_video"], request)
         for key in slide_keys:
-            resp = requests.get(
-                f"{base_url}/rest/v1/site_content?content_key=eq.{key}&select=*&limit=1",
-                headers=headers,
-                timeout=10
-            )
-            if resp.status_code == 200 and resp.json():
-                hero_slides[key] = resp.json()[0]
-            else:
-                hero_slides[key] = {"content_key": key, "image_url": None, "id": None}
-        # Fetch manifesto row for image
-        resp = requests.get(
-            f"{base_url}/rest/v1/site_content?content_key=eq.manifesto&select=*&limit=1",
-            headers=headers,
-            timeout=10
-        )
-        if resp.status_code == 200 and resp.json():
-            manifesto_section = resp.json()[0]
-        # Fetch hero quote
-        resp = requests.get(
-            f"{base_url}/rest/v1/site_content?content_key=eq.hero_quote&select=*&limit=1",
-            headers=headers,
-            timeout=10
-        )
-        if resp.status_code == 200 and resp.json():
-            hero_quote = resp.json()[0]
-        # Fetch hero video (if set, landing shows video instead of 3 slides)
-        hero_video = {"content_key": "hero_video", "image_url": None, "id": None}
-        resp = requests.get(
-            f"{base_url}/rest/v1/site_content?content_key=eq.hero_video&select=*&limit=1",
-            headers=headers,
-            timeout=10
-        )
-        if resp.status_code == 200 and resp.json():
-            hero_video = resp.json()[0]
+            hero_slides[key] = rows[key]
+        manifesto_section = rows["manifesto"]
+        hero_quote = rows["hero_quote"]
+        # If set, landing shows video instead of 3 slides
+        hero_video = rows["hero_video"]
         # Fetch Paystack settings (overrides env when set)
         paystack_settings = {"public_key": "", "secret_key": "", "id": None}
-        paystack_resp = requests.get(
+        paystack_resp = supabase_rest.get(
             f"{base_url}/rest/v1/paystack_settings?id=eq.1&select=id,public_key,secret_key&limit=1",
             headers=headers,
             timeout=10
@@ -2908,8 +2507,8 @@ def dashboard_site_settings(request):
     except Exception as e:
         print(f"[Site Settings] Error: {e}")
         for key in slide_keys:
-            hero_slides[key] = {"content_key": key, "image_url": None, "id": None}
-        hero_video = {"content_key": "hero_video", "image_url": None, "id": None}
+            hero_slides[key] = site_content.default_for(key)
+        hero_video = site_content.default_for("hero_video")
         paystack_settings = {"public_key": "", "secret_key": "", "id": None}
 
     hero_use_video = bool(hero_video.get("image_url"))
@@ -2931,26 +2530,17 @@ def dashboard_site_settings(request):
     })
 
 
-def _site_settings_get_current(base_url, headers, keys):
+def _site_settings_get_current(base_url, headers, keys, request=None):
     """Fetch current site_content rows for given keys. Returns dict key -> row (or default)."""
-    current = {}
-    for key in keys:
-        try:
-            resp = requests.get(
-                f"{base_url}/rest/v1/site_content?content_key=eq.{key}&select=id,image_url,content,title,subtitle&limit=1",
-                headers=headers,
-                timeout=10
-            )
-            if resp.status_code == 200 and resp.json():
-                current[key] = resp.json()[0]
-            else:
-                current[key] = None
-        except Exception:
-            current[key] = None
-    return current
+    try:
+        return site_content.load(keys, request)
+    except Exception:
+        return {key: None for key in keys}
 
 
 @require_POST
+@invalidates_landing("sections")
+@purges_pages("landing")
 def dashboard_site_settings_save(request):
     """Save hero carousel slides (1, 2, 3) and Manifesto image. Only update items that have new file or URL."""
     base_url = settings.SUPABASE_URL.rstrip("/")
@@ -2960,7 +2550,7 @@ def dashboard_site_settings_save(request):
 
     slide_keys = ["hero_slide_1", "hero_slide_2", "hero_slide_3"]
     all_keys = slide_keys + ["manifesto"]
-    current = _site_settings_get_current(base_url, headers, all_keys)
+    current = _site_settings_get_current(base_url, headers, all_keys, request)
 
     def resolve_image_url(item_key, file_field, url_field, current_row, folder_name):
         image_file = request.FILES.get(file_field)
@@ -2990,12 +2580,12 @@ def dashboard_site_settings_save(request):
         }
         try:
             if content_id:
-                resp = requests.patch(
+                resp = supabase_rest.patch(
                     f"{base_url}/rest/v1/site_content?id=eq.{content_id}",
                     headers=headers, json=payload, timeout=10
                 )
             else:
-                resp = requests.post(
+                resp = supabase_rest.post(
                     f"{base_url}/rest/v1/site_content",
                     headers=headers, json=payload, timeout=10
                 )
@@ -3025,7 +2615,7 @@ def dashboard_site_settings_save(request):
             payload["subtitle"] = cur_manifesto.get("subtitle") or "The Ratel Movement"
             payload["content"] = cur_manifesto.get("content") or ""
             try:
-                resp = requests.patch(
+                resp = supabase_rest.patch(
                     f"{base_url}/rest/v1/site_content?id=eq.{manifesto_id}",
                     headers=headers, json=payload, timeout=10
                 )
@@ -3041,7 +2631,7 @@ def dashboard_site_settings_save(request):
             payload["display_order"] = 1
             payload["is_active"] = True
             try:
-                resp = requests.post(
+                resp = supabase_rest.post(
                     f"{base_url}/rest/v1/site_content",
                     headers=headers, json=payload, timeout=10
                 )
@@ -3055,6 +2645,8 @@ def dashboard_site_settings_save(request):
 
 
 @require_POST
+@invalidates_landing("sections")
+@purges_pages("landing")
 def dashboard_site_settings_save_single(request):
     """AJAX endpoint: Save a single site setting (hero slide or manifesto image)."""
     from django.http import JsonResponse
@@ -3090,7 +2682,7 @@ def dashboard_site_settings_save_single(request):
             "is_active": True,
         }
         try:
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/site_content?on_conflict=content_key",
                 headers=headers_api,
                 json=payload,
@@ -3108,8 +2700,16 @@ def dashboard_site_settings_save_single(request):
         video_url = request.POST.get("image_url", "").strip()
         print(f"[Site Settings Save Single] Hero video: file={video_file}, url={video_url[:100] if video_url else '(none)'}")
 
+        try:
+            stored_video = _direct_upload(request, "image_file", "hero_video")
+        except direct_upload.UploadRejected as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+
         final_video_url = None
-        if video_file and video_file.size > 0:
+        if stored_video:
+            final_video_url = stored_video["url"]
+            print(f"[Site Settings Save Single] Video uploaded directly to storage: {final_video_url}")
+        elif video_file and video_file.size > 0:
             # Upload to settings bucket (same as other site settings assets)
             print(f"[Site Settings Save Single] Uploading video file: {video_file.name}, size={video_file.size}")
             uploaded_url = _upload_to_supabase_storage(video_file, "settings", "hero-video")
@@ -3135,7 +2735,7 @@ def dashboard_site_settings_save_single(request):
             "is_active": True,
         }
         try:
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/site_content?on_conflict=content_key",
                 headers=headers_api,
                 json=payload,
@@ -3191,13 +2791,13 @@ def dashboard_site_settings_save_single(request):
         try:
             if content_id:
                 print(f"[Site Settings Save Single] PATCH hero_quote to id={content_id}")
-                resp = requests.patch(
+                resp = supabase_rest.patch(
                     f"{base_url}/rest/v1/site_content?id=eq.{content_id}",
                     headers=headers_api, json=payload, timeout=10
                 )
             else:
                 print("[Site Settings Save Single] POST (upsert) hero_quote")
-                resp = requests.post(
+                resp = supabase_rest.post(
                     f"{base_url}/rest/v1/site_content?on_conflict=content_key",
                     headers=headers_api, json=payload, timeout=10
                 )
@@ -3254,15 +2854,10 @@ def dashboard_site_settings_save_single(request):
     else:
         # No new image provided - keep existing or set to None
         print("[Site Settings Save Single] No new image, fetching current value")
-        headers_get = _get_supabase_headers()
         try:
-            resp = requests.get(
-                f"{base_url}/rest/v1/site_content?content_key=eq.{setting_type}&select=image_url&limit=1",
-                headers=headers_get,
-                timeout=10
-            )
-            if resp.status_code == 200 and resp.json():
-                final_image_url = resp.json()[0].get("image_url")
+            current_row = site_content.load([setting_type], request)[setting_type]
+            if current_row:
+                final_image_url = current_row.get("image_url")
                 print(f"[Site Settings Save Single] Current image_url: {final_image_url}")
         except Exception as e:
             print(f"[Site Settings Save Single] Error fetching current: {e}")
@@ -3282,15 +2877,8 @@ def dashboard_site_settings_save_single(request):
     else:  # manifesto
         # Fetch existing manifesto data to preserve title, subtitle, content
         existing_data = {"title": "Our Manifesto", "subtitle": "The Ratel Movement", "content": ""}
-        headers_get = _get_supabase_headers()
         try:
-            resp = requests.get(
-                f"{base_url}/rest/v1/site_content?content_key=eq.manifesto&select=title,subtitle,content&limit=1",
-                headers=headers_get,
-                timeout=10
-            )
-            if resp.status_code == 200 and resp.json():
-                existing_data = resp.json()[0]
+            existing_data = site_content.load(["manifesto"], request)["manifesto"] or existing_data
         except Exception:
             pass
 
@@ -3315,7 +2903,7 @@ def dashboard_site_settings_save_single(request):
         if content_id:
             # Update existing by ID
             print(f"[Site Settings Save Single] PATCH to id={content_id}")
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/site_content?id=eq.{content_id}",
                 headers=headers_api, json=payload, timeout=10
             )
@@ -3323,7 +2911,7 @@ def dashboard_site_settings_save_single(request):
             # Use upsert - POST with on_conflict header to handle existing records
             print(f"[Site Settings Save Single] POST (upsert) with content_key={setting_type}")
             headers_api["Prefer"] = "return=representation,resolution=merge-duplicates"
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/site_content?on_conflict=content_key",
                 headers=headers_api, json=payload, timeout=10
             )
@@ -3381,7 +2969,7 @@ def dashboard_paystack_settings_save(request):
     try:
         # If secret key blank, keep existing from DB
         if not secret_key:
-            get_resp = requests.get(
+            get_resp = supabase_rest.get(
                 f"{base_url}/rest/v1/paystack_settings?id=eq.1&select=secret_key&limit=1",
                 headers=headers,
                 timeout=10,
@@ -3395,7 +2983,7 @@ def dashboard_paystack_settings_save(request):
             "updated_at": datetime.now().isoformat(),
         }
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/paystack_settings?id=eq.1",
             headers=headers,
             json=payload,
@@ -3405,7 +2993,7 @@ def dashboard_paystack_settings_save(request):
             messages.success(request, "Paystack settings saved. Auth and renewal pages will use these keys.")
         elif resp.status_code == 204:
             # No rows: insert first row
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/paystack_settings",
                 headers=headers,
                 json={"id": 1, "public_key": public_key, "secret_key": secret_key},
@@ -3445,14 +3033,10 @@ def dashboard_resources(request):
         if current_category and current_category != "all":
             url += f"&category=eq.{current_category}"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             resources_list = resp.json()
-            # Normalize file URLs
-            storage_base = f"{base_url}/storage/v1/object/public/resources/"
-            for resource in resources_list:
-                if resource.get("file_url") and not str(resource["file_url"]).startswith("http"):
-                    resource["file_url"] = storage_base + str(resource["file_url"]).lstrip("/")
+            storage_urls.canonicalize_rows(resources_list, "resources")
     except Exception as e:
         print(f"[Dashboard Resources] Error: {e}")
 
@@ -3465,6 +3049,7 @@ def dashboard_resources(request):
 
 
 @require_POST
+@purges_pages("resources")
 def dashboard_resources_save(request):
     """
     Save a new resource or update existing one.
@@ -3487,6 +3072,13 @@ def dashboard_resources_save(request):
         messages.error(request, "Title and category are required.")
         return redirect("dashboard_resources")
 
+    # The browser normally uploads the file straight to Storage
+    try:
+        stored_resource = _direct_upload(request, "resource_file", "resource")
+    except direct_upload.UploadRejected as e:
+        messages.error(request, str(e))
+        return redirect("dashboard_resources")
+
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
@@ -3498,7 +3090,11 @@ def dashboard_resources_save(request):
         file_name = None
         file_type = None
 
-        if resource_file:
+        if stored_resource:
+            file_url = stored_resource["url"]
+            file_name = stored_resource["name"]
+            file_type = file_name.split('.')[-1].lower() if '.' in file_name else None
+        elif resource_file:
             # Upload to Supabase storage
             uploaded_url = _upload_to_supabase_storage(resource_file, "resources", category)
             if uploaded_url:
@@ -3531,7 +3127,7 @@ def dashboard_resources_save(request):
 
         if resource_id:
             # Update existing resource
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/resources?id=eq.{resource_id}",
                 headers=headers,
                 json=payload,
@@ -3539,7 +3135,7 @@ def dashboard_resources_save(request):
             )
         else:
             # Create new resource
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/resources",
                 headers=headers,
                 json=payload,
@@ -3557,6 +3153,7 @@ def dashboard_resources_save(request):
 
 
 @require_POST
+@purges_pages("resources")
 def dashboard_resources_delete(request):
     """
     Delete a resource (soft delete by setting status to archived).
@@ -3572,7 +3169,7 @@ def dashboard_resources_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/resources?id=eq.{resource_id}",
             headers=headers,
             json={"status": "archived"},
@@ -3601,7 +3198,7 @@ def dashboard_resources_get(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/resources?id=eq.{resource_id}&select=*",
             headers=headers,
             timeout=10
@@ -3639,7 +3236,7 @@ def dashboard_settings(request):
         if current_section:
             url += f"&section_key=eq.{current_section}"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             sections = resp.json()
     except Exception as e:
@@ -3654,6 +3251,7 @@ def dashboard_settings(request):
 
 
 @require_POST
+@purges_pages("ideology")
 def dashboard_ideology_save(request):
     """
     Save or update an ideology section.
@@ -3698,7 +3296,7 @@ def dashboard_ideology_save(request):
 
         if section_id:
             # Update existing section
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/ideology_sections?id=eq.{section_id}",
                 headers=headers,
                 json=payload,
@@ -3706,7 +3304,7 @@ def dashboard_ideology_save(request):
             )
         else:
             # Create new section
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/ideology_sections",
                 headers=headers,
                 json=payload,
@@ -3724,6 +3322,7 @@ def dashboard_ideology_save(request):
 
 
 @require_POST
+@purges_pages("ideology")
 def dashboard_ideology_delete(request):
     """
     Delete an ideology section.
@@ -3739,7 +3338,7 @@ def dashboard_ideology_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.delete(
+        resp = supabase_rest.delete(
             f"{base_url}/rest/v1/ideology_sections?id=eq.{section_id}",
             headers=headers,
             timeout=10
@@ -3767,7 +3366,7 @@ def dashboard_ideology_get(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/ideology_sections?id=eq.{section_id}&select=*",
             headers=headers,
             timeout=10
@@ -3807,14 +3406,10 @@ def dashboard_leadership(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch founding vision (all, including inactive for admin)
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/founding_vision",
             headers=headers,
             params={"select": "*", "order": "display_order.asc"},
@@ -3824,7 +3419,7 @@ def dashboard_leadership(request):
             founding_vision = resp.json()
 
         # Fetch leadership council
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/leadership_council",
             headers=headers,
             params={"select": "*", "order": "display_order.asc"},
@@ -3832,12 +3427,10 @@ def dashboard_leadership(request):
         )
         if resp.status_code == 200:
             leadership_council = resp.json()
-            # Normalize image URLs
-            for leader in leadership_council:
-                leader["profile_image_url"] = _normalize_leadership_image_url(leader.get("profile_image_url"))
+            storage_urls.canonicalize_rows(leadership_council, "leadership_council")
 
         # Fetch strategic committees
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/strategic_committees",
             headers=headers,
             params={"select": "*", "order": "display_order.asc"},
@@ -3845,12 +3438,10 @@ def dashboard_leadership(request):
         )
         if resp.status_code == 200:
             strategic_committees = resp.json()
-            # Normalize image URLs
-            for committee in strategic_committees:
-                committee["profile_image_url"] = _normalize_leadership_image_url(committee.get("profile_image_url"))
+            storage_urls.canonicalize_rows(strategic_committees, "strategic_committees")
 
         # Fetch advisory voices
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/advisory_voices",
             headers=headers,
             params={"select": "*", "order": "display_order.asc"},
@@ -3858,12 +3449,10 @@ def dashboard_leadership(request):
         )
         if resp.status_code == 200:
             advisory_voices = resp.json()
-            # Normalize image URLs
-            for advisor in advisory_voices:
-                advisor["profile_image_url"] = _normalize_leadership_image_url(advisor.get("profile_image_url"))
+            storage_urls.canonicalize_rows(advisory_voices, "advisory_voices")
 
         # Fetch code of conduct
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/code_of_conduct",
             headers=headers,
             params={"select": "*", "order": "display_order.asc"},
@@ -3886,6 +3475,7 @@ def dashboard_leadership(request):
 
 
 @require_POST
+@purges_pages("leadership")
 def dashboard_leadership_save(request):
     """
     Create or update a leadership item.
@@ -3900,20 +3490,23 @@ def dashboard_leadership_save(request):
         return redirect("dashboard_leadership")
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    headers = supabase_rest.write_headers("return=representation")
 
     # Handle file uploads for tables that support profile images
     profile_image_file = request.FILES.get("profile_image")
     profile_image_url = None
     
+    try:
+        stored_image = _direct_upload(request, "profile_image", "leadership_photo")
+    except direct_upload.UploadRejected as e:
+        messages.warning(request, f"Image upload failed ({e}), but other data will be saved.")
+        stored_image = None
+
     # If a file was uploaded, upload it to Supabase leadership bucket
-    if profile_image_file:
-        profile_image_url = _upload_leadership_image_to_supabase(table, item_id or "new", profile_image_file)
+    if stored_image:
+        profile_image_url = stored_image["url"]
+    elif profile_image_file:
+        profile_image_url = _upload_leadership_image_to_supabase(table, profile_image_file)
         if not profile_image_url:
             messages.warning(request, "Image upload failed, but other data will be saved.")
     else:
@@ -3979,13 +3572,13 @@ def dashboard_leadership_save(request):
         if item_id:
             # Update existing
             url = f"{base_url}/rest/v1/{table}?id=eq.{item_id}"
-            resp = requests.patch(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.patch(url, headers=headers, json=payload, timeout=10)
             resp.raise_for_status()
             messages.success(request, "Item updated successfully.")
         else:
             # Create new
             url = f"{base_url}/rest/v1/{table}"
-            resp = requests.post(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.post(url, headers=headers, json=payload, timeout=10)
             resp.raise_for_status()
             messages.success(request, "Item created successfully.")
     except Exception as e:
@@ -4006,22 +3599,16 @@ def dashboard_leadership_get(request):
         return JsonResponse({"success": False, "error": "Invalid parameters"})
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Accept": "application/json",
-    }
+    headers = supabase_rest.read_headers()
 
     try:
         url = f"{base_url}/rest/v1/{table}?id=eq.{item_id}&select=*"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if data:
             item = data[0]
-            # Normalize image URL if present
-            if "profile_image_url" in item:
-                item["profile_image_url"] = _normalize_leadership_image_url(item.get("profile_image_url"))
+            storage_urls.canonicalize_rows([item], table)
             return JsonResponse({"success": True, "item": item})
         return JsonResponse({"success": False, "error": "Item not found"})
     except Exception as e:
@@ -4029,6 +3616,7 @@ def dashboard_leadership_get(request):
 
 
 @require_POST
+@purges_pages("leadership")
 def dashboard_leadership_delete(request):
     """
     Delete a leadership item by table and id.
@@ -4041,14 +3629,11 @@ def dashboard_leadership_delete(request):
         return JsonResponse({"success": False, "error": "Invalid parameters"})
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-    }
+    headers = supabase_rest.read_headers()
 
     try:
         url = f"{base_url}/rest/v1/{table}?id=eq.{item_id}"
-        resp = requests.delete(url, headers=headers, timeout=10)
+        resp = supabase_rest.delete(url, headers=headers, timeout=10)
         resp.raise_for_status()
         return JsonResponse({"success": True})
     except Exception as e:
@@ -4114,16 +3699,11 @@ def contact_submit(request):
         return JsonResponse({"success": False, "errors": ["Message is required."]})
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    headers = supabase_rest.write_headers("return=representation")
 
     try:
         url = f"{base_url}/rest/v1/contact_inquiries"
-        resp = requests.post(url, headers=headers, json=payload, timeout=10)
+        resp = supabase_rest.post(url, headers=headers, json=payload, timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
@@ -4150,15 +3730,11 @@ def dashboard_inquiries(request):
     stats = {"new": 0, "in_progress": 0, "total": 0}
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Accept": "application/json",
-    }
+    headers = supabase_rest.read_headers()
 
     try:
         url = f"{base_url}/rest/v1/contact_inquiries"
-        resp = requests.get(
+        resp = supabase_rest.get(
             url,
             headers=headers,
             params={"select": "*", "order": "created_at.desc"},
@@ -4190,15 +3766,11 @@ def dashboard_inquiry_get(request):
         return JsonResponse({"success": False, "error": "Invalid parameters"})
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Accept": "application/json",
-    }
+    headers = supabase_rest.read_headers()
 
     try:
         url = f"{base_url}/rest/v1/contact_inquiries?id=eq.{item_id}&select=*"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if data:
@@ -4222,11 +3794,7 @@ def dashboard_inquiry_status(request):
         return JsonResponse({"success": False, "error": "Invalid parameters"})
 
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Content-Type": "application/json",
-    }
+    headers = supabase_rest.write_headers()
 
     payload = {"status": status}
     if internal_notes:
@@ -4234,7 +3802,7 @@ def dashboard_inquiry_status(request):
 
     try:
         url = f"{base_url}/rest/v1/contact_inquiries?id=eq.{item_id}"
-        resp = requests.patch(url, headers=headers, json=payload, timeout=10)
+        resp = supabase_rest.patch(url, headers=headers, json=payload, timeout=10)
         resp.raise_for_status()
         return JsonResponse({"success": True})
     except Exception as e:
@@ -4258,15 +3826,11 @@ def dashboard_inquiry_reply(request):
 
     # First, fetch the inquiry to get the email
     base_url = settings.SUPABASE_URL.rstrip("/")
-    headers = {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Accept": "application/json",
-    }
+    headers = supabase_rest.read_headers()
 
     try:
         url = f"{base_url}/rest/v1/contact_inquiries?id=eq.{item_id}&select=*"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
@@ -4302,7 +3866,7 @@ def dashboard_inquiry_reply(request):
 
         headers["Content-Type"] = "application/json"
         update_url = f"{base_url}/rest/v1/contact_inquiries?id=eq.{item_id}"
-        requests.patch(update_url, headers=headers, json=update_payload, timeout=10)
+        supabase_rest.patch(update_url, headers=headers, json=update_payload, timeout=10)
 
         return JsonResponse({"success": True})
     except Exception as e:
@@ -4314,12 +3878,7 @@ def dashboard_inquiry_reply(request):
 
 def _get_supabase_headers():
     """Helper to get Supabase API headers."""
-    return {
-        "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-    }
+    return supabase_rest.write_headers()
 
 
 def _get_paystack_keys():
@@ -4332,7 +3891,7 @@ def _get_paystack_keys():
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/paystack_settings?id=eq.1&select=public_key,secret_key&limit=1",
             headers=headers,
             timeout=10,
@@ -4348,120 +3907,51 @@ def _get_paystack_keys():
     return (default_public, default_secret)
 
 
-def _normalize_blog_image_url(img_url, base_url):
-    """Normalize blog featured image URL to ensure it's a full public URL."""
-    if not img_url:
-        return None
-
-    img_url = str(img_url).strip()
-    if not img_url:
-        return None
-
-    # If it's already a full HTTP/HTTPS URL, check if it needs fixing
-    if img_url.startswith("http://") or img_url.startswith("https://"):
-        # If it already has the correct public path, use as-is
-        if "/storage/v1/object/public/blogs/" in img_url:
-            return img_url
-
-        # Fix signed URLs (convert /sign/ to /public/)
-        if "/storage/v1/object/sign/blogs/" in img_url:
-            return img_url.replace("/storage/v1/object/sign/blogs/", "/storage/v1/object/public/blogs/").split("?")[0]
 
-        # Fix URLs missing "public" segment: /storage/v1/object/blogs/ -> /storage/v1/object/public/blogs/
-        if "/storage/v1/object/blogs/" in img_url:
-            return img_url.replace("/storage/v1/object/blogs/", "/storage/v1/object/public/blogs/").split("?")[0]
 
-        # If it has /blogs/ but wrong path structure, extract filename and fix it
-        if "/blogs/" in img_url:
-            filename = img_url.split("/blogs/")[-1].split("?")[0]
-            return f"{base_url}/storage/v1/object/public/blogs/{filename}"
-
-        # Otherwise, it's a valid external URL, use as-is
-        return img_url
-    else:
-        # Not a full URL, construct it (preserve folder structure like "featured/filename.jpg")
-        path = img_url.lstrip('/')
-        return f"{base_url}/storage/v1/object/public/blogs/{path}"
 
 
-def _normalize_messages_url(img_url):
+def _direct_upload(request, field, target):
     """
-    Normalize a Supabase storage URL for the messages bucket.
-    Handles various URL formats and ensures the URL is a valid public URL.
+    The file of a dashboard form field that the browser uploaded straight to Storage, as
+    {"url", "name", "size", "content_type", ...}, or None if the form posted no ticket for it.
+    Raises direct_upload.UploadRejected if the ticket or the stored object does not check out.
     """
-    base_url = settings.SUPABASE_URL.rstrip("/")
-
-    if not img_url:
-        return None
-
-    img_url = str(img_url).strip()
-    if not img_url:
-        return None
-
-    # If it's already a full HTTP/HTTPS URL, check if it needs fixing
-    if img_url.startswith("http://") or img_url.startswith("https://"):
-        # Remove any query parameters (signed URLs have tokens)
-        clean_url = img_url.split("?")[0]
-
-        # If it already has the correct public path, use as-is
-        if "/storage/v1/object/public/messages/" in clean_url:
-            return clean_url
-
-        # Fix signed URLs (convert /sign/ to /public/)
-        if "/storage/v1/object/sign/messages/" in clean_url:
-            return clean_url.replace("/storage/v1/object/sign/messages/", "/storage/v1/object/public/messages/")
+    ticket = request.POST.get(f"{field}_upload", "").strip()
+    return direct_upload.finalize(ticket, target) if ticket else None
 
-        # Fix URLs missing "public" segment: /storage/v1/object/messages/ -> /storage/v1/object/public/messages/
-        if "/storage/v1/object/messages/" in clean_url:
-            return clean_url.replace("/storage/v1/object/messages/", "/storage/v1/object/public/messages/")
 
-        # If it has /messages/ but wrong path structure, extract filename and fix it
-        if "/messages/" in clean_url:
-            filename = clean_url.split("/messages/")[-1]
-            return f"{base_url}/storage/v1/object/public/messages/{filename}"
+@require_POST
+def dashboard_upload_sign(request):
+    """
+    Signed upload URL so the browser can send a dashboard file straight to Storage
+    (see main/direct_upload.py and partials/direct_upload.html).
+    """
+    try:
+        data = json.loads(request.body or b"{}")
+        size = int(data.get("size") or 0)
+    except (ValueError, TypeError):
+        return JsonResponse({"success": False, "error": "Invalid request"}, status=400)
 
-        # Otherwise, it's a valid external URL, use as-is
-        return img_url
-    else:
-        # Not a full URL, construct it
-        path = img_url.lstrip('/')
-        return f"{base_url}/storage/v1/object/public/messages/{path}"
+    try:
+        signed = direct_upload.sign(data.get("target", ""), data.get("filename", ""), data.get("content_type", ""), size)
+    except direct_upload.UploadRejected as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    except Exception as e:
+        print(f"[Direct Upload] Sign failed: {e}")
+        return JsonResponse({"success": False, "error": "Could not start the upload"}, status=502)
+    return JsonResponse({"success": True, **signed})
 
 
 def _upload_to_supabase_storage(file, bucket="media-vault", folder=""):
     """Upload file to Supabase Storage and return public URL."""
     try:
-        print(f"[Storage Upload] Starting upload: bucket={bucket}, folder={folder}, filename={file.name}")
-        supabase = get_supabase()
-
-        # Generate unique filename
-        import uuid
-        ext = file.name.split('.')[-1] if '.' in file.name else ''
-        unique_name = f"{folder}/{uuid.uuid4().hex}.{ext}" if folder else f"{uuid.uuid4().hex}.{ext}"
-        print(f"[Storage Upload] Generated unique_name: {unique_name}")
-
-        # Read file content
-        file_content = file.read()
-        print(f"[Storage Upload] File content size: {len(file_content)} bytes")
-
-        # Upload to Supabase Storage
-        result = supabase.storage.from_(bucket).upload(
-            unique_name,
-            file_content,
-            {"content-type": file.content_type}
-        )
-        print(f"[Storage Upload] Upload result: {result}")
-
-        # Construct public URL manually (more reliable than SDK's get_public_url)
-        # The correct format is: {SUPABASE_URL}/storage/v1/object/public/{bucket}/{path}
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        public_url = f"{base_url}/storage/v1/object/public/{bucket}/{unique_name}"
-        print(f"[Storage Upload] Constructed public URL: {public_url}")
-
-        # Also try SDK's get_public_url for debugging
-        sdk_url = supabase.storage.from_(bucket).get_public_url(unique_name)
-        print(f"[Storage Upload] SDK public URL: {sdk_url}")
+        print(f"[Storage Upload] Starting upload: bucket={bucket}, folder={folder}, filename={file.name}, size={file.size}")
 
+        # Named after the SHA-256 of the content; an object that is already stored is not sent again.
+        # Streamed in chunks (resumable for large files), so memory stays bounded
+        public_url = storage_upload.upload_content_addressed(file, bucket, folder, file.content_type)
+        print(f"[Storage Upload] Public URL: {public_url}")
         return public_url
     except Exception as e:
         print(f"[Storage Upload] Error: {e}")
@@ -4485,40 +3975,18 @@ def dashboard_media_vault(request):
     recent_documents = []
 
     try:
-        # Fetch video count
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_videos?select=id&status=eq.active",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            video_count = len(resp.json())
-
-        # Fetch audio count
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_audio?select=id&status=eq.active",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            audio_count = len(resp.json())
-
-        # Fetch image count
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_images?select=id&status=eq.active",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            image_count = len(resp.json())
-
-        # Fetch document count
-        resp = requests.get(
-            f"{base_url}/rest/v1/media_documents?select=id&status=eq.active",
-            headers=headers, timeout=10
-        )
-        if resp.status_code == 200:
-            document_count = len(resp.json())
+        # Active item counts for the four media tables (one batched pass, no rows downloaded)
+        media_counts = supabase_rest.counts({
+            table: (table, {"status": "eq.active"})
+            for table in ("media_videos", "media_audio", "media_images", "media_documents")
+        })
+        video_count = media_counts["media_videos"]
+        audio_count = media_counts["media_audio"]
+        image_count = media_counts["media_images"]
+        document_count = media_counts["media_documents"]
 
         # Fetch recent videos
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/media_videos?select=*&status=eq.active&order=created_at.desc&limit=3",
             headers=headers, timeout=10
         )
@@ -4526,7 +3994,7 @@ def dashboard_media_vault(request):
             recent_videos = resp.json()
 
         # Fetch recent documents
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/media_documents?select=*&status=eq.active&order=created_at.desc&limit=3",
             headers=headers, timeout=10
         )
@@ -4562,7 +4030,7 @@ def dashboard_media_videos(request):
         if category and category != "all":
             url += f"&category=eq.{category}"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             videos = resp.json()
     except Exception as e:
@@ -4572,10 +4040,14 @@ def dashboard_media_videos(request):
         "active_page": "media_videos",
         "videos": videos,
         "current_category": category,
+        # Identifies one submission of the add form (see dashboard_media_videos_save)
+        "submission_id": get_random_string(32),
     })
 
 
 @require_POST
+@invalidates_landing("media_videos")
+@purges_pages("media")
 def dashboard_media_videos_save(request):
     """
     Save a new video to the database. Can upload file OR provide video link (YouTube, Vimeo, etc.).
@@ -4596,45 +4068,23 @@ def dashboard_media_videos_save(request):
         messages.error(request, "Title and category are required.")
         return redirect("dashboard_media_videos")
 
+    # Files the browser already uploaded straight to Storage
+    try:
+        stored_video = _direct_upload(request, "video_file", "media_video")
+        stored_thumbnail = _direct_upload(request, "thumbnail", "media_thumbnail")
+    except direct_upload.UploadRejected as e:
+        messages.error(request, str(e))
+        return redirect("dashboard_media_videos")
+
     # Must have either video_file OR video_link
-    if not video_file and not video_link:
+    if not video_file and not stored_video and not video_link:
         messages.error(request, "Either video file or video link is required.")
         return redirect("dashboard_media_videos")
 
     try:
-        file_url = None
-        file_size_bytes = None
-        mime_type = None
-
-        # Handle file upload OR video link
-        if video_file:
-            # Upload video file
-            file_url = _upload_to_supabase_storage(video_file, "media-vault", "videos")
-            if not file_url:
-                messages.error(request, "Failed to upload video file.")
-                return redirect("dashboard_media_videos")
-            file_size_bytes = video_file.size
-            mime_type = video_file.content_type
-        elif video_link:
-            # Use provided video link (YouTube, Vimeo, etc.)
-            file_url = None  # Will use video_link instead
-            # Try to extract video ID for thumbnail if YouTube
-            if "youtube.com" in video_link or "youtu.be" in video_link:
-                # YouTube link - could extract thumbnail URL here if needed
-                pass
-
-        # Upload thumbnail if provided
-        thumbnail_url = None
-        if thumbnail_file:
-            thumbnail_url = _upload_to_supabase_storage(thumbnail_file, "media-vault", "thumbnails")
-
         # Parse tags
         tags_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
 
-        # Save to database
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers()
-
         # Build payload, only including non-empty values
         payload = {
             "title": title,
@@ -4642,7 +4092,7 @@ def dashboard_media_videos_save(request):
             "tags": tags_list,
             "status": "active",
         }
-        
+
         # Add optional fields only if they have values
         if description:
             payload["description"] = description
@@ -4652,45 +4102,33 @@ def dashboard_media_videos_save(request):
             payload["location"] = location
         if recorded_date:
             payload["recorded_date"] = recorded_date
-        if thumbnail_url:
-            payload["thumbnail_url"] = thumbnail_url
+        if stored_thumbnail:
+            payload["thumbnail_url"] = stored_thumbnail["url"]
 
         # Add file_url OR video_link (not both)
-        if file_url:
-            payload["file_url"] = file_url
-            if file_size_bytes:
-                payload["file_size_bytes"] = file_size_bytes
-            if mime_type:
-                payload["mime_type"] = mime_type
-        elif video_link:
+        if stored_video:
+            payload["file_url"] = stored_video["url"]
+            payload["file_size_bytes"] = stored_video["size"]
+            payload["mime_type"] = stored_video["content_type"]
+        elif not video_file and video_link:
             payload["video_link"] = video_link
             # Explicitly set file_url to null for link-only videos (requires migration: file_url must be nullable)
             payload["file_url"] = None
 
-        resp = requests.post(
-            f"{base_url}/rest/v1/media_videos",
-            headers=headers,
-            json=payload,
-            timeout=30
-        )
-        
-        if resp.status_code not in [200, 201]:
-            error_msg = resp.text
-            print(f"[Video Save] Supabase Error ({resp.status_code}): {error_msg}")
-            print(f"[Video Save] Payload: {payload}")
-            if "23502" in error_msg and "file_url" in error_msg:
-                messages.error(
-                    request,
-                    "Saving link-only videos requires making file_url nullable. "
-                    "Run the SQL in migrations/add_video_link_column.sql in your Supabase SQL editor."
-                )
-            else:
-                messages.error(request, f"Failed to save video: {error_msg[:200]}")
-            return redirect("dashboard_media_videos")
-        
-        resp.raise_for_status()
+        # Files posted with the form are spooled to disk; the worker uploads them and inserts the row
+        video = jobs.spool(video_file) if video_file and not stored_video else None
+        thumbnail = jobs.spool(thumbnail_file) if thumbnail_file and not stored_thumbnail else None
+
+        # Keyed on the rendered form, so a double submit queues one job while adding the
+        # same video again later (a new page load) is a new job
+        from django.urls import reverse
+        submission_id = request.POST.get("submission_id", "").strip()[:64]
+        idempotency_key = f"media-video:{submission_id}" if submission_id else None
+        job_id = jobs.enqueue("media.save_video", {"payload": payload, "video": video, "thumbnail": thumbnail},
+                              idempotency_key=idempotency_key)
 
-        messages.success(request, "Video saved successfully!")
+        messages.success(request, "Video queued. It will appear in the list once it has been saved.")
+        return redirect(f"{reverse('dashboard_media_videos')}?job={job_id}")
     except Exception as e:
         print(f"[Video Save] Error: {e}")
         import traceback
@@ -4701,6 +4139,8 @@ def dashboard_media_videos_save(request):
 
 
 @require_POST
+@invalidates_landing("media_videos")
+@purges_pages("media")
 def dashboard_media_videos_delete(request):
     """
     Delete a video (soft delete by setting status to archived).
@@ -4716,7 +4156,7 @@ def dashboard_media_videos_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/media_videos?id=eq.{video_id}",
             headers=headers,
             json={"status": "archived"},
@@ -4744,7 +4184,7 @@ def dashboard_media_audio(request):
         if category and category != "all":
             url += f"&category=eq.{category}"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             audios = resp.json()
     except Exception as e:
@@ -4758,6 +4198,8 @@ def dashboard_media_audio(request):
 
 
 @require_POST
+@invalidates_landing("media_audio")
+@purges_pages("media")
 def dashboard_media_audio_save(request):
     """
     Save a new audio file to the database and upload to storage.
@@ -4773,20 +4215,33 @@ def dashboard_media_audio_save(request):
     audio_file = request.FILES.get("audio_file")
     cover_image = request.FILES.get("cover_image")
 
-    if not title or not category or not audio_file:
+    # Files the browser already uploaded straight to Storage
+    try:
+        stored_audio = _direct_upload(request, "audio_file", "media_audio")
+        stored_cover = _direct_upload(request, "cover_image", "media_cover")
+    except direct_upload.UploadRejected as e:
+        messages.error(request, str(e))
+        return redirect("dashboard_media_audio")
+
+    if not title or not category or not (audio_file or stored_audio):
         messages.error(request, "Title, category, and audio file are required.")
         return redirect("dashboard_media_audio")
 
     try:
         # Upload audio file
-        file_url = _upload_to_supabase_storage(audio_file, "media-vault", "audio")
+        if stored_audio:
+            file_url = stored_audio["url"]
+            file_size_bytes, mime_type = stored_audio["size"], stored_audio["content_type"]
+        else:
+            file_url = _upload_to_supabase_storage(audio_file, "media-vault", "audio")
+            file_size_bytes, mime_type = audio_file.size, audio_file.content_type
         if not file_url:
             messages.error(request, "Failed to upload audio file.")
             return redirect("dashboard_media_audio")
 
         # Upload cover image if provided
-        cover_image_url = None
-        if cover_image:
+        cover_image_url = stored_cover["url"] if stored_cover else None
+        if not cover_image_url and cover_image:
             cover_image_url = _upload_to_supabase_storage(cover_image, "media-vault", "covers")
 
         # Save to database
@@ -4804,11 +4259,11 @@ def dashboard_media_audio_save(request):
             "source": source,
             "recorded_date": recorded_date,
             "transcript": transcript,
-            "file_size_bytes": audio_file.size,
-            "mime_type": audio_file.content_type,
+            "file_size_bytes": file_size_bytes,
+            "mime_type": mime_type,
         }
 
-        resp = requests.post(
+        resp = supabase_rest.post(
             f"{base_url}/rest/v1/media_audio",
             headers=headers,
             json=payload,
@@ -4825,6 +4280,8 @@ def dashboard_media_audio_save(request):
 
 
 @require_POST
+@invalidates_landing("media_audio")
+@purges_pages("media")
 def dashboard_media_audio_delete(request):
     """
     Delete an audio file (soft delete).
@@ -4840,7 +4297,7 @@ def dashboard_media_audio_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/media_audio?id=eq.{audio_id}",
             headers=headers,
             json={"status": "archived"},
@@ -4868,7 +4325,7 @@ def dashboard_media_images(request):
         if category and category != "all":
             url += f"&category=eq.{category}"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             images = resp.json()
     except Exception as e:
@@ -4882,6 +4339,8 @@ def dashboard_media_images(request):
 
 
 @require_POST
+@invalidates_landing("media_images")
+@purges_pages("media")
 def dashboard_media_images_save(request):
     """
     Save a new image to the database and upload to storage.
@@ -4897,38 +4356,50 @@ def dashboard_media_images_save(request):
 
     image_file = request.FILES.get("image_file")
 
-    if not title or not category or not image_file:
+    # The browser normally uploads the image straight to Storage
+    try:
+        stored_image = _direct_upload(request, "image_file", "media_image")
+    except direct_upload.UploadRejected as e:
+        messages.error(request, str(e))
+        return redirect("dashboard_media_images")
+
+    if not title or not category or not (image_file or stored_image):
         messages.error(request, "Title, category, and image file are required.")
         return redirect("dashboard_media_images")
 
     try:
         # Upload image file
-        file_url = _upload_to_supabase_storage(image_file, "media-vault", "images")
+        if stored_image:
+            file_url = stored_image["url"]
+            file_size_bytes, mime_type = stored_image["size"], stored_image["content_type"]
+        else:
+            file_url = _upload_to_supabase_storage(image_file, "media-vault", "images")
+            file_size_bytes, mime_type = image_file.size, image_file.content_type
         if not file_url:
             messages.error(request, "Failed to upload image file.")
             return redirect("dashboard_media_images")
 
         # Save to database
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers()
+        headers = supabase_rest.write_headers("return=representation")
 
         payload = {
             "title": title,
             "category": category,
             "description": description,
             "file_url": file_url,
-            "thumbnail_url": file_url,  # Use same URL for thumbnail
+            "thumbnail_url": file_url,  # Until the derived thumbnail is ready
             "photographer": photographer,
             "source": source,
             "location": location,
             "captured_date": captured_date,
             "alt_text": alt_text,
             "status": "active",
-            "file_size_bytes": image_file.size,
-            "mime_type": image_file.content_type,
+            "file_size_bytes": file_size_bytes,
+            "mime_type": mime_type,
         }
 
-        resp = requests.post(
+        resp = supabase_rest.post(
             f"{base_url}/rest/v1/media_images",
             headers=headers,
             json=payload,
@@ -4936,6 +4407,10 @@ def dashboard_media_images_save(request):
         )
         resp.raise_for_status()
 
+        # Thumbnail, WebP sizes and placeholder are generated in the background
+        for row in resp.json():
+            image_derivatives.generate_async(row["id"], file_url)
+
         messages.success(request, "Image uploaded successfully!")
     except Exception as e:
         print(f"[Image Save] Error: {e}")
@@ -4945,6 +4420,8 @@ def dashboard_media_images_save(request):
 
 
 @require_POST
+@invalidates_landing("media_images")
+@purges_pages("media")
 def dashboard_media_images_delete(request):
     """
     Delete an image (soft delete).
@@ -4960,7 +4437,7 @@ def dashboard_media_images_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/media_images?id=eq.{image_id}",
             headers=headers,
             json={"status": "archived"},
@@ -4988,7 +4465,7 @@ def dashboard_media_documents(request):
         if category and category != "all":
             url += f"&category=eq.{category}"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             documents = resp.json()
     except Exception as e:
@@ -5002,6 +4479,8 @@ def dashboard_media_documents(request):
 
 
 @require_POST
+@invalidates_landing("media_documents")
+@purges_pages("media")
 def dashboard_media_documents_save(request):
     """
     Save a new document to the database and upload to storage.
@@ -5017,13 +4496,25 @@ def dashboard_media_documents_save(request):
 
     document_file = request.FILES.get("document_file")
 
-    if not title or not category or not document_file:
+    # The browser normally uploads the document straight to Storage
+    try:
+        stored_document = _direct_upload(request, "document_file", "media_document")
+    except direct_upload.UploadRejected as e:
+        messages.error(request, str(e))
+        return redirect("dashboard_media_documents")
+
+    if not title or not category or not (document_file or stored_document):
         messages.error(request, "Title, category, and document file are required.")
         return redirect("dashboard_media_documents")
 
     try:
         # Upload document file
-        file_url = _upload_to_supabase_storage(document_file, "media-vault", "documents")
+        if stored_document:
+            file_url = stored_document["url"]
+            file_size_bytes, mime_type = stored_document["size"], stored_document["content_type"]
+        else:
+            file_url = _upload_to_supabase_storage(document_file, "media-vault", "documents")
+            file_size_bytes, mime_type = document_file.size, document_file.content_type
         if not file_url:
             messages.error(request, "Failed to upload document file.")
             return redirect("dashboard_media_documents")
@@ -5042,12 +4533,12 @@ def dashboard_media_documents_save(request):
             "document_date": document_date,
             "reference_number": reference_number,
             "is_confidential": is_confidential,
-            "file_size_bytes": document_file.size,
+            "file_size_bytes": file_size_bytes,
             "status": "active",
-            "mime_type": document_file.content_type,
+            "mime_type": mime_type,
         }
 
-        resp = requests.post(
+        resp = supabase_rest.post(
             f"{base_url}/rest/v1/media_documents",
             headers=headers,
             json=payload,
@@ -5064,6 +4555,8 @@ def dashboard_media_documents_save(request):
 
 
 @require_POST
+@invalidates_landing("media_documents")
+@purges_pages("media")
 def dashboard_media_documents_delete(request):
     """
     Delete a document (soft delete).
@@ -5079,7 +4572,7 @@ def dashboard_media_documents_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/media_documents?id=eq.{doc_id}",
             headers=headers,
             json={"status": "archived"},
@@ -5105,7 +4598,7 @@ def dashboard_announcements(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/internal_announcements?order=created_at.desc",
             headers=headers,
             timeout=10
@@ -5153,7 +4646,7 @@ def dashboard_announcements_save(request):
 
         if announcement_id:
             # Update existing
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/internal_announcements?id=eq.{announcement_id}",
                 headers=headers,
                 json=payload,
@@ -5161,7 +4654,7 @@ def dashboard_announcements_save(request):
             )
         else:
             # Create new
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/internal_announcements",
                 headers=headers,
                 json=payload,
@@ -5190,7 +4683,7 @@ def dashboard_announcements_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.delete(
+        resp = supabase_rest.delete(
             f"{base_url}/rest/v1/internal_announcements?id=eq.{announcement_id}",
             headers=headers,
             timeout=10
@@ -5215,7 +4708,7 @@ def dashboard_announcements_get(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/internal_announcements?id=eq.{announcement_id}&select=*",
             headers=headers,
             timeout=10
@@ -5243,7 +4736,7 @@ def dashboard_communications(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/secure_communications?order=created_at.desc",
             headers=headers,
             timeout=10
@@ -5291,7 +4784,7 @@ def dashboard_communications_save(request):
 
         if comm_id:
             # Update existing
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/secure_communications?id=eq.{comm_id}",
                 headers=headers,
                 json=payload,
@@ -5299,7 +4792,7 @@ def dashboard_communications_save(request):
             )
         else:
             # Create new
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/secure_communications",
                 headers=headers,
                 json=payload,
@@ -5328,7 +4821,7 @@ def dashboard_communications_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.delete(
+        resp = supabase_rest.delete(
             f"{base_url}/rest/v1/secure_communications?id=eq.{comm_id}",
             headers=headers,
             timeout=10
@@ -5360,7 +4853,7 @@ def dashboard_communications_get(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/secure_communications?id=eq.{comm_id}&select=*",
             headers=headers,
             timeout=10
@@ -5428,7 +4921,7 @@ def _get_member_context(request):
         if not result.data or len(result.data) == 0:
             return None
 
-        member = result.data[0]
+        member = records.decode("members", result.data[0])
 
         # Parse name for initials
         full_name = member.get("full_name", "Member")
@@ -5446,43 +4939,34 @@ def _get_member_context(request):
         member_state = member.get("state") or ""
         member_lga = member.get("lga") or ""
 
-        # Parse created_at for member since
-        created_at = member.get("created_at", "")
+        # Member since (created_at is decoded to a datetime by records)
+        created_at = member.get("created_at")
         member_since = "2024"
         member_joined = "January 2024"
         if created_at:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                member_since = str(dt.year)
-                member_joined = dt.strftime("%B %Y")
-            except:
-                pass
+            member_since = str(created_at.year)
+            member_joined = created_at.strftime("%B %Y")
 
         member_id = member.get("member_id", "RATEL-000000")
         subscription_status = "never_subscribed"
         try:
             base_url = settings.SUPABASE_URL.rstrip("/")
             headers = _get_supabase_headers()
-            sub_resp = requests.get(
+            sub_resp = supabase_rest.get(
                 f"{base_url}/rest/v1/member_subscriptions?member_id=eq.{member_id}&order=end_date.desc&limit=1",
                 headers=headers,
                 timeout=10
             )
             if sub_resp.status_code == 200 and sub_resp.json():
-                end_date_str = sub_resp.json()[0].get("end_date")
-                if end_date_str:
-                    try:
-                        end_date = datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
-                        now = datetime.now()
-                        if end_date.replace(tzinfo=None) < now:
-                            subscription_status = "expired"
-                        elif end_date.replace(tzinfo=None) < now + timedelta(days=7):
-                            subscription_status = "expiring_soon"
-                        else:
-                            subscription_status = "active"
-                    except Exception:
-                        pass
+                end_date = records.decode("member_subscriptions", sub_resp.json()[0]).get("end_date")
+                if end_date:
+                    now = datetime.now()
+                    if end_date.replace(tzinfo=None) < now:
+                        subscription_status = "expired"
+                    elif end_date.replace(tzinfo=None) < now + timedelta(days=7):
+                        subscription_status = "expiring_soon"
+                    else:
+                        subscription_status = "active"
         except Exception:
             pass
 
@@ -5541,7 +5025,7 @@ def member_dashboard(request):
 
     announcements = []
     communications = []
-    resources = []
+    resources_count = 0
     subscription_status = "never_subscribed"
     subscription_end = None
     subscription_end_iso = None
@@ -5553,7 +5037,7 @@ def member_dashboard(request):
         headers = _get_supabase_headers()
 
         # Fetch announcements for this member type
-        ann_resp = requests.get(
+        ann_resp = supabase_rest.get(
             f"{base_url}/rest/v1/internal_announcements?{recipient_filter}&is_active=eq.true&order=is_pinned.desc,created_at.desc&limit=3",
             headers=headers,
             timeout=10
@@ -5562,7 +5046,7 @@ def member_dashboard(request):
         announcements = ann_resp.json()
 
         # Fetch communications for this member type
-        comm_resp = requests.get(
+        comm_resp = supabase_rest.get(
             f"{base_url}/rest/v1/secure_communications?{recipient_filter}&is_active=eq.true&order=created_at.desc&limit=3",
             headers=headers,
             timeout=10
@@ -5570,17 +5054,11 @@ def member_dashboard(request):
         comm_resp.raise_for_status()
         communications = comm_resp.json()
 
-        # Fetch resources count
-        res_resp = requests.get(
-            f"{base_url}/rest/v1/resources?status=eq.active&select=id",
-            headers=headers,
-            timeout=10
-        )
-        res_resp.raise_for_status()
-        resources = res_resp.json()
+        # Resources count (HEAD with count=exact, cached briefly)
+        resources_count = supabase_rest.count("resources", {"status": "eq.active"})
 
         # Fetch membership settings
-        settings_resp = requests.get(
+        settings_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=*&limit=1",
             headers=headers,
             timeout=10
@@ -5593,7 +5071,7 @@ def member_dashboard(request):
 
         # Fetch subscription status for this member
         member_id = member_ctx.get("member_id")
-        sub_resp = requests.get(
+        sub_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?member_id=eq.{member_id}&order=end_date.desc&limit=1",
             headers=headers,
             timeout=10
@@ -5628,7 +5106,7 @@ def member_dashboard(request):
         "recent_communications": communications,
         "announcements_count": len(announcements),
         "communications_count": len(communications),
-        "resources_count": len(resources),
+        "resources_count": resources_count,
         "events_count": 0,  # Will be populated when events table exists
         "subscription_status": subscription_status,
         "subscription_end": subscription_end,
@@ -5660,7 +5138,7 @@ def member_announcements(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/internal_announcements?{recipient_filter}&is_active=eq.true&order=is_pinned.desc,created_at.desc",
             headers=headers,
             timeout=10
@@ -5700,7 +5178,7 @@ def member_communications(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/secure_communications?{recipient_filter}&is_active=eq.true&order=created_at.desc",
             headers=headers,
             timeout=10
@@ -5733,21 +5211,14 @@ def member_resources(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/resources?status=eq.active&order=created_at.desc",
             headers=headers,
             timeout=10
         )
         resp.raise_for_status()
         resources = resp.json()
-
-        # Normalize file URLs and thumbnail URLs
-        storage_base = f"{base_url}/storage/v1/object/public/resources/"
-        for resource in resources:
-            if resource.get("file_url") and not str(resource["file_url"]).startswith("http"):
-                resource["file_url"] = storage_base + str(resource["file_url"]).lstrip("/")
-            if resource.get("thumbnail_url") and not str(resource["thumbnail_url"]).startswith("http"):
-                resource["thumbnail_url"] = storage_base + str(resource["thumbnail_url"]).lstrip("/")
+        storage_urls.canonicalize_rows(resources, "resources")
     except Exception as e:
         print(f"[Member Resources] Error: {e}")
 
@@ -5819,6 +5290,8 @@ def member_profile_update(request):
             "phone_number": phone,
             "city": location,
         }).eq("email", member_ctx.get("member_email")).execute()
+        member_sampler.invalidate()
+        purge_pages("members")
 
         return JsonResponse({"success": True, "message": "Profile updated successfully"})
     except Exception as e:
@@ -5934,21 +5407,15 @@ def member_profile_photo(request):
         file_ext = profile_image.name.split(".")[-1] if "." in profile_image.name else "jpg"
         file_name = f"{member_id}/{uuid.uuid4().hex[:8]}.{file_ext}"
 
-        # Upload to Supabase Storage
-        file_content = profile_image.read()
-        upload_result = sb.storage.from_("profiles").upload(
-            file_name,
-            file_content,
-            {"content-type": profile_image.content_type}
-        )
-
-        # Get public URL
-        public_url = sb.storage.from_("profiles").get_public_url(file_name)
+        # Upload to Supabase Storage (streamed from the upload's chunks)
+        public_url = storage_upload.upload(profile_image, "profiles", file_name, profile_image.content_type)
 
         # Update member record
         sb.table("members").update({
             "profile_image_url": public_url
         }).eq("email", member_ctx.get("member_email")).execute()
+        member_sampler.invalidate()
+        purge_pages("members")
 
         return JsonResponse({
             "success": True,
@@ -5979,7 +5446,7 @@ def dashboard_membership_status(request):
         headers = _get_supabase_headers()
 
         # Fetch membership settings
-        settings_resp = requests.get(
+        settings_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=*&limit=1",
             headers=headers,
             timeout=10
@@ -5991,7 +5458,7 @@ def dashboard_membership_status(request):
                 currency = settings_data[0].get("currency", "NGN")
 
         # Fetch all members with their subscription status
-        members_resp = requests.get(
+        members_resp = supabase_rest.get(
             f"{base_url}/rest/v1/members?select=member_id,full_name,email,phone_number,based_in_nigeria,state,country,created_at,status,profile_image_url&order=created_at.desc",
             headers=headers,
             timeout=10
@@ -5999,15 +5466,10 @@ def dashboard_membership_status(request):
         if members_resp.status_code == 200:
             members = members_resp.json()
 
-            # Normalize profile image URLs
-            bucket_base = f"{base_url}/storage/v1/object/public/profiles/"
-            for m in members:
-                path = m.get("profile_image_url")
-                if path and not str(path).startswith("http"):
-                    m["profile_image_url"] = bucket_base + str(path).lstrip("/")
+            storage_urls.canonicalize_rows(members, "members")
 
         # Fetch subscriptions for all members
-        subs_resp = requests.get(
+        subs_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?select=*&order=created_at.desc",
             headers=headers,
             timeout=10
@@ -6106,7 +5568,7 @@ def dashboard_payments(request):
         headers = _get_supabase_headers()
 
         # Fetch membership settings for currency
-        settings_resp = requests.get(
+        settings_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=currency&limit=1",
             headers=headers,
             timeout=10,
@@ -6117,23 +5579,19 @@ def dashboard_payments(request):
                 currency = data[0].get("currency", "NGN")
 
         # Fetch donations
-        don_resp = requests.get(
+        don_resp = supabase_rest.get(
             f"{base_url}/rest/v1/donations?select=*&order=created_at.desc",
             headers=headers,
             timeout=10,
         )
         if don_resp.status_code == 200:
-            for d in don_resp.json():
+            for d in records.decode_rows("donations", don_resp.json()):
                 amt = float(d.get("amount") or 0)
                 donations_total += amt
-                created = d.get("created_at") or ""
-                try:
-                    created_fmt = datetime.fromisoformat(created.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M") if created else "—"
-                except Exception:
-                    created_fmt = created or "—"
+                created = d.get("created_at")
                 donations_list.append({
-                    "created_at": created,
-                    "created_fmt": created_fmt,
+                    "created_at": created.isoformat() if created else "",
+                    "created_fmt": records.strftime(created, "%Y-%m-%d %H:%M", "—"),
                     "amount": amt,
                     "currency": d.get("currency") or "GHS",
                     "is_anonymous": d.get("is_anonymous", True),
@@ -6145,7 +5603,7 @@ def dashboard_payments(request):
                 })
 
         # Fetch all subscription records (membership renewal)
-        subs_resp = requests.get(
+        subs_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?select=*&order=created_at.desc",
             headers=headers,
             timeout=10,
@@ -6153,9 +5611,9 @@ def dashboard_payments(request):
         if subs_resp.status_code != 200:
             subs_data = []
         else:
-            subs_data = subs_resp.json()
+            subs_data = records.decode_rows("member_subscriptions", subs_resp.json())
 
-        members_resp = requests.get(
+        members_resp = supabase_rest.get(
             f"{base_url}/rest/v1/members?select=member_id,full_name,email",
             headers=headers,
             timeout=10,
@@ -6169,26 +5627,12 @@ def dashboard_payments(request):
             mid = sub.get("member_id")
             member_info = members_by_id.get(mid, {})
             member_name = member_info.get("full_name") or sub.get("member_email") or "—"
-            created = sub.get("created_at") or ""
-            try:
-                created_fmt = datetime.fromisoformat(created.replace("Z", "+00:00")).strftime("%Y-%m-%d %H:%M") if created else "—"
-            except Exception:
-                created_fmt = created or "—"
-            start_date = sub.get("start_date") or ""
-            end_date = sub.get("end_date") or ""
-            try:
-                start_fmt = datetime.fromisoformat(start_date.replace("Z", "+00:00")).strftime("%Y-%m-%d") if start_date else "—"
-            except Exception:
-                start_fmt = start_date or "—"
-            try:
-                end_fmt = datetime.fromisoformat(end_date.replace("Z", "+00:00")).strftime("%Y-%m-%d") if end_date else "—"
-            except Exception:
-                end_fmt = end_date or "—"
+            created = sub.get("created_at")
             amount = float(sub.get("amount_paid") or 0)
             total_amount += amount
             payments.append({
-                "created_at": created,
-                "created_fmt": created_fmt,
+                "created_at": created.isoformat() if created else "",
+                "created_fmt": records.strftime(created, "%Y-%m-%d %H:%M", "—"),
                 "member_id": mid,
                 "member_name": member_name,
                 "member_email": sub.get("member_email") or "—",
@@ -6198,8 +5642,8 @@ def dashboard_payments(request):
                 "payment_reference": sub.get("payment_reference") or "—",
                 "payment_method": sub.get("payment_method") or "—",
                 "status": sub.get("status") or "—",
-                "start_date_fmt": start_fmt,
-                "end_date_fmt": end_fmt,
+                "start_date_fmt": records.strftime(sub.get("start_date"), "%Y-%m-%d", "—"),
+                "end_date_fmt": records.strftime(sub.get("end_date"), "%Y-%m-%d", "—"),
             })
 
     except Exception as e:
@@ -6308,9 +5752,11 @@ def donation_verify(request):
     if amount <= 0:
         return JsonResponse({"success": False, "message": "Invalid amount."})
 
+    # Verification stays in the request (not a job): the response tells the payer whether
+    # the payment counted, and nothing may be recorded for a reference Paystack hasn't confirmed
     _, paystack_secret_key = _get_paystack_keys()
     try:
-        verify_resp = requests.get(
+        verify_resp = supabase_rest.get(
             f"https://api.paystack.co/transaction/verify/{reference}",
             headers={
                 "Authorization": f"Bearer {paystack_secret_key}",
@@ -6344,7 +5790,7 @@ def donation_verify(request):
         "status": "success",
     }
     try:
-        resp = requests.post(
+        resp = supabase_rest.post(
             f"{base_url}/rest/v1/donations",
             headers=headers,
             json=payload,
@@ -6358,7 +5804,7 @@ def donation_verify(request):
 
     # Send thank-you email to donor (only when they provided email)
     if donor_email and donor_email.strip():
-        _send_donation_thank_you(request, donor_email.strip(), donor_name or "Valued Supporter", amount)
+        _send_donation_thank_you(request, donor_email.strip(), donor_name or "Valued Supporter", amount, reference)
 
     return JsonResponse({"success": True})
 
@@ -6383,7 +5829,7 @@ def dashboard_membership_settings_save(request):
         headers = _get_supabase_headers()
 
         # Check if settings exist
-        check_resp = requests.get(
+        check_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=id&limit=1",
             headers=headers,
             timeout=10
@@ -6398,7 +5844,7 @@ def dashboard_membership_settings_save(request):
         if check_resp.status_code == 200 and check_resp.json():
             # Update existing
             setting_id = check_resp.json()[0]["id"]
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/membership_settings?id=eq.{setting_id}",
                 headers=headers,
                 json=payload,
@@ -6407,7 +5853,7 @@ def dashboard_membership_settings_save(request):
         else:
             # Insert new
             payload["created_at"] = datetime.now().isoformat()
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/membership_settings",
                 headers=headers,
                 json=payload,
@@ -6448,7 +5894,7 @@ def dashboard_membership_send_reminder(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        settings_resp = requests.get(
+        settings_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=*&limit=1",
             headers=headers,
             timeout=10
@@ -6513,47 +5959,23 @@ def member_subscriptions(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
         member_id = member_ctx.get("member_id")
-        sub_resp = requests.get(
+        sub_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?member_id=eq.{member_id}&order=created_at.desc&select=*",
             headers=headers,
             timeout=10
         )
         if sub_resp.status_code == 200:
-            raw = sub_resp.json()
+            raw = records.decode_rows("member_subscriptions", sub_resp.json())
             for s in raw:
-                start_str = s.get("start_date")
-                end_str = s.get("end_date")
-                created_str = s.get("created_at")
-                start_fmt = start_str
-                end_fmt = end_str
-                created_fmt = created_str
-                if start_str:
-                    try:
-                        dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                        start_fmt = dt.strftime("%B %d, %Y")
-                    except Exception:
-                        pass
-                if end_str:
-                    try:
-                        dt = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-                        end_fmt = dt.strftime("%B %d, %Y")
-                    except Exception:
-                        pass
-                if created_str:
-                    try:
-                        dt = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                        created_fmt = dt.strftime("%B %d, %Y")
-                    except Exception:
-                        pass
                 subscriptions.append({
                     "id": s.get("id"),
                     "member_id": s.get("member_id"),
                     "member_email": s.get("member_email"),
                     "amount_paid": s.get("amount_paid"),
                     "months_subscribed": s.get("months_subscribed", 1),
-                    "start_date": start_fmt,
-                    "end_date": end_fmt,
-                    "created_at": created_fmt,
+                    "start_date": records.strftime(s.get("start_date"), "%B %d, %Y", None),
+                    "end_date": records.strftime(s.get("end_date"), "%B %d, %Y", None),
+                    "created_at": records.strftime(s.get("created_at"), "%B %d, %Y", None),
                     "status": s.get("status", "active"),
                     "payment_reference": s.get("payment_reference"),
                     "payment_method": s.get("payment_method", "paystack"),
@@ -6585,7 +6007,7 @@ def member_subscription_invoice_pdf(request, subscription_id):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
         # Fetch this subscription only if it belongs to the logged-in member
-        sub_resp = requests.get(
+        sub_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?id=eq.{subscription_id}&member_id=eq.{member_id}&select=*&limit=1",
             headers=headers,
             timeout=10
@@ -6593,39 +6015,15 @@ def member_subscription_invoice_pdf(request, subscription_id):
         if sub_resp.status_code != 200 or not sub_resp.json():
             return HttpResponse("Invoice not found.", status=404)
 
-        s = sub_resp.json()[0]
-        start_str = s.get("start_date")
-        end_str = s.get("end_date")
-        created_str = s.get("created_at")
-        start_fmt = start_str or ""
-        end_fmt = end_str or ""
-        created_fmt = created_str or ""
-        if start_str:
-            try:
-                dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                start_fmt = dt.strftime("%B %d, %Y")
-            except Exception:
-                pass
-        if end_str:
-            try:
-                dt = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-                end_fmt = dt.strftime("%B %d, %Y")
-            except Exception:
-                pass
-        if created_str:
-            try:
-                dt = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                created_fmt = dt.strftime("%B %d, %Y")
-            except Exception:
-                pass
+        s = records.decode("member_subscriptions", sub_resp.json()[0])
 
         subscription = {
             "payment_reference": s.get("payment_reference") or "—",
             "amount_paid": s.get("amount_paid"),
             "months_subscribed": s.get("months_subscribed", 1),
-            "start_date": start_fmt,
-            "end_date": end_fmt,
-            "created_at": created_fmt,
+            "start_date": records.strftime(s.get("start_date"), "%B %d, %Y"),
+            "end_date": records.strftime(s.get("end_date"), "%B %d, %Y"),
+            "created_at": records.strftime(s.get("created_at"), "%B %d, %Y"),
             "status": s.get("status", "active"),
             "payment_method": (s.get("payment_method") or "paystack").upper(),
         }
@@ -6886,7 +6284,7 @@ def member_renew(request):
         headers = _get_supabase_headers()
 
         # Fetch membership settings
-        settings_resp = requests.get(
+        settings_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=*&limit=1",
             headers=headers,
             timeout=10
@@ -6899,7 +6297,7 @@ def member_renew(request):
 
         # Fetch current subscription for this member
         member_id = member_ctx.get("member_id")
-        sub_resp = requests.get(
+        sub_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?member_id=eq.{member_id}&order=end_date.desc&limit=1",
             headers=headers,
             timeout=10
@@ -6973,7 +6371,7 @@ def member_renew_verify(request):
     _, paystack_secret_key = _get_paystack_keys()
 
     try:
-        verify_resp = requests.get(
+        verify_resp = supabase_rest.get(
             f"https://api.paystack.co/transaction/verify/{reference}",
             headers={
                 "Authorization": f"Bearer {paystack_secret_key}",
@@ -6999,7 +6397,7 @@ def member_renew_verify(request):
 
         # Check for existing active subscription
         now = datetime.now()
-        sub_resp = requests.get(
+        sub_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?member_id=eq.{member_id}&order=end_date.desc&limit=1",
             headers=headers,
             timeout=10
@@ -7036,7 +6434,7 @@ def member_renew_verify(request):
             "created_at": now.isoformat(),
         }
 
-        create_resp = requests.post(
+        create_resp = supabase_rest.post(
             f"{base_url}/rest/v1/member_subscriptions",
             headers=headers,
             json=subscription_payload,
@@ -7053,6 +6451,7 @@ def member_renew_verify(request):
                 member_name,
                 member_ctx.get("member_id", ""),
                 end_date_fmt,
+                reference,
             )
             return JsonResponse({
                 "success": True,
@@ -7090,14 +6489,14 @@ def admin_fix_missing_subscriptions(request):
         
         if is_admin:
             # Admin can fix all members
-            members_resp = requests.get(
+            members_resp = supabase_rest.get(
                 f"{base_url}/rest/v1/members?created_at=gte.{twenty_four_hours_ago}&status=eq.active&select=*",
                 headers=headers,
                 timeout=10
             )
         else:
             # Regular user can only fix their own
-            members_resp = requests.get(
+            members_resp = supabase_rest.get(
                 f"{base_url}/rest/v1/members?email=eq.{current_user_email}&status=eq.active&select=*",
                 headers=headers,
                 timeout=10
@@ -7112,7 +6511,7 @@ def admin_fix_missing_subscriptions(request):
             created_at = member.get("created_at")
             
             # Check if subscription exists
-            sub_resp = requests.get(
+            sub_resp = supabase_rest.get(
                 f"{base_url}/rest/v1/member_subscriptions?member_id=eq.{member_id}",
                 headers=headers,
                 timeout=10
@@ -7136,7 +6535,7 @@ def admin_fix_missing_subscriptions(request):
                     "created_at": created_date.isoformat(),
                 }
                 
-                create_resp = requests.post(
+                create_resp = supabase_rest.post(
                     f"{base_url}/rest/v1/member_subscriptions",
                     headers=headers,
                     json=subscription_payload,
@@ -7171,7 +6570,7 @@ def send_renewal_reminders():
         # Get membership fee
         membership_fee = 500
         currency = "NGN"
-        settings_resp = requests.get(
+        settings_resp = supabase_rest.get(
             f"{base_url}/rest/v1/membership_settings?select=*&limit=1",
             headers=headers,
             timeout=10
@@ -7187,7 +6586,7 @@ def send_renewal_reminders():
         seven_days_later = (now + timedelta(days=7)).isoformat()
 
         # Get subscriptions that expire within 7 days and haven't been notified recently
-        subs_resp = requests.get(
+        subs_resp = supabase_rest.get(
             f"{base_url}/rest/v1/member_subscriptions?status=eq.active&end_date=lt.{seven_days_later}&select=*",
             headers=headers,
             timeout=10
@@ -7256,14 +6655,10 @@ def dashboard_messages(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Fetch all messages (including inactive)
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/shareable_messages?select=*&order=display_order.asc,created_at.desc",
             headers=headers,
             timeout=10
@@ -7302,13 +6697,9 @@ def dashboard_messages_get(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/shareable_messages?id=eq.{message_id}&select=*",
             headers=headers,
             timeout=10
@@ -7333,12 +6724,7 @@ def dashboard_messages_save(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Content-Type": "application/json",
-            "Prefer": "return=representation",
-        }
+        headers = supabase_rest.write_headers("return=representation")
 
         # Parse hashtags from JSON
         hashtags_str = request.POST.get("hashtags", "[]")
@@ -7353,26 +6739,12 @@ def dashboard_messages_save(request):
         media_file = request.FILES.get("media_file")
 
         if media_file:
-            # Upload to Supabase storage bucket "messages"
-            storage_url = f"{base_url}/storage/v1/object/messages/{media_file.name}"
-            storage_headers = {
-                "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-                "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-                "Content-Type": media_file.content_type,
-            }
-
-            upload_resp = requests.post(
-                storage_url,
-                headers=storage_headers,
-                data=media_file.read(),
-                timeout=60
-            )
-
-            if upload_resp.status_code in [200, 201]:
-                media_url = f"{base_url}/storage/v1/object/public/messages/{media_file.name}"
+            # Upload to Supabase storage bucket "messages", streamed (resumable for large videos)
+            try:
+                media_url = storage_upload.upload(media_file, "messages", media_file.name, media_file.content_type)
                 media_filename = media_file.name
-            else:
-                print(f"[Messages Upload] Failed: {upload_resp.status_code} - {upload_resp.text}")
+            except storage_upload.StorageUploadError as e:
+                print(f"[Messages Upload] Failed: {e}")
 
         # Build payload
         payload = {
@@ -7399,7 +6771,7 @@ def dashboard_messages_save(request):
 
         if message_id:
             # Update existing
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/shareable_messages?id=eq.{message_id}",
                 headers=headers,
                 json=payload,
@@ -7407,7 +6779,7 @@ def dashboard_messages_save(request):
             )
         else:
             # Create new
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/shareable_messages",
                 headers=headers,
                 json=payload,
@@ -7415,6 +6787,7 @@ def dashboard_messages_save(request):
             )
 
         if resp.status_code in [200, 201]:
+            _forget_shareable_message_ids()
             return JsonResponse({"success": True})
         else:
             return JsonResponse({"success": False, "error": resp.text})
@@ -7439,18 +6812,16 @@ def dashboard_messages_delete(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        }
+        headers = supabase_rest.read_headers()
 
-        resp = requests.delete(
+        resp = supabase_rest.delete(
             f"{base_url}/rest/v1/shareable_messages?id=eq.{message_id}",
             headers=headers,
             timeout=10
         )
 
         if resp.status_code in [200, 204]:
+            _forget_shareable_message_ids()
             return JsonResponse({"success": True})
         else:
             return JsonResponse({"success": False, "error": resp.text})
@@ -7469,26 +6840,15 @@ def dashboard_youtube_ig(request):
     instagram_list = []
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
         # Get all links and filter by type
-        resp_all = requests.get(
+        resp_all = supabase_rest.get(
             f"{base_url}/rest/v1/youtube_ig_links?select=*&order=display_order.asc,created_at.desc",
             headers=headers,
             timeout=10
         )
         all_links = resp_all.json() if resp_all.status_code == 200 else []
-
-        # Normalize thumbnail URLs using robust normalizer
-        for link in all_links:
-            if link.get("thumbnail_url"):
-                original_url = link["thumbnail_url"]
-                link["thumbnail_url"] = _normalize_messages_url(original_url)
-                if link["thumbnail_url"] != original_url:
-                    print(f"[Dashboard YouTube/IG] Normalized thumbnail: {original_url} -> {link['thumbnail_url']}")
+        storage_urls.canonicalize_rows(all_links, "youtube_ig_links")
 
         # Filter YouTube links (those with youtube_url and no ig_url)
         youtube_list = [link for link in all_links if link.get("youtube_url") and not link.get("ig_url")]
@@ -7511,12 +6871,8 @@ def dashboard_youtube_ig_get(request):
         return JsonResponse({"success": False, "error": "No ID provided"})
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
-        resp = requests.get(
+        headers = supabase_rest.read_headers()
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/youtube_ig_links?id=eq.{link_id}&select=*",
             headers=headers,
             timeout=10
@@ -7531,6 +6887,8 @@ def dashboard_youtube_ig_get(request):
 
 
 @require_POST
+@invalidates_landing("links")
+@purges_pages("landing")
 def dashboard_youtube_ig_save(request):
     """Create or update a YouTube/IG link. Optional thumbnail upload to messages bucket."""
     import uuid
@@ -7558,12 +6916,7 @@ def dashboard_youtube_ig_save(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Content-Type": "application/json",
-            "Prefer": "return=representation",
-        }
+        headers = supabase_rest.write_headers("return=representation")
 
         # Handle thumbnail upload
         thumbnail_url = None
@@ -7585,17 +6938,17 @@ def dashboard_youtube_ig_save(request):
         # Only include thumbnail_url in payload if a new file was uploaded
         # When editing without new upload, omitting it preserves the existing thumbnail
         if thumbnail_url:
-            payload["thumbnail_url"] = thumbnail_url
+            payload["thumbnail_url"] = storage_urls.resolve(thumbnail_url, "messages")
 
         if link_id:
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/youtube_ig_links?id=eq.{link_id}",
                 headers=headers,
                 json=payload,
                 timeout=10
             )
         else:
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/youtube_ig_links",
                 headers=headers,
                 json=payload,
@@ -7609,6 +6962,8 @@ def dashboard_youtube_ig_save(request):
 
 
 @require_POST
+@invalidates_landing("links")
+@purges_pages("landing")
 def dashboard_youtube_ig_delete(request):
     """Delete a YouTube/IG link."""
     import json
@@ -7621,11 +6976,8 @@ def dashboard_youtube_ig_delete(request):
         return JsonResponse({"success": False, "error": "No ID provided"})
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-        }
-        resp = requests.delete(
+        headers = supabase_rest.read_headers()
+        resp = supabase_rest.delete(
             f"{base_url}/rest/v1/youtube_ig_links?id=eq.{link_id}",
             headers=headers,
             timeout=10
@@ -7637,6 +6989,31 @@ def dashboard_youtube_ig_delete(request):
         return JsonResponse({"success": False, "error": str(e)})
 
 
+SHAREABLE_MESSAGE_IDS_KEY = "messages:ids"
+
+
+def _forget_shareable_message_ids():
+    from django.core.cache import cache
+    cache.delete(SHAREABLE_MESSAGE_IDS_KEY)
+
+
+def _shareable_message_ids():
+    """Ids of all shareable messages, cached so tracking doesn't query per click."""
+    from django.core.cache import cache
+    ids = cache.get(SHAREABLE_MESSAGE_IDS_KEY)
+    if ids is None:
+        resp = supabase_rest.get(
+            f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/shareable_messages?select=id",
+            headers=supabase_rest.read_headers(),
+            timeout=10,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"Could not load message ids: {resp.status_code}")
+        ids = {str(row["id"]) for row in resp.json()}
+        cache.set(SHAREABLE_MESSAGE_IDS_KEY, ids, 300)
+    return ids
+
+
 @require_POST
 def messages_track(request):
     """Track message share/download/copy actions."""
@@ -7652,60 +7029,30 @@ def messages_track(request):
     if not message_id or not action:
         return JsonResponse({"success": False, "error": "Missing parameters"})
 
-    try:
-        base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Content-Type": "application/json",
-        }
-
-        # Determine which counter to increment
-        if action == "copy":
-            field = "copy_count"
-        elif action == "download":
-            field = "download_count"
-        elif action.startswith("share"):
-            field = "share_count"
-        else:
-            return JsonResponse({"success": False, "error": "Unknown action"})
-
-        # Get current count
-        resp = requests.get(
-            f"{base_url}/rest/v1/shareable_messages?id=eq.{message_id}&select={field}",
-            headers=headers,
-            timeout=10
-        )
-
-        if resp.status_code == 200:
-            data = resp.json()
-            if data:
-                current_count = data[0].get(field, 0)
-                # Increment count
-                update_resp = requests.patch(
-                    f"{base_url}/rest/v1/shareable_messages?id=eq.{message_id}",
-                    headers=headers,
-                    json={field: current_count + 1},
-                    timeout=10
-                )
-
-                # Also log to analytics table
-                analytics_payload = {
-                    "message_id": message_id,
-                    "share_platform": action,
-                    "ip_address": request.META.get("REMOTE_ADDR"),
-                    "user_agent": request.META.get("HTTP_USER_AGENT", "")[:500],
-                }
-                requests.post(
-                    f"{base_url}/rest/v1/message_share_analytics",
-                    headers=headers,
-                    json=analytics_payload,
-                    timeout=5
-                )
+    # Determine which counter to increment
+    if action == "copy":
+        field = "copy_count"
+    elif action == "download":
+        field = "download_count"
+    elif action.startswith("share"):
+        field = "share_count"
+    else:
+        return JsonResponse({"success": False, "error": "Unknown action"})
 
-                return JsonResponse({"success": True})
+    try:
+        # Unknown ids would fail the analytics insert (foreign key), so they are never queued
+        if message_id not in _shareable_message_ids():
+            return JsonResponse({"success": False, "error": "Message not found"}, status=404)
 
-        return JsonResponse({"success": False, "error": "Failed to update"})
+        # Written by the job worker. Two jobs, so retrying one never repeats the other's write
+        jobs.enqueue("messages.track", {"message_id": message_id, "field": field})
+        jobs.enqueue("messages.share_event", {
+            "message_id": message_id,
+            "action": action,
+            "ip_address": request.META.get("REMOTE_ADDR"),
+            "user_agent": request.META.get("HTTP_USER_AGENT", "")[:500],
+        })
+        return JsonResponse({"success": True})
 
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)})
@@ -7715,6 +7062,7 @@ def messages_track(request):
 # CASES MANAGEMENT
 # =====================================================
 
+@cache_public_page(120, tags=("cases",), params=("status", "q"))
 def cases_page(request):
     """
     Public cases page - displays all cases with search and filter.
@@ -7725,11 +7073,7 @@ def cases_page(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = {
-            "apikey": settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY,
-            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY or settings.SUPABASE_KEY}",
-            "Accept": "application/json",
-        }
+        headers = supabase_rest.read_headers()
 
         # Build query - only show active, solved, and completed cases to public
         url = f"{base_url}/rest/v1/cases?select=*&status=in.(active,solved,completed)&order=date_reported.desc,created_at.desc"
@@ -7738,21 +7082,9 @@ def cases_page(request):
         if status_filter and status_filter != 'all' and status_filter in ['active', 'solved', 'completed']:
             url = f"{base_url}/rest/v1/cases?select=*&status=eq.{status_filter}&order=date_reported.desc,created_at.desc"
 
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
-            cases = resp.json()
-            # Normalize date strings so Django |date filter works in template
-            for case in cases:
-                for key in ("date_reported", "created_at", "updated_at"):
-                    val = case.get(key)
-                    if val and isinstance(val, str) and val.strip():
-                        try:
-                            if "T" in val:
-                                case[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                            else:
-                                case[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                        except (ValueError, TypeError):
-                            case[key] = None
+            cases = records.decode_rows("cases", resp.json())
 
         # Apply search filter in Python (for now) if search query exists
         if search_query:
@@ -7782,26 +7114,13 @@ def dashboard_cases(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/cases?order=created_at.desc",
             headers=headers,
             timeout=10
         )
         resp.raise_for_status()
-        cases = resp.json()
-        # Normalize date strings from Supabase so Django's |date filter works in template
-        for case in cases:
-            for key in ("date_reported", "created_at", "updated_at"):
-                val = case.get(key)
-                if val and isinstance(val, str) and val.strip():
-                    try:
-                        if "T" in val:
-                            case[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                        else:
-                            case[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                    except (ValueError, TypeError) as e:
-                        print(f"[Dashboard Cases] Date parse error for {key}={val}: {e}")
-                        case[key] = None
+        cases = records.decode_rows("cases", resp.json())
     except Exception as e:
         print(f"[Dashboard Cases] Error fetching: {e}")
         messages.error(request, "Failed to load cases.")
@@ -7810,6 +7129,8 @@ def dashboard_cases(request):
 
 
 @require_POST
+@invalidates_landing("featured_cases")
+@purges_pages("cases")
 def dashboard_cases_save(request):
     """
     Create or update a case. Handles both JSON and form data.
@@ -7854,10 +7175,17 @@ def dashboard_cases_save(request):
     assigned_to = data.get("assigned_to", "").strip() or None
     notes = data.get("notes", "").strip() or None
 
-    # Handle file upload if provided
+    # Handle file upload if provided (normally already sent straight to Storage by the browser)
     file_url = None
     file_name = None
-    if request.FILES.get("case_file"):
+    try:
+        stored_case_file = _direct_upload(request, "case_file", "case_file")
+    except direct_upload.UploadRejected as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    if stored_case_file:
+        file_url = stored_case_file["url"]
+        file_name = stored_case_file["name"]
+    elif request.FILES.get("case_file"):
         case_file = request.FILES.get("case_file")
         file_url = _upload_to_supabase_storage(case_file, "media-vault", "cases")
         if file_url:
@@ -7874,7 +7202,7 @@ def dashboard_cases_save(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers()
+        headers = supabase_rest.write_headers("return=representation")
 
         # Parse tags
         tags_list = [t.strip() for t in tags_str.split(",") if t.strip()] if tags_str else []
@@ -7909,7 +7237,7 @@ def dashboard_cases_save(request):
 
         if case_id:
             # Update existing
-            resp = requests.patch(
+            resp = supabase_rest.patch(
                 f"{base_url}/rest/v1/cases?id=eq.{case_id}",
                 headers=headers,
                 json=payload,
@@ -7917,7 +7245,7 @@ def dashboard_cases_save(request):
             )
         else:
             # Create new
-            resp = requests.post(
+            resp = supabase_rest.post(
                 f"{base_url}/rest/v1/cases",
                 headers=headers,
                 json=payload,
@@ -7928,6 +7256,10 @@ def dashboard_cases_save(request):
             error_msg = resp.text
             print(f"[Cases Save] Error ({resp.status_code}): {error_msg}")
             return JsonResponse({"success": False, "error": error_msg[:200]})
+
+        from . import feeds
+        for row in (resp.json() if resp.content else []):
+            feeds.upsert_item("cases", row)
         
         return JsonResponse({"success": True})
     except Exception as e:
@@ -7938,6 +7270,8 @@ def dashboard_cases_save(request):
 
 
 @require_POST
+@invalidates_landing("featured_cases")
+@purges_pages("cases")
 def dashboard_cases_delete(request):
     """
     Delete a case.
@@ -7953,13 +7287,16 @@ def dashboard_cases_delete(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.delete(
+        resp = supabase_rest.delete(
             f"{base_url}/rest/v1/cases?id=eq.{case_id}",
             headers=headers,
             timeout=10
         )
         resp.raise_for_status()
 
+        from . import feeds
+        feeds.remove_item("cases", case_id)
+
         return JsonResponse({"success": True})
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)})
@@ -7978,7 +7315,7 @@ def dashboard_cases_get(request):
         base_url = settings.SUPABASE_URL.rstrip("/")
         headers = _get_supabase_headers()
 
-        resp = requests.get(
+        resp = supabase_rest.get(
             f"{base_url}/rest/v1/cases?id=eq.{case_id}&select=*",
             headers=headers,
             timeout=10
@@ -7994,6 +7331,8 @@ def dashboard_cases_get(request):
 
 
 @require_POST
+@invalidates_landing("featured_cases")
+@purges_pages("cases")
 def dashboard_cases_status(request):
     """
     Toggle case status (active/solved/completed).
@@ -8011,9 +7350,9 @@ def dashboard_cases_status(request):
 
     try:
         base_url = settings.SUPABASE_URL.rstrip("/")
-        headers = _get_supabase_headers()
+        headers = supabase_rest.write_headers("return=representation")
 
-        resp = requests.patch(
+        resp = supabase_rest.patch(
             f"{base_url}/rest/v1/cases?id=eq.{case_id}",
             headers=headers,
             json={"status": new_status},
@@ -8021,6 +7360,10 @@ def dashboard_cases_status(request):
         )
         resp.raise_for_status()
 
+        from . import feeds
+        for row in (resp.json() if resp.content else []):
+            feeds.upsert_item("cases", row)
+
         return JsonResponse({"success": True})
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)})
@@ -8039,25 +7382,10 @@ def dashboard_blogs(request):
         headers = _get_supabase_headers()
         
         url = f"{base_url}/rest/v1/blogs?select=*&order=created_at.desc"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
-            blogs = resp.json()
-            # Parse dates and normalize image URLs
-            for b in blogs:
-                for key in ("published_at", "created_at", "updated_at"):
-                    val = b.get(key)
-                    if val and isinstance(val, str) and val.strip():
-                        try:
-                            if "T" in val:
-                                b[key] = datetime.fromisoformat(val.replace("Z", "+00:00"))
-                            else:
-                                b[key] = datetime.strptime(val, "%Y-%m-%d").date()
-                        except (ValueError, TypeError):
-                            b[key] = None
-                
-                # Normalize featured_image_url - ensure it's a full public URL
-                if b.get("featured_image_url"):
-                    b["featured_image_url"] = _normalize_blog_image_url(b["featured_image_url"], base_url)
+            blogs = storage_urls.canonicalize_rows(resp.json(), "blogs")
+            records.decode_rows("blogs", blogs)
     except Exception as e:
         print(f"[Dashboard Blogs] Error: {e}")
     
@@ -8067,7 +7395,26 @@ def dashboard_blogs(request):
     })
 
 
+def _blog_saved(resp):
+    """Update the blog indexes and related posts from a save response (Prefer: return=representation)."""
+    from . import blog_facets, blog_search, feeds, related_posts
+    try:
+        rows = resp.json() if resp.content else []
+    except ValueError:
+        rows = []
+    for row in rows:
+        blog_facets.upsert_post(row)
+        try:
+            blog_search.reindex_post(row)
+        except Exception as e:
+            print(f"[Blog Search] Reindex failed: {e}")
+        related_posts.recompute_async(row.get("id"))
+        feeds.upsert_item("blogs", row)
+
+
 @require_POST
+@invalidates_landing("latest_blogs")
+@purges_pages("blogs")
 def dashboard_blogs_save(request):
     """Save or update a blog post."""
     import json
@@ -8105,13 +7452,19 @@ def dashboard_blogs_save(request):
             check_url = f"{base_url}/rest/v1/blogs?slug=eq.{slug}&id=neq.{blog_id}&select=id&limit=1"
         else:
             check_url = f"{base_url}/rest/v1/blogs?slug=eq.{slug}&select=id&limit=1"
-        check_resp = requests.get(check_url, headers=headers, timeout=10)
+        check_resp = supabase_rest.get(check_url, headers=headers, timeout=10)
         if check_resp.status_code == 200 and check_resp.json():
             slug = f"{slug}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
         
-        # Handle image upload
+        # Handle image upload (normally already sent straight to Storage by the browser)
         featured_image_url = existing_image_url
-        if image_file:
+        try:
+            stored_image = _direct_upload(request, "featured_image", "blog_image")
+        except direct_upload.UploadRejected as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+        if stored_image:
+            featured_image_url = stored_image["url"]
+        elif image_file:
             print(f"[Blog Save] Uploading new image: {image_file.name}")
             uploaded_url = _upload_to_supabase_storage(image_file, "blogs", "featured")
             if uploaded_url:
@@ -8142,7 +7495,7 @@ def dashboard_blogs_save(request):
             "is_featured": is_featured,
             "author_name": author_name,
             "meta_description": meta_description or None,
-            "featured_image_url": featured_image_url or None,
+            "featured_image_url": storage_urls.resolve(featured_image_url, "blogs"),
             "reading_time": reading_time,
             "published_at": datetime.now().isoformat() if is_published else None,
         }
@@ -8153,16 +7506,18 @@ def dashboard_blogs_save(request):
         if blog_id:
             # Update existing
             url = f"{base_url}/rest/v1/blogs?id=eq.{blog_id}"
-            resp = requests.patch(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.patch(url, headers=headers, json=payload, timeout=10)
             if resp.status_code in [200, 201, 204]:
+                _blog_saved(resp)
                 return JsonResponse({"success": True, "message": "Blog updated successfully!", "slug": slug})
             else:
                 return JsonResponse({"success": False, "error": f"Failed to update: {resp.text}"}, status=400)
         else:
             # Create new
             url = f"{base_url}/rest/v1/blogs"
-            resp = requests.post(url, headers=headers, json=payload, timeout=10)
+            resp = supabase_rest.post(url, headers=headers, json=payload, timeout=10)
             if resp.status_code in [200, 201]:
+                _blog_saved(resp)
                 return JsonResponse({"success": True, "message": "Blog created successfully!", "slug": slug})
             else:
                 return JsonResponse({"success": False, "error": f"Failed to create: {resp.text}"}, status=400)
@@ -8185,7 +7540,7 @@ def dashboard_blogs_get(request):
         headers = _get_supabase_headers()
         
         url = f"{base_url}/rest/v1/blogs?id=eq.{blog_id}&select=*&limit=1"
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = supabase_rest.get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             blogs = resp.json()
             if blogs:
@@ -8199,6 +7554,8 @@ def dashboard_blogs_get(request):
 
 
 @require_POST
+@invalidates_landing("latest_blogs")
+@purges_pages("blogs")
 def dashboard_blogs_delete(request):
     """Delete a blog post."""
     import json
@@ -8216,8 +7573,13 @@ def dashboard_blogs_delete(request):
         headers = _get_supabase_headers()
         
         url = f"{base_url}/rest/v1/blogs?id=eq.{blog_id}"
-        resp = requests.delete(url, headers=headers, timeout=10)
+        resp = supabase_rest.delete(url, headers=headers, timeout=10)
         if resp.status_code in [200, 204]:
+            from . import blog_facets, blog_search, feeds, related_posts
+            blog_facets.remove_post(blog_id)
+            blog_search.remove_post(blog_id)
+            related_posts.recompute_async(blog_id)
+            feeds.remove_item("blogs", blog_id)
             return JsonResponse({"success": True, "message": "Blog deleted successfully!"})
         else:
             return JsonResponse({"success": False, "error": resp.text}, status=400)
@@ -172,3 +172,102 @@ EMAIL_HOST_PASSWORD = os.getenv(
 )
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+
+# Concurrent fan-out loader (landing page and other multi-query views).
+# FANOUT_MAX_WORKERS sizes the process-wide pool: about 9 branches per landing render
+# times the renders expected at once (web server threads per process).
+FANOUT_MAX_WORKERS = int(os.getenv("FANOUT_MAX_WORKERS", 64))
+FANOUT_DEADLINE = float(os.getenv("FANOUT_DEADLINE", 4.0))
+
+# Pooled Supabase REST client (main/supabase_rest.py)
+SUPABASE_HTTP_POOL_SIZE = int(os.getenv("SUPABASE_HTTP_POOL_SIZE", 10))
+SUPABASE_HTTP_RETRIES = int(os.getenv("SUPABASE_HTTP_RETRIES", 2))
+SUPABASE_HTTP_BACKOFF = float(os.getenv("SUPABASE_HTTP_BACKOFF", 0.3))
+
+# Shared cache so landing sections, stats snapshots and invalidations are seen by every worker
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("DJANGO_CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", str(BASE_DIR / "cache")),
+    }
+}
+
+# Landing page statistics: resolved cases shown = baseline + solved/completed cases in Supabase
+STATS_CASES_RESOLVED_BASELINE = int(os.getenv("STATS_CASES_RESOLVED_BASELINE", 40))
+
+# Write-behind counters (main/counters.py): flush interval in seconds, and an optional
+# SQLite file that keeps unflushed deltas across restarts (e.g. BASE_DIR / "counters_spill.sqlite3")
+COUNTER_FLUSH_INTERVAL = float(os.getenv("COUNTER_FLUSH_INTERVAL", 5))
+COUNTER_SPILL_DB = os.getenv("COUNTER_SPILL_DB", "")
+COUNTER_EVENT_RETRIES = int(os.getenv("COUNTER_EVENT_RETRIES", 5))
+COUNTER_MAX_EVENTS = int(os.getenv("COUNTER_MAX_EVENTS", 10000))
+
+# Landing page featured members: seconds between pool reloads, and whether members with a photo are picked first
+FEATURED_MEMBERS_POOL_TTL = int(os.getenv("FEATURED_MEMBERS_POOL_TTL", 600))
+FEATURED_MEMBERS_PREFER_IMAGES = os.getenv("FEATURED_MEMBERS_PREFER_IMAGES", "False").lower() == "true"
+
+# Storage URLs: set to true once `manage.py canonicalize_storage_urls` has rewritten stored URLs
+STORAGE_URLS_CANONICAL = os.getenv("STORAGE_URLS_CANONICAL", "False").lower() == "true"
+
+# Blog listing: posts per page (keyset pagination) and seconds each listing page is cached
+BLOG_PAGE_SIZE = int(os.getenv("BLOG_PAGE_SIZE", 12))
+BLOG_LIST_CACHE_TTL = int(os.getenv("BLOG_LIST_CACHE_TTL", 120))
+
+# Blog sidebar facet index: seconds before a full rebuild (it is otherwise updated incrementally)
+BLOG_FACETS_REBUILD_INTERVAL = int(os.getenv("BLOG_FACETS_REBUILD_INTERVAL", 3600))
+
+# Blog search: ranked results shown on /blog/?q=
+BLOG_SEARCH_RESULTS = int(os.getenv("BLOG_SEARCH_RESULTS", 30))
+
+# Related posts (main/related_posts.py): how many are precomputed and shown per blog post
+RELATED_POSTS_TOP_K = int(os.getenv("RELATED_POSTS_TOP_K", 5))
+
+# Blog comments API (main/blog_comments.py): comments per page and seconds pages are cached
+BLOG_COMMENTS_PAGE_SIZE = int(os.getenv("BLOG_COMMENTS_PAGE_SIZE", 20))
+BLOG_COMMENTS_CACHE_TTL = int(os.getenv("BLOG_COMMENTS_CACHE_TTL", 30))
+
+# Seconds a visitor's known comment likes are remembered for the likes check
+BLOG_COMMENT_LIKES_CACHE_TTL = int(os.getenv("BLOG_COMMENT_LIKES_CACHE_TTL", 600))
+
+# Sitemap and RSS/Atom feeds (main/feeds.py): absolute base URL used in them (defaults to the
+# request host), seconds clients may reuse them, and seconds before the item lists are reloaded
+SITE_URL = os.getenv("SITE_URL", "")
+FEEDS_MAX_AGE = int(os.getenv("FEEDS_MAX_AGE", 300))
+FEEDS_REBUILD_INTERVAL = int(os.getenv("FEEDS_REBUILD_INTERVAL", 21600))
+
+# Seconds supabase_rest.count()/counts() results are cached
+SUPABASE_COUNT_CACHE_TTL = int(os.getenv("SUPABASE_COUNT_CACHE_TTL", 30))
+
+# Media vault listings (main/media_listing.py): items per page (infinite scroll) and seconds pages are cached
+MEDIA_PAGE_SIZE = int(os.getenv("MEDIA_PAGE_SIZE", 24))
+MEDIA_LIST_CACHE_TTL = int(os.getenv("MEDIA_LIST_CACHE_TTL", 120))
+
+# Storage uploads (main/storage_upload.py): Storage API base (defaults to SUPABASE_URL/storage/v1; point it
+# at a local Storage server to test), chunk size for resumable uploads (Supabase expects 6 MB) and
+# retries per chunk before an upload is given up
+STORAGE_ENDPOINT = os.getenv("STORAGE_ENDPOINT", "")
+STORAGE_UPLOAD_CHUNK_SIZE = int(os.getenv("STORAGE_UPLOAD_CHUNK_SIZE", 6 * 1024 * 1024))
+STORAGE_UPLOAD_RETRIES = int(os.getenv("STORAGE_UPLOAD_RETRIES", 5))
+
+# Direct-to-Storage dashboard uploads (main/direct_upload.py): seconds an upload ticket stays valid
+# (Supabase signed upload URLs last two hours)
+DIRECT_UPLOAD_TICKET_TTL = int(os.getenv("DIRECT_UPLOAD_TICKET_TTL", 7200))
+
+# Image resize proxy /img/<preset>/<bucket>/<path> (main/image_proxy.py): disk cache location, its size
+# limit (least recently used files are removed beyond it) and the largest original it will download
+IMAGE_PROXY_CACHE_DIR = os.getenv("IMAGE_PROXY_CACHE_DIR", str(BASE_DIR / "cache" / "img"))
+IMAGE_PROXY_CACHE_MAX_BYTES = int(os.getenv("IMAGE_PROXY_CACHE_MAX_MB", 512)) * 1024 * 1024
+IMAGE_PROXY_MAX_SOURCE_BYTES = int(os.getenv("IMAGE_PROXY_MAX_SOURCE_MB", 25)) * 1024 * 1024
+
+# Background jobs (main/jobs.py, run with `python manage.py run_jobs`): SQLite file holding the queue
+# (defaults to the default database), attempts before a job fails, retry backoff (seconds, doubled per
+# attempt up to the max), lease before a job of a dead worker is retried, and days finished jobs are kept.
+# JOBS_EAGER runs jobs inside the request instead (development without a worker).
+JOBS_DB = os.getenv("JOBS_DB", "")
+JOBS_MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS", 5))
+JOBS_BACKOFF_BASE = float(os.getenv("JOBS_BACKOFF_BASE", 10))
+JOBS_BACKOFF_MAX = float(os.getenv("JOBS_BACKOFF_MAX", 3600))
+JOBS_LEASE_SECONDS = int(os.getenv("JOBS_LEASE_SECONDS", 600))
+JOBS_KEEP_DAYS = int(os.getenv("JOBS_KEEP_DAYS", 7))
+JOBS_SPOOL_DIR = os.getenv("JOBS_SPOOL_DIR", str(BASE_DIR / "cache" / "spool"))
+JOBS_EAGER = os.getenv("JOBS_EAGER", "False").lower() == "true"
@@ -0,0 +1,59 @@
+-- =====================================================
+-- RATEL MOVEMENT - ATOMIC COMMENT LIKE TOGGLE RPC
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- A like/unlike click is a single call (see main/blog_comments.py):
+--
+--   POST /rest/v1/rpc/toggle_blog_comment_like
+--   {"p_comment_id": "<uuid>", "p_fingerprint": "<visitor fingerprint>"}
+--   -> [{"liked": true, "like_count": 4, "blog_id": "<uuid>"}]
+--
+-- The like row is removed if it exists, otherwise inserted, and the
+-- comment's like_count is recomputed from blog_comment_likes in the same
+-- transaction, so concurrent clicks can neither double count nor drift.
+-- blog_id is returned so the site can retire that blog's cached comment pages.
+-- =====================================================
+
+-- One like per visitor per comment (also serves the likes check by fingerprint)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_blog_comment_likes_visitor_comment
+    ON public.blog_comment_likes (visitor_fingerprint, comment_id);
+
+-- The return type changed (blog_id added), which CREATE OR REPLACE can't do
+DROP FUNCTION IF EXISTS public.toggle_blog_comment_like(UUID, TEXT);
+
+CREATE OR REPLACE FUNCTION public.toggle_blog_comment_like(p_comment_id UUID, p_fingerprint TEXT)
+RETURNS TABLE (liked BOOLEAN, like_count INTEGER, blog_id UUID)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_liked BOOLEAN;
+    v_count INTEGER;
+    v_blog_id UUID;
+BEGIN
+    DELETE FROM public.blog_comment_likes l
+    WHERE l.comment_id = p_comment_id AND l.visitor_fingerprint = p_fingerprint;
+
+    IF FOUND THEN
+        v_liked := FALSE;
+    ELSE
+        INSERT INTO public.blog_comment_likes (comment_id, visitor_fingerprint)
+        VALUES (p_comment_id, p_fingerprint)
+        ON CONFLICT (visitor_fingerprint, comment_id) DO NOTHING;
+        v_liked := TRUE;
+    END IF;
+
+    SELECT COUNT(*) INTO v_count
+    FROM public.blog_comment_likes l
+    WHERE l.comment_id = p_comment_id;
+
+    UPDATE public.blog_comments c SET like_count = v_count WHERE c.id = p_comment_id
+    RETURNING c.blog_id INTO v_blog_id;
+
+    RETURN QUERY SELECT v_liked, v_count, v_blog_id;
+END;
+$$;
+
+-- Only the server (service role) needs to call this
+REVOKE ALL ON FUNCTION public.toggle_blog_comment_like(UUID, TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.toggle_blog_comment_like(UUID, TEXT) TO service_role;
@@ -0,0 +1,35 @@
+-- =====================================================
+-- RATEL MOVEMENT - THREADED BLOG COMMENTS
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- /api/blog/comments/ pages comments with a keyset cursor (see
+-- main/blog_comments.py):
+--
+--   top level: ?blog_id=eq.X&parent_id=is.null&order=created_at.asc,id.asc
+--   replies:   ?blog_id=eq.X&parent_id=eq.P&order=created_at.asc,id.asc
+--
+-- and asks for the reply counts of a page's comments in one call:
+--
+--   POST /rest/v1/rpc/blog_comment_reply_counts
+--   {"p_parent_ids": ["<id>", ...]}
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_blog_comments_thread
+    ON public.blog_comments (blog_id, parent_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_blog_comments_parent
+    ON public.blog_comments (parent_id)
+    WHERE parent_id IS NOT NULL;
+
+CREATE OR REPLACE FUNCTION public.blog_comment_reply_counts(p_parent_ids UUID[])
+RETURNS TABLE (parent_id UUID, reply_count BIGINT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT c.parent_id, COUNT(*)
+    FROM public.blog_comments c
+    WHERE c.parent_id = ANY(p_parent_ids)
+    GROUP BY c.parent_id;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.blog_comment_reply_counts(UUID[]) TO anon, authenticated, service_role;
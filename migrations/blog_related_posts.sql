@@ -0,0 +1,36 @@
+-- =====================================================
+-- RATEL MOVEMENT - PRECOMPUTED RELATED POSTS
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- One row per published blog post holding its top related posts
+-- (see main/related_posts.py). `related` is a JSON array of small cards:
+--
+--   [{"id", "title", "slug", "category", "featured_image_url",
+--     "reading_time", "published_at", "score"}, ...]  best first
+--
+-- Filled by `python manage.py compute_related_posts` and refreshed for the
+-- affected posts whenever a post is saved or deleted. blog_detail reads a
+-- single row by primary key.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS public.blog_related_posts (
+    blog_id TEXT PRIMARY KEY,
+    related JSONB NOT NULL DEFAULT '[]'::jsonb,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Finds the lists that mention a post (related=cs.[{"id":"..."}]) when it changes
+CREATE INDEX IF NOT EXISTS idx_blog_related_posts_related
+    ON public.blog_related_posts USING GIN (related jsonb_path_ops);
+
+-- Enable Row Level Security
+ALTER TABLE public.blog_related_posts ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow public read blog_related_posts" ON public.blog_related_posts;
+DROP POLICY IF EXISTS "Allow service role full access blog_related_posts" ON public.blog_related_posts;
+
+CREATE POLICY "Allow public read blog_related_posts" ON public.blog_related_posts
+    FOR SELECT USING (true);
+
+CREATE POLICY "Allow service role full access blog_related_posts" ON public.blog_related_posts
+    FOR ALL USING (auth.role() = 'service_role');
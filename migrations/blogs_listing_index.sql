@@ -0,0 +1,21 @@
+-- =====================================================
+-- RATEL MOVEMENT - BLOG LISTING KEYSET INDEX
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- The public blog page is paginated with a keyset cursor on
+-- (published_at, id) (see main/blog_listing.py):
+--
+--   ?is_published=eq.true&order=published_at.desc.nullslast,id.desc
+--   &or=(published_at.lt.X,and(published_at.eq.X,id.lt.Y),published_at.is.null)
+--
+-- This index serves that order and range directly, so every page costs the
+-- same no matter how far back in the archive it is.
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_blogs_published_keyset
+    ON public.blogs (published_at DESC NULLS LAST, id DESC)
+    WHERE is_published = true;
+
+CREATE INDEX IF NOT EXISTS idx_blogs_category_published_keyset
+    ON public.blogs (category, published_at DESC NULLS LAST, id DESC)
+    WHERE is_published = true;
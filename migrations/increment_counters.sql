@@ -0,0 +1,74 @@
+-- =====================================================
+-- RATEL MOVEMENT - BATCHED COUNTER INCREMENTS RPC
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- The site buffers page views, blog views and message share counts in
+-- memory and flushes them every few seconds (main/counters.py) as one call:
+--
+--   POST /rest/v1/rpc/increment_counters
+--   {"p_deltas": [{"table": "blogs", "row_key": "<id>", "field": "view_count", "delta": 3}, ...]}
+--
+-- Each delta is applied with a single UPDATE ... SET x = x + delta, so
+-- concurrent flushes never lose updates. Only the tables/columns listed
+-- below are accepted.
+-- =====================================================
+
+-- site_statistics is keyed by "key"; make it unique so page views can upsert
+CREATE UNIQUE INDEX IF NOT EXISTS idx_site_statistics_key ON public.site_statistics(key);
+
+CREATE OR REPLACE FUNCTION public.increment_counters(p_deltas JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    d JSONB;
+    v_table TEXT;
+    v_key TEXT;
+    v_field TEXT;
+    v_delta BIGINT;
+BEGIN
+    FOR d IN SELECT * FROM jsonb_array_elements(p_deltas)
+    LOOP
+        v_table := d->>'table';
+        v_key := d->>'row_key';
+        v_field := d->>'field';
+        v_delta := COALESCE((d->>'delta')::BIGINT, 0);
+
+        IF v_delta = 0 THEN
+            CONTINUE;
+        END IF;
+
+        -- blogs and shareable_messages are keyed by UUID; skip keys that can't be one
+        IF v_table IN ('blogs', 'shareable_messages')
+           AND v_key !~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' THEN
+            RAISE WARNING 'increment_counters: ignoring %.% for bad key %', v_table, v_field, v_key;
+            CONTINUE;
+        END IF;
+
+        IF v_table = 'site_statistics' AND v_field = 'value' THEN
+            INSERT INTO public.site_statistics (key, value)
+            VALUES (v_key, v_delta)
+            ON CONFLICT (key) DO UPDATE SET value = COALESCE(public.site_statistics.value, 0) + EXCLUDED.value;
+
+        ELSIF v_table = 'blogs' AND v_field = 'view_count' THEN
+            UPDATE public.blogs
+            SET view_count = COALESCE(view_count, 0) + v_delta
+            WHERE id = v_key::UUID;   -- cast the parameter, not the column, so the primary key index is used
+
+        ELSIF v_table = 'shareable_messages' AND v_field IN ('share_count', 'download_count', 'copy_count') THEN
+            EXECUTE format(
+                'UPDATE public.shareable_messages SET %1$I = COALESCE(%1$I, 0) + $1 WHERE id = $2::UUID',
+                v_field
+            ) USING v_delta, v_key;
+
+        ELSE
+            RAISE WARNING 'increment_counters: ignoring %.%', v_table, v_field;
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Only the server (service role) needs to call this
+REVOKE ALL ON FUNCTION public.increment_counters(JSONB) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.increment_counters(JSONB) TO service_role;
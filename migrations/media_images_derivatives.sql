@@ -0,0 +1,27 @@
+-- =====================================================
+-- RATEL MOVEMENT - MEDIA IMAGE DERIVATIVES
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- Each media_images row gets derived images generated by
+-- main/image_derivatives.py (after upload, or with
+-- `python manage.py generate_image_derivatives` for existing rows):
+--
+--   thumbnail_url   480px JPEG thumbnail (was the original's URL)
+--   variants        [{"width": 320, "height": 213, "url": ".../320.webp"}, ...]
+--                   WebP size ladder used for srcset
+--   lqip            tiny blurred WebP placeholder as a data: URI
+--   width, height   original dimensions (after EXIF orientation)
+--   derivatives_at  when the derivatives were last generated
+--
+-- The files live in the media-vault bucket under derived/images/<id>/.
+-- =====================================================
+
+ALTER TABLE public.media_images ADD COLUMN IF NOT EXISTS variants JSONB;
+ALTER TABLE public.media_images ADD COLUMN IF NOT EXISTS lqip TEXT;
+ALTER TABLE public.media_images ADD COLUMN IF NOT EXISTS width INTEGER;
+ALTER TABLE public.media_images ADD COLUMN IF NOT EXISTS height INTEGER;
+ALTER TABLE public.media_images ADD COLUMN IF NOT EXISTS derivatives_at TIMESTAMPTZ;
+
+-- Rows still waiting for derivatives (the backfill command's query)
+CREATE INDEX IF NOT EXISTS idx_media_images_pending_derivatives
+    ON public.media_images (created_at) WHERE derivatives_at IS NULL;
@@ -0,0 +1,62 @@
+-- =====================================================
+-- RATEL MOVEMENT - MEDIA VAULT LISTING
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- The public media pages and /api/media/<kind>/ read keyset pages
+-- (see main/media_listing.py):
+--
+--   ?<visibility filters>&category=eq.X&order=created_at.desc,id.desc
+--   &or=(created_at.lt.T,and(created_at.eq.T,id.lt.I))
+--
+-- The indexes below serve that order per table. Month headings on the
+-- videos page come from media_month_buckets, which groups by month in
+-- Postgres (UTC) instead of in the web process:
+--
+--   POST /rest/v1/rpc/media_month_buckets
+--   {"p_table": "media_videos", "p_category": null}
+--   -> [{"month_key": "2024-03", "month_label": "March 2024", "item_count": 12}, ...]
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_media_videos_listing
+    ON public.media_videos (created_at DESC, id DESC) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS idx_media_audio_listing
+    ON public.media_audio (created_at DESC, id DESC) WHERE is_archived = false;
+CREATE INDEX IF NOT EXISTS idx_media_images_listing
+    ON public.media_images (created_at DESC, id DESC) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS idx_media_documents_listing
+    ON public.media_documents (created_at DESC, id DESC) WHERE is_archived = false AND is_confidential = false;
+
+CREATE OR REPLACE FUNCTION public.media_month_buckets(p_table TEXT, p_category TEXT DEFAULT NULL)
+RETURNS TABLE (month_key TEXT, month_label TEXT, item_count BIGINT)
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_visible TEXT;
+BEGIN
+    -- Same visibility rules as the public pages; only these tables are accepted
+    v_visible := CASE p_table
+        WHEN 'media_videos' THEN 'status = ''active'''
+        WHEN 'media_audio' THEN 'is_archived = false'
+        WHEN 'media_images' THEN 'status = ''active'''
+        WHEN 'media_documents' THEN 'is_archived = false AND is_confidential = false'
+    END;
+    IF v_visible IS NULL THEN
+        RAISE EXCEPTION 'media_month_buckets: unknown table %', p_table;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT to_char(m, ''YYYY-MM''), to_char(m, ''FMMonth YYYY''), n
+         FROM (
+             SELECT date_trunc(''month'', created_at AT TIME ZONE ''UTC'') AS m, COUNT(*) AS n
+             FROM public.%I
+             WHERE %s AND ($1 IS NULL OR category = $1)
+             GROUP BY 1
+         ) b
+         ORDER BY m DESC',
+        p_table, v_visible
+    ) USING p_category;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.media_month_buckets(TEXT, TEXT) TO anon, authenticated, service_role;
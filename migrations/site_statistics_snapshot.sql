@@ -0,0 +1,32 @@
+-- =====================================================
+-- RATEL MOVEMENT - SITE STATISTICS SNAPSHOT RPC
+-- Run this SQL in your Supabase SQL Editor
+-- =====================================================
+-- Returns every landing page counter in one call so the site does not
+-- download all blog view counts or run several count queries per refresh.
+-- Called by main/site_stats.py (POST /rest/v1/rpc/site_statistics_snapshot).
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION public.site_statistics_snapshot()
+RETURNS JSON
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+AS $$
+    SELECT json_build_object(
+        'members', (SELECT COUNT(*) FROM public.members WHERE status = 'active'),
+        'cases_resolved', (SELECT COUNT(*) FROM public.cases WHERE status IN ('solved', 'completed')),
+        'blog_views', (SELECT COALESCE(SUM(view_count), 0) FROM public.blogs WHERE is_published = true),
+        'blog_posts', (SELECT COUNT(*) FROM public.blogs WHERE is_published = true),
+        'page_views', (SELECT COALESCE(MAX(value), 0) FROM public.site_statistics WHERE key = 'total_page_views')
+    );
+$$;
+
+-- Only the server (service role) needs to call this
+REVOKE ALL ON FUNCTION public.site_statistics_snapshot() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.site_statistics_snapshot() TO service_role;
+
+-- Indexes used by the counts above
+CREATE INDEX IF NOT EXISTS idx_members_status ON public.members(status);
+CREATE INDEX IF NOT EXISTS idx_cases_status ON public.cases(status);
+CREATE INDEX IF NOT EXISTS idx_blogs_is_published ON public.blogs(is_published);